@@ -0,0 +1,66 @@
+"""
+Measures dispatch recommendation latency: N assets spread over the map in
+a LiveFleetState, a share of them moving between queries, then Q nearest
+queries (k, default available statuses) at random incident locations,
+ranked by straight-line distance and then by road ETA over the default
+service-road graph (fresh shortest-path tree per query, i.e. uncached).
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.fleet.live_state import LiveFleetState
+from src.fleet.routing import RoadGraph, load_network
+from src.fleet.service import FleetService
+from src.infrastructure.settings import settings
+
+STATUSES = ("idle", "in_service", "maintenance", "offline")
+TYPES = ("bus", "patrol", "truck", "robot")
+
+
+def run(assets, queries, k, seed):
+    rng = random.Random(seed)
+    state = LiveFleetState()
+    ids = [f"VEH-{i:05d}" for i in range(assets)]
+    for i, asset_id in enumerate(ids):
+        state.apply(asset_id, status=STATUSES[i % len(STATUSES)], asset_type=TYPES[i % len(TYPES)],
+                    x=rng.uniform(0, 800), y=rng.uniform(0, 600))
+
+    started = time.perf_counter()
+    for asset_id in ids:
+        state.apply(asset_id, x=rng.uniform(0, 800), y=rng.uniform(0, 600))
+    moved = time.perf_counter() - started
+
+    points = [(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(queries)]
+    started = time.perf_counter()
+    for x, y in points:
+        state.nearest(x, y, k, statuses=settings.DISPATCH_AVAILABLE_STATUSES)
+    elapsed = time.perf_counter() - started
+
+    network = load_network()
+    service = FleetService(live_state=state, roads=RoadGraph(network["nodes"], network["edges"]))
+    started = time.perf_counter()
+    for x, y in points:
+        service.roads._trees.clear()
+        service.nearest_available(x, y, k, rank="eta")
+    eta_elapsed = time.perf_counter() - started
+
+    print(f"{assets} assets: {moved / assets * 1e6:.2f} us per position update")
+    print(f"{queries} queries (k={k}): {elapsed / queries * 1e6:.0f} us/query by distance, "
+          f"{eta_elapsed / queries * 1e3:.2f} ms/query by ETA ({settings.DISPATCH_ETA_CANDIDATES} candidates)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nearest-asset dispatch query benchmark.")
+    parser.add_argument("--assets", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.assets, args.queries, args.k, args.seed)
@@ -0,0 +1,46 @@
+"""
+Measures geofence evaluation cost: N assets random-walking over the map,
+one position update per asset per tick (1 Hz per asset in production).
+Reports per-update latency and the updates/s one core sustains.
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.fleet.geofence import GeofenceEngine, load_zones
+
+
+def run(assets, ticks, seed):
+    rng = random.Random(seed)
+    engine = GeofenceEngine(load_zones())
+    positions = [(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(assets)]
+    ids = [f"VEH-{i:05d}" for i in range(assets)]
+    transitions = 0
+
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for i, (x, y) in enumerate(positions):
+            x = min(800.0, max(0.0, x + rng.uniform(-5, 5)))
+            y = min(600.0, max(0.0, y + rng.uniform(-5, 5)))
+            positions[i] = (x, y)
+            transitions += len(engine.evaluate(ids[i], x, y))
+    elapsed = time.perf_counter() - started
+
+    updates = assets * ticks
+    print(f"{updates} updates, {transitions} transitions")
+    print(f"{elapsed / updates * 1e6:.2f} us/update (incl. random walk), {updates / elapsed:,.0f} updates/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Geofence evaluation benchmark.")
+    parser.add_argument("--assets", type=int, default=5000)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.assets, args.ticks, args.seed)
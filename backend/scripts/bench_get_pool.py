@@ -0,0 +1,96 @@
+"""
+Measures the per-call cost of Database.get_pool() and of a repository hot
+path that depends on it. Uses an in-process stub pool so no Postgres is needed;
+the numbers isolate the acquisition overhead, not query latency.
+"""
+
+import sys
+import os
+import asyncio
+import time
+from unittest.mock import patch
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.infrastructure.database import db
+from src.soc.repository import SocRepository
+
+CALLS = 200_000
+
+
+class StubPool:
+    """Minimal stand-in exposing the pool surface used by the hot paths."""
+
+    def is_closed(self):
+        return False
+
+    async def fetchrow(self, sql, *args):
+        return {"id": args[0], "state": "New"}
+
+
+class LegacyDatabase:
+    """Replica of the previous get_pool(): loop lookup + id compare + is_closed probe per call."""
+    _pool = None
+    _loop_id = None
+
+    @classmethod
+    async def get_pool(cls):
+        try:
+            current_loop = asyncio.get_running_loop()
+            current_loop_id = id(current_loop)
+        except RuntimeError:
+            current_loop_id = None
+
+        if cls._pool:
+            is_closed = False
+            try:
+                is_closed = cls._pool.is_closed()
+            except Exception:
+                is_closed = getattr(cls._pool, "_closed", False)
+
+            if is_closed or (cls._loop_id and current_loop_id != cls._loop_id):
+                cls._pool = None
+
+        return cls._pool
+
+
+async def _time(label, fn, calls=CALLS):
+    # Warm-up
+    for _ in range(1000):
+        await fn()
+    started = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    elapsed = time.perf_counter() - started
+    per_call_ns = elapsed / calls * 1e9
+    print(f"{label:<45} {per_call_ns:>8.0f} ns/call")
+    return per_call_ns
+
+
+async def main():
+    pool = StubPool()
+    loop = asyncio.get_running_loop()
+
+    LegacyDatabase._pool = pool
+    LegacyDatabase._loop_id = id(loop)
+    db.bind_pool(pool)
+
+    print(f"{CALLS} calls each\n")
+    legacy = await _time("legacy get_pool()", LegacyDatabase.get_pool)
+    bound = await _time("loop-bound get_pool()", db.get_pool)
+    print(f"{'-> overhead removed per call':<45} {legacy - bound:>8.0f} ns ({(1 - bound / legacy) * 100:.0f}%)\n")
+
+    repo = SocRepository()
+    incident_id = "3f8a2a9e-8d4b-4c55-9d0e-8c4a1f0b7a11"
+
+    with patch.object(db, "get_pool", LegacyDatabase.get_pool):
+        legacy_repo = await _time("SocRepository.get_incident (legacy)", lambda: repo.get_incident(incident_id))
+    bound_repo = await _time("SocRepository.get_incident (loop-bound)", lambda: repo.get_incident(incident_id))
+    print(f"{'-> saved per repository call':<45} {legacy_repo - bound_repo:>8.0f} ns")
+
+    db.reset()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
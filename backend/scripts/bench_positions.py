@@ -0,0 +1,59 @@
+"""
+Measures position history reads: N assets reporting at H Hz for one hour
+are written to a temporary PositionStore and flushed to disk, then a
+one-hour range query over every asset is timed cold (chunks decoded from
+disk) and warm (decoded chunks cached).
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.fleet.positions import CHUNK_S, PositionStore
+
+
+def run(assets, hz, seed):
+    rng = random.Random(seed)
+    ids = [f"VEH-{i:05d}" for i in range(assets)]
+    start = 1_790_000_000 - (1_790_000_000 % CHUNK_S)
+    samples = int(CHUNK_S * hz)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = PositionStore(root)
+        started = time.perf_counter()
+        for asset_id in ids:
+            x, y = rng.uniform(0, 800), rng.uniform(0, 600)
+            for i in range(samples):
+                x = min(800.0, max(0.0, x + rng.uniform(-2, 2)))
+                y = min(600.0, max(0.0, y + rng.uniform(-2, 2)))
+                store.append(asset_id, start + i / hz, x, y, rng.uniform(0, 40))
+        # The hour has ended: the flush writes it and drops it from memory,
+        # so every chunk is read from disk below
+        asyncio.run(store.flush())
+        written = time.perf_counter() - started
+        size = sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+        print(f"{assets} assets @ {hz} Hz for 1 h: {assets * samples:,} samples in {written:.1f} s, "
+              f"{size / 1e6:.1f} MB on disk")
+
+        for label in ("cold", "warm"):
+            t0 = time.perf_counter()
+            tracks = store.range_many(ids, start, start + CHUNK_S)
+            elapsed = time.perf_counter() - t0
+            rows = sum(len(cols["ts"]) for cols in tracks.values())
+            print(f"{label}: 1 h x {assets} assets -> {rows:,} samples in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Position store range query benchmark.")
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--hz", type=float, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.assets, args.hz, args.seed)
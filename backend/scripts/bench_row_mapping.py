@@ -0,0 +1,137 @@
+"""
+Measures the per-row cost of turning incident rows into IncidentResponse
+models, before and after the uuid text codec (see init_connection).
+
+Offline (default): rows are in-process stand-ins, isolating the Python-side
+mapping cost. With --dsn, the same rows are fetched from Postgres twice, once
+with asyncpg's default uuid codec and once with the pool's text codec, so
+decode cost is included.
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.soc.schemas import IncidentResponse
+
+ROWS = 10_000
+
+ROWS_SQL = """
+SELECT gen_random_uuid() AS id, 'FIRE_ALARM' AS type, 'critical' AS severity, 'New' AS state,
+       gen_random_uuid() AS correlation_id, now() AS created_at, NULL::timestamptz AS closed_at
+FROM generate_series(1, $1)
+"""
+
+
+def legacy_map(rows):
+    """Previous path: dict per row, isinstance walk, then str() again at the response."""
+    out = []
+    for row in rows:
+        record = dict(row)
+        for key, val in record.items():
+            if isinstance(val, uuid.UUID):
+                record[key] = str(val)
+        out.append(IncidentResponse(
+            id=str(record['id']),
+            type=record['type'],
+            severity=record['severity'],
+            state=record['state'],
+            created_at_utc=record['created_at'],
+            correlation_id=str(record['correlation_id'])
+        ))
+    return out
+
+
+def direct_map(rows):
+    """Current path: rows already carry str ids and map straight to the response model."""
+    return [
+        IncidentResponse(
+            id=row['id'],
+            type=row['type'],
+            severity=row['severity'],
+            state=row['state'],
+            created_at_utc=row['created_at'],
+            correlation_id=row['correlation_id']
+        )
+        for row in rows
+    ]
+
+
+def _stand_in_rows(count, as_text):
+    now = datetime.now(timezone.utc)
+    rows = []
+    for _ in range(count):
+        row_id, corr_id = uuid.uuid4(), uuid.uuid4()
+        rows.append({
+            "id": str(row_id) if as_text else row_id,
+            "type": "FIRE_ALARM",
+            "severity": "critical",
+            "state": "New",
+            "correlation_id": str(corr_id) if as_text else corr_id,
+            "created_at": now,
+            "closed_at": None,
+        })
+    return rows
+
+
+def _report(label, elapsed, count):
+    print(f"{label:<40} {elapsed * 1e3:>8.1f} ms  {elapsed / count * 1e9:>7.0f} ns/row")
+
+
+def _time(fn, rows, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def offline(count):
+    legacy = _time(legacy_map, _stand_in_rows(count, as_text=False))
+    direct = _time(direct_map, _stand_in_rows(count, as_text=True))
+    _report("legacy mapping (UUID objects)", legacy, count)
+    _report("direct mapping (text uuid codec)", direct, count)
+    print(f"{'-> saved per row':<40} {(legacy - direct) / count * 1e9:>19.0f} ns ({(1 - direct / legacy) * 100:.0f}%)")
+
+
+async def live(dsn, count):
+    import asyncpg
+
+    async def fetch_and_map(conn, mapper):
+        started = time.perf_counter()
+        mapper(await conn.fetch(ROWS_SQL, count))
+        return time.perf_counter() - started
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        legacy = min([await fetch_and_map(conn, legacy_map) for _ in range(5)])
+        await conn.set_type_codec("uuid", encoder=str, decoder=str, schema="pg_catalog", format="text")
+        direct = min([await fetch_and_map(conn, direct_map) for _ in range(5)])
+    finally:
+        await conn.close()
+
+    _report("fetch + legacy mapping", legacy, count)
+    _report("fetch + direct mapping (text codec)", direct, count)
+    print(f"{'-> saved per row':<40} {(legacy - direct) / count * 1e9:>19.0f} ns ({(1 - direct / legacy) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Row-to-response mapping benchmark.")
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument("--dsn", default=None, help="Postgres DSN to include fetch/decode cost")
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows, best of 5\n")
+    if args.dsn:
+        asyncio.run(live(args.dsn, args.rows))
+    else:
+        offline(args.rows)
@@ -0,0 +1,35 @@
+import sys
+import os
+import asyncio
+import argparse
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.infrastructure.database import db
+from src.infrastructure.migrator import MigrationRunner
+
+
+async def main(args):
+    pool = await db.get_pool()
+    runner = MigrationRunner(pool)
+    try:
+        if args.command == "status":
+            pending = await runner.pending()
+            if not pending:
+                print("Schema up to date.")
+            for migration in pending:
+                mode = "tx" if migration.transactional else "no-tx"
+                print(f"pending  {migration.version:04d}_{migration.name} ({mode})")
+        else:
+            applied = await runner.run(target=args.target)
+            print(f"Applied: {applied or 'nothing'}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Versioned schema migrations.")
+    parser.add_argument("command", choices=["status", "up"])
+    parser.add_argument("--target", type=int, default=None, help="Highest version to apply")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,37 @@
+import sys
+import os
+import asyncio
+import argparse
+
+# Add backend to path to allow imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.shared.rebuild import ReadModelRebuilder
+from src.shared.event_bus import event_bus
+from src.infrastructure.database import db
+
+
+def print_progress(stats):
+    print(
+        f"  {stats['events']:>10} events | {stats['events_per_s']:>9.0f} ev/s | "
+        f"{stats['elapsed_s']:>7.1f}s | last_id={stats['last_id']}"
+    )
+
+
+async def main(args):
+    rebuilder = ReadModelRebuilder(stream=args.stream, page_size=args.page_size)
+    try:
+        print(f"Rebuilding 'incidents' from {args.stream} (page size {args.page_size})...")
+        stats = await rebuilder.run(prune=args.prune, dry_run=args.dry_run, on_progress=print_progress)
+        print(f"Done: {stats}")
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the incidents read model from the event history.")
+    parser.add_argument("--stream", default=event_bus.GLOBAL_STREAM)
+    parser.add_argument("--page-size", type=int, default=10000)
+    parser.add_argument("--prune", action="store_true", help="Delete incidents not present in the history")
+    parser.add_argument("--dry-run", action="store_true", help="Replay and report without writing")
+    asyncio.run(main(parser.parse_args()))
@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from src.infrastructure.database import db
 from src.infrastructure.demo import is_demo_mode
+from src.analytics.repository import AnalyticsRepository, bucket_starts
 
 router = APIRouter(tags=["Analytics"])
 
+# Longest window served per granularity (days)
+MAX_TIMESERIES_DAYS = {"hour": 31, "day": 366}
+
+def get_analytics_repository():
+    return AnalyticsRepository()
+
 @router.get("/analytics/summary")
-async def get_analytics_summary():
+async def get_analytics_summary(repo: AnalyticsRepository = Depends(get_analytics_repository)):
     # 1. Demo Mode Gate (Canonical)
     if is_demo_mode():
         return {
@@ -17,8 +28,8 @@ async def get_analytics_summary():
             "incidents_trend": [4, 6, 8, 2, 5, 9, 3, 4, 2, 5, 7, 12, 8, 4, 3, 2, 6, 8, 4, 5, 3, 2, 1, 4]
         }
 
-    # 2. Real Production Logic
-    pool = await db.get_pool()
+    # 2. Real Production Logic (replica when configured)
+    pool = await db.get_read_pool()
     
     # Incidents by Severity
     severity_rows = await pool.fetch("SELECT severity, count(*) as count FROM incidents GROUP BY severity")
@@ -27,13 +38,77 @@ async def get_analytics_summary():
     # SLA Breaches
     sla_breaches = await pool.fetchval("SELECT count(*) FROM tickets WHERE status != 'Closed' AND NOW() > sla_deadline")
     
-    # Fleet Uptime (Placeholder for real metric)
-    uptime = 98.5 
+    # Fleet uptime over the last 24h (compacted status intervals + recent raw history)
+    now = datetime.now(timezone.utc)
+    uptime = (await repo.get_fleet_uptime(now))["uptime_pct"]
+
+    # Incidents created per hour, last 24h (hourly rollups)
+    incidents_trend = await repo.get_incidents_trend(now)
     
     return {
         "incidents_by_severity": incidents_by_severity,
         "sla_breaches": sla_breaches,
         "fleet_uptime": uptime,
         "mtta": "12m", 
-        "mttr": "45m"
+        "mttr": "45m",
+        "incidents_trend": incidents_trend
     }
+
+def _demo_point(start: datetime, metric: str, granularity: str) -> dict:
+    # Seeded by bucket so repeated requests draw the same chart
+    rng = random.Random(f"{metric}:{granularity}:{start.isoformat()}")
+    scale = 1 if granularity == "hour" else 24
+    if metric == "incidents":
+        created = rng.randint(1, 12) * scale
+        resolved = rng.randint(0, created)
+        return {"created": created, "escalated": rng.randint(0, 2) * scale, "resolved": resolved, "closed": rng.randint(0, resolved)}
+    if metric == "ticket_sla":
+        closed = rng.randint(0, 6) * scale
+        breached = rng.randint(0, closed // 4)
+        return {"closed": closed, "met_sla": closed - breached, "breached_sla": breached}
+    bucket_s = 3600.0 * scale * 40  # 40 assets
+    down = rng.uniform(0.0, 0.03) * bucket_s
+    idle = rng.uniform(0.1, 0.3) * bucket_s
+    return {"seconds": {"active": bucket_s - down - idle, "idle": idle, "offline": down}}
+
+@router.get("/analytics/timeseries")
+async def get_analytics_timeseries(
+    metric: str = Query("incidents", pattern="^(incidents|ticket_sla|asset_status)$"),
+    granularity: str = Query("day", pattern="^(hour|day)$"),
+    days: int = Query(30, ge=1),
+    type: Optional[str] = None,
+    severity: Optional[str] = None,
+    repo: AnalyticsRepository = Depends(get_analytics_repository)
+):
+    """
+    Time series from the hourly/daily rollup tables, oldest bucket first.
+    Covers the last `days` days up to and including the current bucket.
+    """
+    if days > MAX_TIMESERIES_DAYS[granularity]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{granularity} series are limited to {MAX_TIMESERIES_DAYS[granularity]} days"
+        )
+
+    now = datetime.now(timezone.utc)
+    step = timedelta(hours=1) if granularity == "hour" else timedelta(days=1)
+    current = bucket_starts(now, now + step, granularity)[0]
+    until = current + step
+    since = until - timedelta(days=days)
+
+    # 1. Demo Mode: synthetic series, no DB
+    if is_demo_mode():
+        return {
+            "metric": metric,
+            "granularity": granularity,
+            "as_of": now,
+            "points": [
+                {"bucket_start": start, **_demo_point(start, metric, granularity)}
+                for start in bucket_starts(since, until, granularity)
+            ]
+        }
+
+    # 2. Real Production Logic
+    return await repo.get_timeseries(
+        metric, granularity, since, until, incident_type=type, severity=severity
+    )
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from src.infrastructure.database import db
+from src.infrastructure.statements import statements
+from src.fleet.repository import AssetRepository
+from src.fleet.status_history import status_summary
+from src.analytics.rollups import GRANULARITIES, INCIDENT_MEASURES, TICKET_SLA_MEASURES, floor_day, floor_hour
+
+INCIDENT_SERIES = statements.register(
+    "analytics.incident_series",
+    """
+    SELECT bucket_start, SUM(created) AS created, SUM(escalated) AS escalated,
+           SUM(resolved) AS resolved, SUM(closed) AS closed
+    FROM incident_rollups
+    WHERE granularity = $1 AND bucket_start >= $2 AND bucket_start < $3
+      AND ($4::text IS NULL OR type = $4)
+      AND ($5::text IS NULL OR severity = $5)
+    GROUP BY bucket_start
+    ORDER BY bucket_start
+    """,
+)
+TICKET_SLA_SERIES = statements.register(
+    "analytics.ticket_sla_series",
+    """
+    SELECT bucket_start, closed, met_sla, breached_sla
+    FROM ticket_sla_rollups
+    WHERE granularity = $1 AND bucket_start >= $2 AND bucket_start < $3
+    ORDER BY bucket_start
+    """,
+)
+ASSET_STATUS_SERIES = statements.register(
+    "analytics.asset_status_series",
+    """
+    SELECT bucket_start, status, seconds
+    FROM asset_status_rollups
+    WHERE granularity = $1 AND bucket_start >= $2 AND bucket_start < $3
+    ORDER BY bucket_start
+    """,
+)
+GET_WATERMARK = statements.register(
+    "analytics.get_watermark", "SELECT watermark FROM rollup_watermarks WHERE name = $1"
+)
+
+METRICS = ("incidents", "ticket_sla", "asset_status")
+
+
+def bucket_starts(since: datetime, until: datetime, granularity: str) -> List[datetime]:
+    """UTC bucket starts covering [since, until)."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+    step = timedelta(hours=1) if granularity == "hour" else timedelta(days=1)
+    current = floor_hour(since) if granularity == "hour" else floor_day(since)
+    starts = []
+    while current < until:
+        starts.append(current)
+        current += step
+    return starts
+
+
+class AnalyticsRepository:
+    """Reads the pre-aggregated rollups (src/analytics/rollups.py); never scans source tables."""
+
+    async def get_timeseries(
+        self,
+        metric: str,
+        granularity: str,
+        since: datetime,
+        until: datetime,
+        incident_type: Optional[str] = None,
+        severity: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Dense series over [since, until): buckets without rollup rows are zeros.
+        `as_of` is the metric's watermark; later source rows are not counted yet.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unsupported metric: {metric}")
+        starts = bucket_starts(since, until, granularity)
+        lower = starts[0] if starts else since
+        pool = await db.get_read_pool()
+
+        if metric == "incidents":
+            rows = await statements.fetch(pool, INCIDENT_SERIES, granularity, lower, until, incident_type, severity)
+            values = {row["bucket_start"]: {m: row[m] for m in INCIDENT_MEASURES} for row in rows}
+            empty = lambda: {m: 0 for m in INCIDENT_MEASURES}
+        elif metric == "ticket_sla":
+            rows = await statements.fetch(pool, TICKET_SLA_SERIES, granularity, lower, until)
+            values = {row["bucket_start"]: {m: row[m] for m in TICKET_SLA_MEASURES} for row in rows}
+            empty = lambda: {m: 0 for m in TICKET_SLA_MEASURES}
+        else:
+            # Seconds spent in each status, summed over the fleet
+            rows = await statements.fetch(pool, ASSET_STATUS_SERIES, granularity, lower, until)
+            values = {}
+            for row in rows:
+                values.setdefault(row["bucket_start"], {"seconds": {}})["seconds"][row["status"]] = row["seconds"]
+            empty = lambda: {"seconds": {}}
+
+        as_of = await statements.fetchval(pool, GET_WATERMARK, metric)
+        return {
+            "metric": metric,
+            "granularity": granularity,
+            "as_of": as_of,
+            "points": [{"bucket_start": start, **(values.get(start) or empty())} for start in starts],
+        }
+
+    async def get_incidents_trend(self, now: datetime, hours: int = 24) -> List[int]:
+        """Incidents created per hour over the last `hours` hours, oldest first."""
+        until = floor_hour(now) + timedelta(hours=1)
+        series = await self.get_timeseries("incidents", "hour", until - timedelta(hours=hours), until)
+        return [point["created"] for point in series["points"]]
+
+    async def get_fleet_uptime(self, now: datetime, hours: int = 24) -> Dict[str, Any]:
+        """Fleet-wide uptime/utilisation over the last `hours` hours (see status_summary)."""
+        rows = await AssetRepository().get_status_seconds(now - timedelta(hours=hours), now)
+        return status_summary(rows)["fleet"]
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from src.infrastructure.settings import settings
+from src.infrastructure.database import db
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("hour", "day")
+
+
+def _utc_trunc(unit: str, expr: str) -> str:
+    # Bucket in UTC regardless of the session TimeZone
+    return f"date_trunc('{unit}', {expr} AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+
+def floor_hour(ts: datetime) -> datetime:
+    return ts.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(ts: datetime) -> datetime:
+    return floor_hour(ts).replace(hour=0)
+
+
+def _daily_from_hourly(table: str, keys: Sequence[str], measures: Sequence[str]) -> str:
+    """
+    Re-derives the daily rows of every day touched by a refresh window ($1, $2]
+    from its hourly rows. Replaces (not adds), so it is safe to re-run.
+    """
+    key_cols = ", ".join(keys)
+    group_by = ", ".join(str(i) for i in range(2, len(keys) + 3))
+    sums = ", ".join(f"SUM({m})" for m in measures)
+    updates = ", ".join(f"{m} = EXCLUDED.{m}" for m in measures)
+    select_keys = f", {key_cols}" if keys else ""
+    return f"""
+    INSERT INTO {table} (granularity, bucket_start{select_keys}, {', '.join(measures)})
+    SELECT 'day', {_utc_trunc('day', 'bucket_start')}{select_keys}, {sums}
+    FROM {table}
+    WHERE granularity = 'hour'
+      AND bucket_start >= {_utc_trunc('day', '$1::timestamptz')}
+      AND bucket_start < $2
+    GROUP BY {group_by}
+    ON CONFLICT (granularity, bucket_start{select_keys}) DO UPDATE SET {updates}
+    """
+
+
+INCIDENT_MEASURES = ("created", "escalated", "resolved", "closed")
+TICKET_SLA_MEASURES = ("closed", "met_sla", "breached_sla")
+
+INCIDENTS_HOURLY_SQL = f"""
+WITH events AS (
+    SELECT created_at AS at, type, severity, 1 AS created, 0 AS escalated, 0 AS resolved, 0 AS closed
+    FROM incidents
+    WHERE created_at > $1 AND created_at <= $2
+    UNION ALL
+    SELECT t.occurred_at, i.type, i.severity, 0,
+           (t.to_state = 'Escalated')::int, (t.to_state = 'Resolved')::int, (t.to_state = 'Closed')::int
+    FROM incident_transitions t
+    JOIN incidents i ON i.id = t.incident_id
+    WHERE t.occurred_at > $1 AND t.occurred_at <= $2
+      AND t.to_state IN ('Escalated', 'Resolved', 'Closed')
+)
+INSERT INTO incident_rollups (granularity, bucket_start, type, severity, created, escalated, resolved, closed)
+SELECT 'hour', {_utc_trunc('hour', 'at')}, type, severity,
+       SUM(created), SUM(escalated), SUM(resolved), SUM(closed)
+FROM events
+GROUP BY 2, 3, 4
+ON CONFLICT (granularity, bucket_start, type, severity) DO UPDATE SET
+    created = incident_rollups.created + EXCLUDED.created,
+    escalated = incident_rollups.escalated + EXCLUDED.escalated,
+    resolved = incident_rollups.resolved + EXCLUDED.resolved,
+    closed = incident_rollups.closed + EXCLUDED.closed
+"""
+
+TICKET_SLA_HOURLY_SQL = f"""
+INSERT INTO ticket_sla_rollups (granularity, bucket_start, closed, met_sla, breached_sla)
+SELECT 'hour', {_utc_trunc('hour', 'closed_at')},
+       COUNT(*),
+       COUNT(*) FILTER (WHERE closed_at <= sla_deadline),
+       COUNT(*) FILTER (WHERE closed_at > sla_deadline)
+FROM tickets
+WHERE closed_at > $1 AND closed_at <= $2
+GROUP BY 2
+ON CONFLICT (granularity, bucket_start) DO UPDATE SET
+    closed = ticket_sla_rollups.closed + EXCLUDED.closed,
+    met_sla = ticket_sla_rollups.met_sla + EXCLUDED.met_sla,
+    breached_sla = ticket_sla_rollups.breached_sla + EXCLUDED.breached_sla
+"""
+
+# Each asset's timeline inside the window is its carried status (from the
+# previous refresh) followed by its changes; every interval is split on hour
+# boundaries and clipped to the window.
+ASSET_STATUS_HOURLY_SQL = f"""
+WITH timeline AS (
+    SELECT asset_id, status, $1::timestamptz AS started_at
+    FROM asset_status_rollup_carry
+    UNION ALL
+    SELECT asset_id, status, occurred_at
+    FROM asset_status_history
+    WHERE occurred_at > $1 AND occurred_at <= $2
+), intervals AS (
+    SELECT status, started_at,
+           COALESCE(LEAD(started_at) OVER (PARTITION BY asset_id ORDER BY started_at), $2) AS ended_at
+    FROM timeline
+), pieces AS (
+    SELECT i.status, h.bucket_start,
+           EXTRACT(EPOCH FROM LEAST(i.ended_at, h.bucket_start + interval '1 hour')
+                              - GREATEST(i.started_at, h.bucket_start)) AS seconds
+    FROM intervals i
+    CROSS JOIN LATERAL generate_series(
+        {_utc_trunc('hour', 'i.started_at')}, i.ended_at, interval '1 hour'
+    ) AS h(bucket_start)
+    WHERE i.ended_at > i.started_at
+)
+INSERT INTO asset_status_rollups (granularity, bucket_start, status, seconds)
+SELECT 'hour', bucket_start, status, SUM(seconds)
+FROM pieces
+WHERE seconds > 0
+GROUP BY 2, 3
+ON CONFLICT (granularity, bucket_start, status) DO UPDATE SET
+    seconds = asset_status_rollups.seconds + EXCLUDED.seconds
+"""
+
+ADVANCE_ASSET_CARRY_SQL = """
+INSERT INTO asset_status_rollup_carry (asset_id, status, since)
+SELECT DISTINCT ON (asset_id) asset_id, status, occurred_at
+FROM asset_status_history
+WHERE occurred_at > $1 AND occurred_at <= $2
+ORDER BY asset_id, occurred_at DESC
+ON CONFLICT (asset_id) DO UPDATE SET status = EXCLUDED.status, since = EXCLUDED.since
+"""
+
+# First refresh only: status of every asset at the initial watermark (raw rows
+# before it may already be compacted into asset_status_intervals)
+SEED_ASSET_CARRY_SQL = """
+INSERT INTO asset_status_rollup_carry (asset_id, status, since)
+SELECT DISTINCT ON (asset_id) asset_id, status, at
+FROM (
+    SELECT asset_id, status, occurred_at AS at FROM asset_status_history WHERE occurred_at <= $1
+    UNION ALL
+    SELECT asset_id, status, started_at FROM asset_status_intervals WHERE started_at <= $1
+) known
+ORDER BY asset_id, at DESC
+ON CONFLICT (asset_id) DO NOTHING
+"""
+
+PRUNE_ASSET_CARRY_SQL = """
+DELETE FROM asset_status_rollup_carry c
+WHERE NOT EXISTS (SELECT 1 FROM assets a WHERE a.id = c.asset_id)
+"""
+
+INCIDENTS_DAILY_SQL = _daily_from_hourly("incident_rollups", ("type", "severity"), INCIDENT_MEASURES)
+TICKET_SLA_DAILY_SQL = _daily_from_hourly("ticket_sla_rollups", (), TICKET_SLA_MEASURES)
+ASSET_STATUS_DAILY_SQL = _daily_from_hourly("asset_status_rollups", ("status",), ("seconds",))
+
+GET_WATERMARK_SQL = "SELECT watermark FROM rollup_watermarks WHERE name = $1"
+SET_WATERMARK_SQL = """
+INSERT INTO rollup_watermarks (name, watermark) VALUES ($1, $2)
+ON CONFLICT (name) DO UPDATE SET watermark = EXCLUDED.watermark
+"""
+
+
+async def _refresh_incidents(conn, since: datetime, until: datetime, first_run: bool) -> None:
+    await conn.execute(INCIDENTS_HOURLY_SQL, since, until)
+    await conn.execute(INCIDENTS_DAILY_SQL, since, until)
+
+
+async def _refresh_ticket_sla(conn, since: datetime, until: datetime, first_run: bool) -> None:
+    await conn.execute(TICKET_SLA_HOURLY_SQL, since, until)
+    await conn.execute(TICKET_SLA_DAILY_SQL, since, until)
+
+
+async def _refresh_asset_status(conn, since: datetime, until: datetime, first_run: bool) -> None:
+    if first_run:
+        await conn.execute(SEED_ASSET_CARRY_SQL, since)
+    await conn.execute(ASSET_STATUS_HOURLY_SQL, since, until)
+    await conn.execute(ADVANCE_ASSET_CARRY_SQL, since, until)
+    await conn.execute(PRUNE_ASSET_CARRY_SQL)
+    await conn.execute(ASSET_STATUS_DAILY_SQL, since, until)
+
+
+# Rollup source name (its watermark) -> refresh step
+ROLLUP_SOURCES: Dict[str, Callable[[Any, datetime, datetime, bool], Awaitable[None]]] = {
+    "incidents": _refresh_incidents,
+    "ticket_sla": _refresh_ticket_sla,
+    "asset_status": _refresh_asset_status,
+}
+
+
+class RollupRefresher:
+    """
+    Folds source rows in (watermark, now - lag] into the hourly rollups, then
+    re-derives the touched days. Each source commits its rollup rows and its
+    new watermark in one transaction, so a crash never double counts.
+    The lag leaves room for writers whose transaction started before the
+    watermark but had not committed yet.
+    """
+
+    def __init__(self, pool: Any, lag_s: Optional[float] = None, backfill_days: Optional[int] = None):
+        self.pool = pool
+        self.lag = timedelta(seconds=settings.ROLLUP_LAG_S if lag_s is None else lag_s)
+        self.backfill = timedelta(days=settings.ROLLUP_BACKFILL_DAYS if backfill_days is None else backfill_days)
+
+    async def refresh_source(self, conn, name: str, until: datetime) -> Optional[datetime]:
+        async with conn.transaction():
+            # Another instance is refreshing this source: skip, it will catch up
+            if not await conn.fetchval("SELECT pg_try_advisory_xact_lock(hashtext($1))", f"rollup:{name}"):
+                return None
+            since = await conn.fetchval(GET_WATERMARK_SQL, name)
+            first_run = since is None
+            if first_run:
+                since = floor_hour(until - self.backfill)
+            if since >= until:
+                return None
+            await ROLLUP_SOURCES[name](conn, since, until, first_run)
+            await conn.execute(SET_WATERMARK_SQL, name, until)
+        return since
+
+    async def refresh(self, now: Optional[datetime] = None) -> Dict[str, datetime]:
+        """Returns {source: window start} for the sources that advanced."""
+        until = (now or datetime.now(timezone.utc)) - self.lag
+        advanced = {}
+        async with self.pool.acquire() as conn:
+            for name in ROLLUP_SOURCES:
+                since = await self.refresh_source(conn, name, until)
+                if since is not None:
+                    advanced[name] = since
+        return advanced
+
+
+class RollupMaintenance:
+    """Background task running RollupRefresher periodically (started at app startup)."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def _loop(self):
+        while self._running:
+            try:
+                pool = await db.get_pool()
+                await RollupRefresher(pool).refresh()
+            except Exception as e:
+                logger.error(f"Analytics rollup refresh failed: {e}")
+            await asyncio.sleep(settings.ROLLUP_REFRESH_INTERVAL_S)
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+rollup_maintenance = RollupMaintenance()
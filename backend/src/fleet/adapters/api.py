@@ -1,18 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
-from src.fleet.service import FleetService
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from src.fleet.service import FleetService, PositionHistoryUnavailableError
 from src.fleet.schemas import AssetResponse, AssetCreateRequest, AssetStatusUpdateRequest, AssetStatusUpdateResponse
+from src.fleet.schemas import DispatchCandidate, RoadSegment, RouteResponse, TrackResponse
+from src.fleet.schemas import StatusInterval, UptimeResponse
+from src.fleet.schemas import BulkAssetCreateRequest, BulkAssetCreateResponse, BulkStatusUpdateRequest, BulkStatusUpdateResponse
+from src.fleet.routing import NoRouteError
 from src.infrastructure.demo import is_demo_mode
+from src.infrastructure.settings import settings
+from src.shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursorError
+from src.fleet.live_state import FLEET_VERSION_HEADER
+import json
+import math
 import random
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 router = APIRouter(tags=["Fleet"])
 
+# Longest position history window per track/replay request
+MAX_HISTORY_WINDOW = timedelta(hours=24)
+# Longest status history / uptime window (served from compacted intervals)
+MAX_STATUS_WINDOW_DAYS = 366
+
 def get_fleet_service():
     return FleetService()
 
 @router.get("/fleet/assets", response_model=List[AssetResponse])
-async def get_assets(service: FleetService = Depends(get_fleet_service)):
+async def get_assets(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    asset_type: Optional[str] = None,
+    since_version: Optional[int] = Query(None, ge=0),
+    service: FleetService = Depends(get_fleet_service)
+):
     # 1. Demo Mode Gate
     if is_demo_mode():
         now = datetime.now(timezone.utc)
@@ -45,8 +68,22 @@ async def get_assets(service: FleetService = Depends(get_fleet_service)):
             ))
         return results
 
-    # 2. Real Production Logic
-    return await service.list_assets()
+    # 2. Live map: snapshot (or changes after since_version) from the in-memory
+    #    store, its version in X-Fleet-Version. Not paginated.
+    live = service.live_state.ready and not (cursor or status or asset_type)
+    if live:
+        version, states = service.live_assets(since_version)
+        response.headers[FLEET_VERSION_HEADER] = str(version)
+        return [state.to_dict() for state in states]
+
+    # 3. Listing / filters: one keyset page, next cursor in X-Next-Cursor
+    try:
+        page = await service.list_assets(limit=limit, cursor=cursor, status=status, asset_type=asset_type)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 @router.post("/fleet/assets", response_model=AssetResponse)
 async def create_asset(
@@ -72,6 +109,38 @@ async def create_asset(
         last_heartbeat_utc=result.get('last_heartbeat_utc')
     )
 
+# Bulk routes are declared before /fleet/assets/{id}/... so "bulk" is never taken for an id
+@router.post("/fleet/assets/bulk", response_model=BulkAssetCreateResponse)
+async def create_assets_bulk(
+    request: BulkAssetCreateRequest,
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Registers up to BULK_ASSETS_MAX assets with one statement and one event pipeline."""
+    if is_demo_mode():
+        results = []
+        for asset in request.assets:
+            asset_id = asset.id or f"vh-{random.randint(100, 999)}"
+            results.append({"id": asset_id, "db_id": None, "name": asset.name, "asset_type": asset.asset_type,
+                            "status": asset.status or "idle", "result": "created"})
+        return {"created": len(results), "results": results}
+
+    return await service.register_assets_bulk([asset.model_dump() for asset in request.assets])
+
+@router.patch("/fleet/assets/bulk/status", response_model=BulkStatusUpdateResponse)
+async def update_asset_statuses_bulk(
+    request: BulkStatusUpdateRequest,
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Sets up to BULK_ASSETS_MAX statuses with one statement and one event pipeline."""
+    if is_demo_mode():
+        return {
+            "changed": len(request.updates),
+            "updated_at_utc": datetime.now(timezone.utc),
+            "results": [{"asset_id": u.asset_id, "status": u.status, "result": "changed"} for u in request.updates],
+        }
+
+    return await service.update_statuses_bulk([update.model_dump() for update in request.updates])
+
 @router.patch("/fleet/assets/{id}/status", response_model=AssetStatusUpdateResponse)
 async def update_asset_status(
     id: str, 
@@ -89,3 +158,181 @@ async def update_asset_status(
         status=result['status'],
         updated_at_utc=result['updated_at_utc']
     )
+
+@router.get("/fleet/assets/{id}/status-intervals", response_model=List[StatusInterval])
+async def get_status_intervals(
+    id: str,
+    days: int = Query(7, ge=1, le=MAX_STATUS_WINDOW_DAYS),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Status runs over the last `days` days, oldest first."""
+    now = datetime.now(timezone.utc)
+    if is_demo_mode():
+        statuses = ("active", "idle", "active", "maintenance", "active")
+        step = timedelta(days=days) / len(statuses)
+        return [
+            StatusInterval(status=s, started_at=now - timedelta(days=days) + i * step,
+                           ended_at=None if i == len(statuses) - 1 else now - timedelta(days=days) + (i + 1) * step)
+            for i, s in enumerate(statuses)
+        ]
+    return await service.status_intervals(id, now - timedelta(days=days), now)
+
+@router.get("/fleet/uptime", response_model=UptimeResponse)
+async def get_fleet_uptime(
+    hours: int = Query(24, ge=1, le=MAX_STATUS_WINDOW_DAYS * 24),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Uptime and utilisation per asset and for the fleet over the last `hours` hours."""
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(hours=hours)
+    if is_demo_mode():
+        observed = hours * 3600.0
+        return {
+            "since": since, "until": now,
+            "fleet": {"observed_s": observed * 2, "uptime_pct": 99.4, "utilisation_pct": 71.3, "assets": 2},
+            "assets": [
+                {"asset_id": "vh-001", "seconds": {"active": observed * 0.8, "idle": observed * 0.2},
+                 "observed_s": observed, "uptime_pct": 100.0, "utilisation_pct": 80.0},
+                {"asset_id": "vh-005", "seconds": {"active": observed * 0.6, "idle": observed * 0.388, "repair": observed * 0.012},
+                 "observed_s": observed, "uptime_pct": 98.8, "utilisation_pct": 60.73},
+            ],
+        }
+    return await service.uptime(since, now)
+
+def _map_coordinate():
+    return Query(..., ge=-settings.MAP_COORD_LIMIT, le=settings.MAP_COORD_LIMIT)
+
+@router.get("/fleet/dispatch/nearest", response_model=List[DispatchCandidate])
+async def nearest_assets(
+    x: float = _map_coordinate(),
+    y: float = _map_coordinate(),
+    k: int = Query(5, ge=1, le=50),
+    asset_type: Optional[List[str]] = Query(None),
+    status: Optional[List[str]] = Query(None, description="Defaults to DISPATCH_AVAILABLE_STATUSES"),
+    max_distance: Optional[float] = Query(None, gt=0),
+    rank: str = Query("distance", pattern="^(distance|eta)$"),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """
+    Dispatch recommendation: the k nearest assets to an incident location
+    (map coordinates), closest first. Served from the live fleet index;
+    rank=eta orders by road travel time (eta_s) instead.
+    """
+    if is_demo_mode():
+        # No consumers feed the live index in demo mode: rank a few mock vehicles
+        now = datetime.now(timezone.utc)
+        mock = [
+            ("vh-002", "Patrol Bravo", "patrol"), ("vh-003", "Bus T1-T2", "bus"),
+            ("vh-006", "Follow Me 03", "follow_me"), ("rb-001", "SecBot-Beta", "robot"),
+        ]
+        candidates = []
+        for asset_id, name, kind in mock:
+            if asset_type and kind not in asset_type:
+                continue
+            px, py = random.uniform(0, 800), random.uniform(0, 600)
+            candidates.append(DispatchCandidate(
+                id=asset_id, asset_type=kind, name=name, status="idle", last_heartbeat_utc=now,
+                location={"x": px, "y": py}, distance=round(math.hypot(px - x, py - y), 2),
+            ))
+        candidates.sort(key=lambda c: c.distance)
+        return candidates[:k]
+
+    return service.nearest_available(
+        x, y, k, asset_types=asset_type, statuses=status, max_distance=max_distance, rank=rank
+    )
+
+@router.get("/fleet/routes", response_model=RouteResponse)
+async def get_route(
+    from_x: float = _map_coordinate(),
+    from_y: float = _map_coordinate(),
+    to_x: float = _map_coordinate(),
+    to_y: float = _map_coordinate(),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Fastest open service-road route between two map points."""
+    try:
+        return service.route_between(from_x, from_y, to_x, to_y)
+    except NoRouteError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.get("/fleet/routes/closures", response_model=List[RoadSegment])
+async def list_road_closures(service: FleetService = Depends(get_fleet_service)):
+    return [RoadSegment(a=a, b=b) for a, b in sorted(tuple(sorted(seg)) for seg in service.roads.closed)]
+
+@router.post("/fleet/routes/closures", response_model=List[RoadSegment])
+async def close_road_segment(
+    closure: RoadSegment,
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Closes a segment for routing (this process); cached routes through it are dropped."""
+    try:
+        service.roads.close_segment(closure.a, closure.b)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    return await list_road_closures(service)
+
+@router.delete("/fleet/routes/closures/{a}/{b}", response_model=List[RoadSegment])
+async def reopen_road_segment(
+    a: str,
+    b: str,
+    service: FleetService = Depends(get_fleet_service)
+):
+    service.roads.reopen_segment(a, b)
+    return await list_road_closures(service)
+
+def _history_window(since: datetime, until: Optional[datetime]):
+    until = until or datetime.now(timezone.utc)
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    if until <= since or until - since > MAX_HISTORY_WINDOW:
+        raise HTTPException(status_code=400, detail="'until' must be after 'since', within 24 hours")
+    return since, until
+
+@router.get("/fleet/assets/{id}/track", response_model=TrackResponse)
+async def get_asset_track(
+    id: str,
+    since: datetime,
+    until: Optional[datetime] = None,
+    bucket_s: float = Query(0, ge=0, description="Average positions per bucket (seconds); 0 returns raw samples"),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """Where an asset was between since and until (telemetry id, e.g. VEH-202)."""
+    since, until = _history_window(since, until)
+    try:
+        points = await service.get_track(id, since, until, bucket_s)
+    except PositionHistoryUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return TrackResponse(asset_id=id, points=points)
+
+@router.get("/fleet/replay")
+async def replay_positions(
+    request: Request,
+    asset_ids: str = Query(..., description="Comma-separated telemetry ids"),
+    since: datetime = Query(...),
+    until: Optional[datetime] = None,
+    speed: float = Query(1.0, gt=0, le=1000),
+    frame_s: float = Query(1.0, gt=0, le=3600),
+    service: FleetService = Depends(get_fleet_service)
+):
+    """SSE replay of several assets' positions, one `frame` event per frame_s of history, at speed x."""
+    since, until = _history_window(since, until)
+    ids = [a.strip() for a in asset_ids.split(",") if a.strip()]
+    try:
+        frames = service.replay(ids, since, until, speed=speed, frame_s=frame_s)
+    except PositionHistoryUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    async def event_generator():
+        async for frame_start, positions in frames:
+            if await request.is_disconnected():
+                break
+            data = {
+                "ts_utc": datetime.fromtimestamp(frame_start, timezone.utc).isoformat(),
+                "positions": {k: {"x": x, "y": y, "speed_kmh": None if math.isnan(v) else v} for k, (x, y, v) in positions.items()},
+            }
+            yield f"event: frame\ndata: {json.dumps(data)}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
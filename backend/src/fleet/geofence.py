@@ -0,0 +1,130 @@
+import json
+import math
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from src.infrastructure.settings import settings
+
+Point = Tuple[float, float]
+
+# Map coordinates (0..800 x 0..600, same space as the ops map and simulation)
+DEFAULT_ZONES: List[Dict[str, Any]] = [
+    {"zone_id": "AIRSIDE_PERIMETER", "restricted": True,
+     "polygon": [(0, 0), (800, 0), (800, 240), (0, 240)]},
+    {"zone_id": "APRON_TRANSFER_ZONE", "restricted": False,
+     "polygon": [(0, 240), (800, 240), (800, 420), (0, 420)]},
+    {"zone_id": "LANDSIDE_ACCESS_ROAD", "restricted": False,
+     "polygon": [(0, 420), (800, 420), (800, 600), (0, 600)]},
+]
+
+
+class Zone:
+    __slots__ = ("zone_id", "restricted", "xs", "ys", "min_x", "min_y", "max_x", "max_y")
+
+    def __init__(self, zone_id: str, polygon: Sequence[Sequence[float]], restricted: bool = False):
+        if len(polygon) < 3:
+            raise ValueError(f"Zone {zone_id} needs at least 3 vertices")
+        self.zone_id = zone_id
+        self.restricted = restricted
+        self.xs = tuple(float(p[0]) for p in polygon)
+        self.ys = tuple(float(p[1]) for p in polygon)
+        self.min_x, self.max_x = min(self.xs), max(self.xs)
+        self.min_y, self.max_y = min(self.ys), max(self.ys)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Even-odd ray cast; points on the min edges count as inside."""
+        if x < self.min_x or x > self.max_x or y < self.min_y or y > self.max_y:
+            return False
+        xs, ys = self.xs, self.ys
+        inside = False
+        j = len(xs) - 1
+        for i in range(len(xs)):
+            yi, yj = ys[i], ys[j]
+            if (yi > y) != (yj > y):
+                if x < (xs[j] - xs[i]) * (y - yi) / (yj - yi) + xs[i]:
+                    inside = not inside
+            j = i
+        return inside
+
+
+class GeofenceIndex:
+    """
+    Uniform grid over the zones' bounding box. Each cell lists the zones
+    whose bounding box overlaps it, so a lookup ray-casts only against
+    the handful of zones near the point.
+    """
+
+    def __init__(self, zones: Iterable[Zone], cell_size: float = 50.0):
+        self.zones = list(zones)
+        self.cell_size = cell_size
+        if not self.zones:
+            self.origin_x = self.origin_y = 0.0
+            self.cols = self.rows = 0
+            self.cells: List[Tuple[Zone, ...]] = []
+            return
+        self.origin_x = min(z.min_x for z in self.zones)
+        self.origin_y = min(z.min_y for z in self.zones)
+        self.cols = int(math.floor((max(z.max_x for z in self.zones) - self.origin_x) / cell_size)) + 1
+        self.rows = int(math.floor((max(z.max_y for z in self.zones) - self.origin_y) / cell_size)) + 1
+        buckets: List[List[Zone]] = [[] for _ in range(self.cols * self.rows)]
+        for zone in self.zones:
+            c0, r0 = self._cell(zone.min_x, zone.min_y)
+            c1, r1 = self._cell(zone.max_x, zone.max_y)
+            for row in range(r0, r1 + 1):
+                for col in range(c0, c1 + 1):
+                    buckets[row * self.cols + col].append(zone)
+        self.cells = [tuple(bucket) for bucket in buckets]
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int((x - self.origin_x) // self.cell_size), int((y - self.origin_y) // self.cell_size)
+
+    def zones_at(self, x: float, y: float) -> FrozenSet[str]:
+        col, row = self._cell(x, y)
+        if col < 0 or row < 0 or col >= self.cols or row >= self.rows:
+            return frozenset()
+        return frozenset(z.zone_id for z in self.cells[row * self.cols + col] if z.contains(x, y))
+
+
+class GeofenceEngine:
+    """
+    Tracks which zones each asset is in and reports only transitions:
+    (zone, "entered" | "exited"). Repeated positions inside the same zones
+    cost one grid lookup and a set comparison.
+    """
+
+    def __init__(self, zones: Iterable[Zone], cell_size: float = 50.0):
+        self.index = GeofenceIndex(zones, cell_size)
+        self.zones = {zone.zone_id: zone for zone in self.index.zones}
+        self._memberships: Dict[str, FrozenSet[str]] = {}
+
+    def zones_of(self, asset_id: str) -> FrozenSet[str]:
+        return self._memberships.get(asset_id, frozenset())
+
+    def evaluate(self, asset_id: str, x: float, y: float) -> List[Tuple[Zone, str]]:
+        current = self.index.zones_at(x, y)
+        previous = self._memberships.get(asset_id, frozenset())
+        if current == previous:
+            return []
+        self._memberships[asset_id] = current
+        transitions = [(self.zones[z], "exited") for z in previous - current]
+        transitions.extend((self.zones[z], "entered") for z in current - previous)
+        return transitions
+
+    def forget(self, asset_id: str) -> None:
+        self._memberships.pop(asset_id, None)
+
+
+def load_zones(path: Optional[str] = None) -> List[Zone]:
+    """
+    Zones from a JSON file ([{"zone_id", "polygon": [[x, y], ...], "restricted"}])
+    or DEFAULT_ZONES when no file is configured.
+    """
+    path = path or settings.GEOFENCE_ZONES_FILE
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            definitions = json.load(f)
+    else:
+        definitions = DEFAULT_ZONES
+    return [Zone(d["zone_id"], d["polygon"], bool(d.get("restricted", False))) for d in definitions]
+
+
+geofence_engine = GeofenceEngine(load_zones())
@@ -0,0 +1,173 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+from src.fleet.spatial import SpatialIndex
+
+# Response header carrying the store version a /fleet/assets response reflects
+FLEET_VERSION_HEADER = "X-Fleet-Version"
+
+
+class AssetState:
+    __slots__ = (
+        "asset_id", "asset_type", "name", "status", "zone_id",
+        "x", "y", "speed_kmh", "driver_name", "last_heartbeat", "version",
+    )
+
+    def __init__(self, asset_id: str, asset_type: str = "Unknown", name: Optional[str] = None):
+        self.asset_id = asset_id
+        self.asset_type = asset_type
+        self.name = name or asset_id
+        self.status = "Unknown"
+        self.zone_id: Optional[str] = None
+        self.x: Optional[float] = None
+        self.y: Optional[float] = None
+        self.speed_kmh: Optional[float] = None
+        self.driver_name: Optional[str] = None
+        self.last_heartbeat: Optional[datetime] = None
+        self.version = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.asset_id,
+            "asset_type": self.asset_type,
+            "name": self.name,
+            "status": self.status,
+            "zone_id": self.zone_id,
+            "location": {"x": self.x, "y": self.y} if self.x is not None and self.y is not None else None,
+            "driver": self.driver_name,
+            "speed_kmh": self.speed_kmh,
+            "last_heartbeat_utc": self.last_heartbeat,
+        }
+
+
+class LiveFleetState:
+    """
+    Per-process live view of every asset, fed by fleet events and warmed from
+    the assets table at startup. Every change bumps a store-wide version and
+    moves the asset to the end of an OrderedDict, so changes_since(v) walks
+    back only over the assets changed after v. Positioned assets are also
+    kept in a SpatialIndex for nearest() (dispatch recommendations).
+
+    Versions start at the process start time in microseconds: a version
+    issued by a previous process is always below `base_version`, and
+    clients presenting one get a full snapshot instead of a partial delta.
+    """
+
+    def __init__(self):
+        self._assets: "OrderedDict[str, AssetState]" = OrderedDict()
+        self.base_version = time.time_ns() // 1000
+        self.version = self.base_version
+        self.ready = False
+        self.spatial = SpatialIndex()
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def get(self, asset_id: str) -> Optional[AssetState]:
+        return self._assets.get(asset_id)
+
+    def apply(
+        self,
+        asset_id: str,
+        status: Optional[str] = None,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        zone_id: Optional[str] = None,
+        driver_name: Optional[str] = None,
+        reported_at: Optional[datetime] = None,
+        speed_kmh: Optional[float] = None,
+        asset_type: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> AssetState:
+        """Upserts an asset; None fields keep their current value."""
+        state = self._assets.get(asset_id)
+        if state is None:
+            state = self._assets[asset_id] = AssetState(asset_id, asset_type or "Unknown", name)
+        else:
+            if asset_type is not None:
+                state.asset_type = asset_type
+            if name is not None:
+                state.name = name
+            self._assets.move_to_end(asset_id)
+        if status is not None:
+            state.status = status
+        if x is not None:
+            state.x = x
+        if y is not None:
+            state.y = y
+        if zone_id is not None:
+            state.zone_id = zone_id
+        if speed_kmh is not None:
+            state.speed_kmh = speed_kmh
+        if driver_name is not None:
+            state.driver_name = driver_name
+        if (x is not None or y is not None) and state.x is not None and state.y is not None:
+            self.spatial.update(asset_id, state.x, state.y)
+        state.last_heartbeat = reported_at or datetime.now(timezone.utc)
+        self.version += 1
+        state.version = self.version
+        return state
+
+    def load(self, rows: Iterable[Any]) -> int:
+        """Warms the store from assets rows (see AssetRepository.get_live_rows)."""
+        count = 0
+        for row in rows:
+            state = self.apply(
+                row["id"],
+                status=row["status"],
+                x=row["location_x"],
+                y=row["location_y"],
+                zone_id=row["zone_id"],
+                driver_name=row["driver_name"],
+                asset_type=row["asset_type"],
+                name=row["name"],
+            )
+            state.last_heartbeat = row["last_heartbeat"]
+            count += 1
+        self.ready = True
+        return count
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        asset_types: Optional[Collection[str]] = None,
+        statuses: Optional[Collection[str]] = None,
+        max_distance: Optional[float] = None,
+    ) -> List[Tuple[float, AssetState]]:
+        """k closest positioned assets to (x, y); type/status filters are case-insensitive."""
+        types = {t.lower() for t in asset_types} if asset_types else None
+        wanted = {s.lower() for s in statuses} if statuses else None
+
+        def eligible(asset_id: str) -> bool:
+            state = self._assets[asset_id]
+            if types is not None and state.asset_type.lower() not in types:
+                return False
+            return wanted is None or state.status.lower() in wanted
+
+        hits = self.spatial.nearest(x, y, k, eligible, max_distance)
+        return [(distance, self._assets[asset_id]) for distance, asset_id in hits]
+
+    def snapshot(self) -> Tuple[int, List[AssetState]]:
+        return self.version, list(self._assets.values())
+
+    def changes_since(self, since_version: int) -> Tuple[int, List[AssetState]]:
+        """
+        Assets changed after `since_version`, oldest change first.
+        Unknown versions (another process, or from the future) get a full snapshot.
+        """
+        if since_version < self.base_version or since_version > self.version:
+            return self.snapshot()
+        changed = []
+        for state in reversed(self._assets.values()):
+            if state.version <= since_version:
+                break
+            changed.append(state)
+        changed.reverse()
+        return self.version, changed
+
+
+live_fleet_state = LiveFleetState()
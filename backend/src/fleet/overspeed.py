@@ -0,0 +1,125 @@
+from array import array
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from src.infrastructure.settings import settings
+
+# Posted limits per zone (km/h); assets in several zones get the lowest
+ZONE_SPEED_LIMITS_KMH: Dict[str, float] = {
+    "AIRSIDE_PERIMETER": 40.0,
+    "APRON_TRANSFER_ZONE": 25.0,
+    "LANDSIDE_ACCESS_ROAD": 60.0,
+}
+
+
+class Violation(NamedTuple):
+    asset_id: str
+    zone_id: Optional[str]
+    limit_kmh: float
+    avg_kmh: float
+    started_at: float
+
+
+class OverspeedDetector:
+    """
+    Sliding-window overspeed detection over every vehicle's speed samples.
+
+    Each vehicle owns a slot in flat ring arrays (array('d'), window samples
+    per slot) plus a running sum, so a sample costs O(1) with no per-sample
+    allocation. A violation starts when the window average exceeds
+    limit + tolerance over a full window (debounce) and clears only once the
+    average drops below limit - hysteresis; after clearing, a new violation
+    waits out the cooldown. One sustained violation yields one Violation.
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        tolerance_kmh: Optional[float] = None,
+        hysteresis_kmh: Optional[float] = None,
+        cooldown_s: Optional[float] = None,
+        default_limit_kmh: Optional[float] = None,
+        zone_limits: Optional[Dict[str, float]] = None,
+        capacity: int = 256,
+    ):
+        self.window = window or settings.OVERSPEED_WINDOW_SAMPLES
+        self.tolerance = settings.OVERSPEED_TOLERANCE_KMH if tolerance_kmh is None else tolerance_kmh
+        self.hysteresis = settings.OVERSPEED_HYSTERESIS_KMH if hysteresis_kmh is None else hysteresis_kmh
+        self.cooldown = settings.OVERSPEED_COOLDOWN_S if cooldown_s is None else cooldown_s
+        self.default_limit = settings.OVERSPEED_DEFAULT_LIMIT_KMH if default_limit_kmh is None else default_limit_kmh
+        self.zone_limits = ZONE_SPEED_LIMITS_KMH if zone_limits is None else zone_limits
+
+        self._slots: Dict[str, int] = {}
+        self._capacity = 0
+        self._samples = array("d")
+        self._sum = array("d")
+        self._count = array("l")
+        self._head = array("l")
+        self._over = bytearray()
+        self._cleared_at = array("d")
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        self._samples.extend(array("d", [0.0]) * (extra * self.window))
+        self._sum.extend(array("d", [0.0]) * extra)
+        self._count.extend(array("l", [0]) * extra)
+        self._head.extend(array("l", [0]) * extra)
+        self._over.extend(bytes(extra))
+        self._cleared_at.extend(array("d", [float("-inf")]) * extra)
+        self._capacity = capacity
+
+    def _slot(self, asset_id: str) -> int:
+        slot = self._slots.get(asset_id)
+        if slot is None:
+            slot = len(self._slots)
+            if slot >= self._capacity:
+                self._grow(self._capacity * 2)
+            self._slots[asset_id] = slot
+        return slot
+
+    def limit_for(self, zones: Iterable[str]) -> float:
+        limits = [self.zone_limits[z] for z in zones if z in self.zone_limits]
+        return min(limits) if limits else self.default_limit
+
+    def is_violating(self, asset_id: str) -> bool:
+        slot = self._slots.get(asset_id)
+        return slot is not None and bool(self._over[slot])
+
+    def observe(self, asset_id: str, speed_kmh: float, ts: float, zones: Iterable[str] = ()) -> Optional[Violation]:
+        """Feeds one sample; returns a Violation only on the sample that starts one."""
+        slot = self._slot(asset_id)
+        window = self.window
+        base = slot * window
+        head = self._head[slot]
+
+        # Ring write + running sum
+        self._sum[slot] += speed_kmh - self._samples[base + head]
+        self._samples[base + head] = speed_kmh
+        head = (head + 1) % window
+        self._head[slot] = head
+        if head == 0:
+            # Once per lap: recompute so float drift never accumulates
+            self._sum[slot] = sum(self._samples[base:base + window])
+        count = self._count[slot]
+        if count < window:
+            count += 1
+            self._count[slot] = count
+
+        zones = tuple(zones)
+        limit = self.limit_for(zones)
+        avg = self._sum[slot] / count
+
+        if self._over[slot]:
+            if avg < limit - self.hysteresis:
+                self._over[slot] = 0
+                self._cleared_at[slot] = ts
+            return None
+
+        if count == window and avg > limit + self.tolerance and ts - self._cleared_at[slot] >= self.cooldown:
+            self._over[slot] = 1
+            limiting = [z for z in zones if self.zone_limits.get(z) == limit]
+            return Violation(asset_id, limiting[0] if limiting else None, limit, avg, ts)
+        return None
+
+
+overspeed_detector = OverspeedDetector()
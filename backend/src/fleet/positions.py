@@ -0,0 +1,403 @@
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.infrastructure.settings import settings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_S = 3600  # one chunk per asset per UTC hour
+COLUMNS = ("ts", "x", "y", "speed")
+READ_WORKERS = min(8, os.cpu_count() or 1)
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class _HourBuffer:
+    """
+    Growable column arrays for the hour an asset is currently reporting in.
+
+    `base` is what the hour's chunk held before this buffer was first
+    written (empty columns when there was no chunk); None until then.
+    `dirty` is set by appends and cleared when a flush snapshots the buffer.
+    """
+
+    __slots__ = ("hour", "ts", "x", "y", "speed", "size", "sorted", "base", "dirty")
+
+    def __init__(self, hour: int, capacity: int = 1024):
+        self.hour = hour
+        self.ts = np.empty(capacity, dtype=np.float64)
+        self.x = np.empty(capacity, dtype=np.float32)
+        self.y = np.empty(capacity, dtype=np.float32)
+        self.speed = np.empty(capacity, dtype=np.float32)
+        self.size = 0
+        self.sorted = True
+        self.base: Optional[Dict[str, Any]] = None
+        self.dirty = False
+
+    def append(self, ts: float, x: float, y: float, speed: float) -> None:
+        if self.size == len(self.ts):
+            for name in COLUMNS:
+                old = getattr(self, name)
+                grown = np.empty(len(old) * 2, dtype=old.dtype)
+                grown[:self.size] = old
+                setattr(self, name, grown)
+        i = self.size
+        if i and ts < self.ts[i - 1]:
+            self.sorted = False
+        self.ts[i] = ts
+        self.x[i] = x
+        self.y[i] = y
+        self.speed[i] = speed
+        self.size = i + 1
+        self.dirty = True
+
+    def columns(self) -> Dict[str, Any]:
+        """Copy of the filled part after `base`, time-ordered."""
+        n = self.size
+        cols = {name: getattr(self, name)[:n].copy() for name in COLUMNS}
+        if self.base is not None:
+            return _merge(self.base, cols)
+        return _sort(cols) if not self.sorted else cols
+
+
+def _sort(cols: Dict[str, Any]) -> Dict[str, Any]:
+    order = np.argsort(cols["ts"], kind="stable")
+    return {name: col[order] for name, col in cols.items()}
+
+
+def _merge(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    if not len(older["ts"]):
+        return newer if len(newer["ts"]) < 2 or np.all(np.diff(newer["ts"]) >= 0) else _sort(newer)
+    cols = {name: np.concatenate([older[name], newer[name]]) for name in COLUMNS}
+    return cols if np.all(np.diff(cols["ts"]) >= 0) else _sort(cols)
+
+
+def _empty_columns() -> Dict[str, Any]:
+    return {
+        "ts": np.empty(0, dtype=np.float64),
+        "x": np.empty(0, dtype=np.float32),
+        "y": np.empty(0, dtype=np.float32),
+        "speed": np.empty(0, dtype=np.float32),
+    }
+
+
+class PositionStore:
+    """
+    Per-asset columnar position history: float64 timestamps (epoch seconds)
+    and float32 x/y/speed, one compressed .npz chunk per asset per UTC hour
+    under `root/<asset>/<hour>.npz`. The current hour lives in memory and is
+    rewritten to its chunk by the next flush after it changes, so each
+    asset-hour is always one file. Range reads binary-search the chunks they
+    touch; decoded chunks are kept in a small LRU.
+
+    append() only touches memory. Chunk files are only read and written by
+    flush(), in a worker thread, one flush at a time: a buffer's first write
+    merges in the chunk already on disk for its hour (after a restart, or
+    when a late sample reopens an hour), and buffers whose hour has ended
+    are dropped once written. An hour that rolls over is sealed in memory
+    until the next flush writes it, so an earlier, partial snapshot of that
+    hour can never land on top of the complete chunk.
+    """
+
+    def __init__(self, root: str, cache_chunks: int = 2048):
+        if np is None:
+            raise RuntimeError("PositionStore requires numpy")
+        self.root = root
+        self.cache_chunks = cache_chunks
+        self._buffers: Dict[str, _HourBuffer] = {}
+        # Completed hours not yet written: (asset, hour) -> buffer
+        self._sealed: Dict[Tuple[str, int], _HourBuffer] = {}
+        self._hours: Dict[str, set] = {}
+        self._cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+        # Reads and flushes run in worker threads (asyncio.to_thread)
+        self._cache_lock = threading.Lock()
+        # Held while a buffer's base is loaded and first written, so reads see
+        # either the old chunk without a base or the base, never both
+        self._base_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.dropped_late = 0
+        os.makedirs(root, exist_ok=True)
+
+    # --- paths / index -----------------------------------------------------
+
+    def _asset_dir(self, asset_id: str) -> str:
+        return os.path.join(self.root, _UNSAFE_RE.sub("_", asset_id))
+
+    def _chunk_path(self, asset_id: str, hour: int) -> str:
+        return os.path.join(self._asset_dir(asset_id), f"{hour}.npz")
+
+    def _chunk_hours(self, asset_id: str) -> set:
+        hours = self._hours.get(asset_id)
+        if hours is None:
+            hours = set()
+            directory = self._asset_dir(asset_id)
+            if os.path.isdir(directory):
+                for name in os.listdir(directory):
+                    stem, ext = os.path.splitext(name)
+                    if ext == ".npz" and stem.isdigit():
+                        hours.add(int(stem))
+            self._hours[asset_id] = hours
+        return hours
+
+    def _load_chunk(self, asset_id: str, hour: int) -> Dict[str, Any]:
+        key = (asset_id, hour)
+        with self._cache_lock:
+            cols = self._cache.get(key)
+            if cols is not None:
+                self._cache.move_to_end(key)
+                return cols
+        with np.load(self._chunk_path(asset_id, hour)) as data:
+            cols = {name: data[name] for name in COLUMNS}
+        with self._cache_lock:
+            self._cache[key] = cols
+            if len(self._cache) > self.cache_chunks:
+                self._cache.popitem(last=False)
+        return cols
+
+    # --- writes --------------------------------------------------------------
+
+    def append(self, asset_id: str, ts: float, x: float, y: float, speed: float = float("nan")) -> None:
+        """O(1) amortised, no I/O. Samples older than the asset's current hour are dropped."""
+        hour = int(ts // CHUNK_S) * CHUNK_S
+        buf = self._buffers.get(asset_id)
+        if buf is None or buf.hour != hour:
+            if buf is not None and hour < buf.hour:
+                self.dropped_late += 1
+                return
+            if buf is not None:
+                # Read from memory until a flush has written it, off the event loop
+                self._sealed[(asset_id, buf.hour)] = buf
+            buf = _HourBuffer(hour)
+            self._buffers[asset_id] = buf
+        buf.append(ts, x, y, speed)
+
+    def _write_chunk(self, asset_id: str, hour: int, cols: Dict[str, Any]) -> None:
+        os.makedirs(self._asset_dir(asset_id), exist_ok=True)
+        path = self._chunk_path(asset_id, hour)
+        tmp = f"{path}.{threading.get_ident()}.tmp.npz"
+        np.savez_compressed(tmp, **cols)
+        os.replace(tmp, path)
+        self._chunk_hours(asset_id).add(hour)
+        with self._cache_lock:
+            self._cache.pop((asset_id, hour), None)
+
+    def snapshot_buffers(self) -> List[Tuple[str, _HourBuffer, Dict[str, Any]]]:
+        """
+        Copies of the sealed hours and of every current hour changed since the
+        last flush (cheap), to be written off the event loop.
+        """
+        snapshot = []
+        for (asset_id, _), buf in self._sealed.items():
+            if buf.dirty:
+                snapshot.append((asset_id, buf, buf.columns()))
+                buf.dirty = False
+        for asset_id, buf in self._buffers.items():
+            if buf.dirty:
+                snapshot.append((asset_id, buf, buf.columns()))
+                buf.dirty = False
+        return snapshot
+
+    def write_snapshot(self, snapshot: Sequence[Tuple[str, _HourBuffer, Dict[str, Any]]]) -> None:
+        for asset_id, buf, cols in snapshot:
+            if buf.base is not None:
+                self._write_chunk(asset_id, buf.hour, cols)
+                continue
+            # First write of this buffer: keep what the hour's chunk already holds
+            with self._base_lock:
+                if buf.hour in self._chunk_hours(asset_id):
+                    base = self._load_chunk(asset_id, buf.hour)
+                else:
+                    base = _empty_columns()
+                self._write_chunk(asset_id, buf.hour, _merge(base, cols))
+                buf.base = base
+
+    async def flush(self) -> int:
+        """Writes changed hours; returns the number of chunks written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        # One writer at a time: snapshots reach disk in the order they were taken
+        async with self._flush_lock:
+            snapshot = self.snapshot_buffers()
+            try:
+                await asyncio.to_thread(self.write_snapshot, snapshot)
+            except BaseException:
+                for _, buf, _ in snapshot:
+                    buf.dirty = True
+                raise
+            # Clean buffers are complete on disk (this or an earlier flush wrote them).
+            # Sealed hours, and current hours that have ended, are no longer held.
+            for key, buf in list(self._sealed.items()):
+                if not buf.dirty:
+                    del self._sealed[key]
+            current = int(time.time() // CHUNK_S) * CHUNK_S
+            for asset_id, buf in list(self._buffers.items()):
+                if not buf.dirty and buf.hour < current:
+                    del self._buffers[asset_id]
+            return len(snapshot)
+
+    # --- reads ---------------------------------------------------------------
+
+    def range(self, asset_id: str, since: float, until: float) -> Dict[str, Any]:
+        """Samples with since <= ts < until, time-ordered, as column arrays."""
+        parts = []
+        buf = self._buffers.get(asset_id)
+        hours = self._chunk_hours(asset_id)
+        first = int(since // CHUNK_S) * CHUNK_S
+        for hour in range(first, int(until) + 1, CHUNK_S):
+            if hour >= until:
+                break
+            # Flushes remove sealed hours on the event loop meanwhile: look up once
+            held = buf if buf is not None and buf.hour == hour else self._sealed.get((asset_id, hour))
+            if held is not None:
+                cols = self._buffer_columns(asset_id, held)
+            elif hour in hours:
+                cols = self._load_chunk(asset_id, hour)
+            else:
+                continue
+            lo, hi = np.searchsorted(cols["ts"], [since, until], side="left")
+            if hi > lo:
+                parts.append({name: col[lo:hi] for name, col in cols.items()})
+        if not parts:
+            return _empty_columns()
+        if len(parts) == 1:
+            return parts[0]
+        return {name: np.concatenate([p[name] for p in parts]) for name in COLUMNS}
+
+    def _buffer_columns(self, asset_id: str, buf: _HourBuffer) -> Dict[str, Any]:
+        if buf.base is not None:
+            return buf.columns()
+        with self._base_lock:
+            if buf.base is None and buf.hour in self._chunk_hours(asset_id):
+                # Not written yet: the chunk on disk still holds the earlier samples
+                return _merge(self._load_chunk(asset_id, buf.hour), buf.columns())
+        return buf.columns()
+
+    def range_many(self, asset_ids: Sequence[str], since: float, until: float) -> Dict[str, Dict[str, Any]]:
+        # zlib releases the GIL, so cold chunks decode in parallel
+        if len(asset_ids) < 8:
+            return {asset_id: self.range(asset_id, since, until) for asset_id in asset_ids}
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+            results = pool.map(lambda asset_id: self.range(asset_id, since, until), asset_ids)
+            return dict(zip(asset_ids, results))
+
+    def assets(self) -> List[str]:
+        """Asset ids with an hour held in memory (on-disk names are sanitised, not reversible)."""
+        return list(self._buffers)
+
+    # --- lifecycle -----------------------------------------------------------
+
+    async def _loop(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.POSITION_STORE_FLUSH_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+            if not self._running:
+                break
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Position store flush failed: {e}")
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        # Wake the loop rather than cancel it: a flush in progress finishes first
+        self._running = False
+        if self._task:
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final position store flush failed: {e}")
+
+
+def downsample(cols: Dict[str, Any], bucket_s: float) -> Dict[str, Any]:
+    """Mean x/y/speed per bucket_s bucket; ts is the bucket start. Empty buckets are omitted."""
+    ts = cols["ts"]
+    if not len(ts) or bucket_s <= 0:
+        return cols
+    buckets = np.floor(ts / bucket_s).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    counts = np.diff(np.r_[starts, len(ts)])
+    out = {"ts": buckets[starts].astype(np.float64) * bucket_s}
+    for name in ("x", "y", "speed"):
+        out[name] = (np.add.reduceat(cols[name].astype(np.float64), starts) / counts).astype(np.float32)
+    return out
+
+
+def replay_frames(
+    tracks: Dict[str, Dict[str, Any]], since: float, until: float, frame_s: float = 1.0
+) -> Iterator[Tuple[float, Dict[str, Tuple[float, float, float]]]]:
+    """
+    Merges several assets' tracks into frames of frame_s simulated seconds:
+    (frame_start, {asset_id: (x, y, speed)} with each asset's last sample in
+    the frame). Frames with no samples are skipped.
+    """
+    names, parts = [], []
+    for asset_id, cols in tracks.items():
+        if len(cols["ts"]):
+            names.append(asset_id)
+            parts.append(cols)
+    if not parts:
+        return
+    ts = np.concatenate([p["ts"] for p in parts])
+    owner = np.concatenate([np.full(len(p["ts"]), i, dtype=np.int32) for i, p in enumerate(parts)])
+    x = np.concatenate([p["x"] for p in parts])
+    y = np.concatenate([p["y"] for p in parts])
+    speed = np.concatenate([p["speed"] for p in parts])
+
+    order = np.argsort(ts, kind="stable")
+    ts, owner, x, y, speed = ts[order], owner[order], x[order], y[order], speed[order]
+    frame = np.floor((ts - since) / frame_s).astype(np.int64)
+    bounds = np.flatnonzero(np.r_[True, frame[1:] != frame[:-1], True])
+
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        positions = {}
+        for i in range(lo, hi):
+            positions[names[owner[i]]] = (float(x[i]), float(y[i]), float(speed[i]))
+        yield since + int(frame[lo]) * frame_s, positions
+
+
+async def replay(
+    store: PositionStore, asset_ids: Sequence[str], since: float, until: float,
+    speed: float = 1.0, frame_s: float = 1.0,
+):
+    """Async frames paced at `speed`x real time (frame_s / speed between frames)."""
+    tracks = await asyncio.to_thread(store.range_many, asset_ids, since, until)
+    previous = None
+    for frame_start, positions in replay_frames(tracks, since, until, frame_s):
+        if previous is not None:
+            await asyncio.sleep((frame_start - previous) / speed)
+        previous = frame_start
+        yield frame_start, positions
+
+
+def _build_store() -> Optional[PositionStore]:
+    if np is None or not settings.POSITION_STORE_DIR:
+        return None
+    return PositionStore(settings.POSITION_STORE_DIR)
+
+
+position_store = _build_store()
@@ -1,8 +1,239 @@
 from typing import List, Optional, Dict, Any
 from src.infrastructure.database import db
+from src.infrastructure.statements import statements
+from src.shared.pagination import Page, build_page, clamp_limit, keyset_query
+from src.fleet.status_history import COMPACTED_UNTIL
 import uuid
 import datetime
 
+GET_STATUS_HISTORY = statements.register(
+    "fleet.get_status_history",
+    """
+    SELECT id, asset_id, status, occurred_at
+    FROM asset_status_history
+    WHERE asset_id = $1 AND occurred_at >= $2 AND occurred_at < $3
+    ORDER BY occurred_at DESC
+    LIMIT $4
+    """,
+)
+# Compacted runs overlapping [$2, $3) plus the raw rows after the compaction
+# watermark (the latest one before $2 gives the status at the window start),
+# collapsed into runs and clipped to the window.
+GET_STATUS_INTERVALS = statements.register(
+    "fleet.get_status_intervals",
+    f"""
+    WITH mark AS (
+      SELECT {COMPACTED_UNTIL} AS w
+    ), timeline AS (
+      SELECT status, started_at AS at FROM asset_status_intervals
+      WHERE asset_id = $1 AND started_at < $3 AND (ended_at IS NULL OR ended_at > $2)
+      UNION ALL
+      (SELECT status, occurred_at FROM asset_status_history
+       WHERE asset_id = $1 AND occurred_at > (SELECT w FROM mark) AND occurred_at <= $2
+       ORDER BY occurred_at DESC LIMIT 1)
+      UNION ALL
+      SELECT status, occurred_at FROM asset_status_history
+      WHERE asset_id = $1 AND occurred_at > GREATEST($2, (SELECT w FROM mark)) AND occurred_at < $3
+    ), marked AS (
+      SELECT status, at, status IS DISTINCT FROM LAG(status) OVER (ORDER BY at) AS run_start
+      FROM timeline
+    ), runs AS (
+      SELECT status, at, LEAD(at) OVER (ORDER BY at) AS ended_at
+      FROM marked
+      WHERE run_start
+    )
+    SELECT status, GREATEST(at, $2) AS started_at, ended_at
+    FROM runs
+    WHERE COALESCE(ended_at, $3) > $2
+    ORDER BY at
+    """,
+)
+# Seconds per (asset, status) in [$1, $2), from the same intervals + raw tail
+GET_STATUS_SECONDS = statements.register(
+    "fleet.get_status_seconds",
+    f"""
+    WITH mark AS (
+      SELECT {COMPACTED_UNTIL} AS w
+    ), timeline AS (
+      SELECT asset_id, status, started_at AS at FROM asset_status_intervals
+      WHERE started_at < $2 AND (ended_at IS NULL OR ended_at > $1)
+      UNION ALL
+      SELECT a.id, h.status, h.occurred_at
+      FROM assets a
+      CROSS JOIN LATERAL (
+        SELECT status, occurred_at FROM asset_status_history
+        WHERE asset_id = a.id AND occurred_at > (SELECT w FROM mark) AND occurred_at <= $1
+        ORDER BY occurred_at DESC LIMIT 1
+      ) h
+      UNION ALL
+      SELECT asset_id, status, occurred_at FROM asset_status_history
+      WHERE occurred_at > GREATEST($1, (SELECT w FROM mark)) AND occurred_at < $2
+    ), spans AS (
+      SELECT asset_id, status, at,
+             COALESCE(LEAD(at) OVER (PARTITION BY asset_id ORDER BY at), $2) AS ended_at
+      FROM timeline
+    )
+    SELECT asset_id, status,
+           SUM(EXTRACT(EPOCH FROM LEAST(ended_at, $2) - GREATEST(at, $1)))::float8 AS seconds
+    FROM spans
+    WHERE ended_at > $1 AND at < $2
+    GROUP BY asset_id, status
+    """,
+)
+GET_ASSET = statements.register("fleet.get_asset", "SELECT * FROM assets WHERE id = $1")
+TOUCH_HEARTBEAT = statements.register("fleet.touch_heartbeat", "UPDATE assets SET last_heartbeat = NOW() WHERE id = $1")
+# Status writes are single data-modifying CTE statements: one round trip, atomic,
+# and a history row only when the status actually changes.
+SET_STATUS_WITH_HISTORY = statements.register(
+    "fleet.set_status_with_history",
+    """
+    WITH prev AS (
+      SELECT id, status FROM assets WHERE id = $1 FOR UPDATE
+    ), upd AS (
+      UPDATE assets a
+      SET status = $2, last_heartbeat = NOW()
+      FROM prev
+      WHERE a.id = prev.id
+      RETURNING a.id, a.status, prev.status AS old_status
+    )
+    INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+    SELECT gen_random_uuid(), id, status, NOW() FROM upd
+    WHERE old_status IS DISTINCT FROM status
+    """,
+)
+UPSERT_ASSET = statements.register(
+    "fleet.upsert_asset",
+    """
+    WITH prev AS (
+      SELECT status FROM assets WHERE id = $1
+    ), up AS (
+      INSERT INTO assets (id, asset_type, name, status, last_heartbeat, created_at)
+      VALUES ($1, $2, $3, $4, NOW(), NOW())
+      ON CONFLICT (id) DO UPDATE
+      SET status = EXCLUDED.status,
+          last_heartbeat = NOW(),
+          name = EXCLUDED.name
+      RETURNING id, status
+    ), hist AS (
+      INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+      SELECT gen_random_uuid(), up.id, up.status, NOW() FROM up
+      WHERE up.status IS DISTINCT FROM (SELECT status FROM prev)
+    )
+    SELECT id FROM up
+    """,
+)
+APPLY_STATUS_CHANGES = statements.register(
+    "fleet.apply_status_changes",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, status FROM unnest($1::text[], $2::text[]) AS t(id, status)
+    ), prev AS (
+      SELECT a.id, a.status FROM assets a JOIN input i ON i.id = a.id
+      ORDER BY a.id
+      FOR UPDATE OF a
+    ), upd AS (
+      UPDATE assets a
+      SET status = i.status, last_heartbeat = NOW()
+      FROM input i JOIN prev p ON p.id = i.id
+      WHERE a.id = i.id
+      RETURNING a.id, a.status, p.status AS old_status
+    )
+    INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+    SELECT gen_random_uuid(), id, status, NOW() FROM upd
+    WHERE old_status IS DISTINCT FROM status
+    """,
+)
+# Bulk registration: upsert every asset and write history for new or changed
+# statuses, all in one statement. old_status (NULL for new assets) tells new assets from
+# re-registrations and status changes.
+UPSERT_ASSETS_BULK = statements.register(
+    "fleet.upsert_assets_bulk",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, asset_type, name, status
+      FROM unnest($1::text[], $2::text[], $3::text[], $4::text[]) AS t(id, asset_type, name, status)
+    ), prev AS (
+      SELECT a.id, a.status FROM assets a JOIN input i ON i.id = a.id
+      ORDER BY a.id
+      FOR UPDATE OF a
+    ), up AS (
+      INSERT INTO assets (id, asset_type, name, status, last_heartbeat, created_at)
+      SELECT id, asset_type, name, status, NOW(), NOW() FROM input
+      ON CONFLICT (id) DO UPDATE
+      SET status = EXCLUDED.status,
+          last_heartbeat = NOW(),
+          name = EXCLUDED.name,
+          asset_type = EXCLUDED.asset_type
+      RETURNING id, status
+    ), hist AS (
+      INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+      SELECT gen_random_uuid(), up.id, up.status, NOW()
+      FROM up LEFT JOIN prev p ON p.id = up.id
+      WHERE up.status IS DISTINCT FROM p.status
+    )
+    SELECT up.id, p.status AS old_status FROM up LEFT JOIN prev p ON p.id = up.id
+    """,
+)
+# APPLY_STATUS_CHANGES returning every matched asset with its previous status
+SET_STATUSES_BULK = statements.register(
+    "fleet.set_statuses_bulk",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, status FROM unnest($1::text[], $2::text[]) AS t(id, status)
+    ), prev AS (
+      SELECT a.id, a.status FROM assets a JOIN input i ON i.id = a.id
+      ORDER BY a.id
+      FOR UPDATE OF a
+    ), upd AS (
+      UPDATE assets a
+      SET status = i.status, last_heartbeat = NOW()
+      FROM input i JOIN prev p ON p.id = i.id
+      WHERE a.id = i.id
+      RETURNING a.id, a.status, p.status AS old_status
+    ), hist AS (
+      INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+      SELECT gen_random_uuid(), id, status, NOW() FROM upd
+      WHERE old_status IS DISTINCT FROM status
+    )
+    SELECT id, old_status, status FROM upd
+    """,
+)
+# Coalesced telemetry flush: one row per asset, last write wins for every field.
+# NULL fields keep the stored value; history only on a real status change.
+APPLY_TELEMETRY = statements.register(
+    "fleet.apply_telemetry",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, status, x, y, zone_id, driver_name, reported_at
+      FROM unnest($1::text[], $2::text[], $3::float8[], $4::float8[], $5::text[], $6::text[], $7::timestamptz[])
+        AS t(id, status, x, y, zone_id, driver_name, reported_at)
+    ), prev AS (
+      SELECT a.id, a.status FROM assets a JOIN input i ON i.id = a.id
+      ORDER BY a.id
+      FOR UPDATE OF a
+    ), upd AS (
+      UPDATE assets a
+      SET status = COALESCE(i.status, a.status),
+          last_heartbeat = i.reported_at,
+          location_x = COALESCE(i.x, a.location_x),
+          location_y = COALESCE(i.y, a.location_y),
+          zone_id = COALESCE(i.zone_id, a.zone_id),
+          driver_name = COALESCE(i.driver_name, a.driver_name)
+      FROM input i JOIN prev p ON p.id = i.id
+      WHERE a.id = i.id
+      RETURNING a.id, a.status, p.status AS old_status, i.reported_at
+    )
+    INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+    SELECT gen_random_uuid(), id, status, reported_at FROM upd
+    WHERE old_status IS DISTINCT FROM status
+    """,
+)
+
+# Field order of the APPLY_TELEMETRY arrays after the id
+TELEMETRY_FIELDS = ("status", "x", "y", "zone_id", "driver_name", "reported_at")
+
+ASSET_LIST_COLUMNS = ("id", "asset_type", "name", "status", "last_heartbeat", "created_at")
+
 class AssetRepository:
     """
     Persistence Adapter for Fleet Context.
@@ -19,12 +250,8 @@ class AssetRepository:
             return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(val)))
 
     def _serialize_row(self, row: Any) -> Dict[str, Any]:
-        """Convert asyncpg Row to dict and stringify UUIDs."""
-        record = dict(row)
-        for key, val in record.items():
-            if isinstance(val, uuid.UUID):
-                record[key] = str(val)
-        return record
+        """Convert asyncpg Row to dict. UUIDs already decode to str (pool codec, see database.py)."""
+        return dict(row)
 
     async def upsert_asset(self, asset_data: Dict[str, Any]) -> str:
         """
@@ -41,66 +268,167 @@ class AssetRepository:
         name = asset_data.get('name', raw_id)
         status = asset_data.get('status', 'Unknown')
         
-        await pool.execute(
-            """
-            INSERT INTO assets (id, asset_type, name, status, last_heartbeat, created_at)
-            VALUES ($1, $2, $3, $4, NOW(), NOW())
-            ON CONFLICT (id) DO UPDATE
-            SET status = EXCLUDED.status,
-                last_heartbeat = NOW(),
-                name = EXCLUDED.name
-            """,
-            db_id, asset_type, name, status
-        )
+        await statements.fetchval(pool, UPSERT_ASSET, db_id, asset_type, name, status)
+        db.mark_write()
         return db_id
 
     async def update_heartbeat(self, asset_id: str, status: Optional[str] = None) -> None:
         """
-        Lightweight heartbeat update.
+        Lightweight heartbeat update. A reported status goes through the same
+        single-statement update + history write as update_status_with_history.
         """
         pool = await db.get_pool()
         db_id = self._generate_uuid_from_string(asset_id)
         
         if status:
-             await pool.execute(
-                "UPDATE assets SET last_heartbeat = NOW(), status = $1 WHERE id = $2",
-                status, db_id
-             )
+             await statements.execute(pool, SET_STATUS_WITH_HISTORY, db_id, status)
         else:
-             await pool.execute(
-                "UPDATE assets SET last_heartbeat = NOW() WHERE id = $1",
-                db_id
-             )
+             await statements.execute(pool, TOUCH_HEARTBEAT, db_id)
+
+    async def get_live_rows(self) -> List[Any]:
+        """Every asset with its last reported position, for warming LiveFleetState."""
+        pool = await db.get_pool()
+        return await pool.fetch(
+            """
+            SELECT id, asset_type, name, status, zone_id, location_x, location_y, driver_name, last_heartbeat
+            FROM assets
+            """
+        )
 
     async def get_asset(self, asset_id: str) -> Optional[Dict[str, Any]]:
         pool = await db.get_pool()
         db_id = self._generate_uuid_from_string(asset_id)
-        row = await pool.fetchrow("SELECT * FROM assets WHERE id = $1", db_id)
+        row = await statements.fetchrow(pool, GET_ASSET, db_id)
         return self._serialize_row(row) if row else None
         
-    async def get_all_assets(self) -> List[Dict[str, Any]]:
-         pool = await db.get_pool()
-         rows = await pool.fetch("SELECT * FROM assets")
-         return [self._serialize_row(row) for row in rows]
+    async def get_all_assets(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        asset_type: Optional[str] = None,
+    ) -> Page:
+        """Newest first, keyset-paginated on (created_at, id)."""
+        limit = clamp_limit(limit)
+        sql, args = keyset_query(
+            "assets", ASSET_LIST_COLUMNS, {"status": status, "asset_type": asset_type}, cursor, limit
+        )
+        pool = await db.get_read_pool()
+        rows = await pool.fetch(sql, *args)
+        return build_page(rows, limit, self._serialize_row)
+
     async def update_status_with_history(self, asset_id: str, status: str) -> None:
         """
-        Updates status and logs history.
+        Updates status and logs history in one atomic statement.
+        History is only written when the status actually changes.
         """
         pool = await db.get_pool()
         db_id = self._generate_uuid_from_string(asset_id)
-        
-        # 1. Update Asset
-        await pool.execute(
-            "UPDATE assets SET status = $1, last_heartbeat = NOW() WHERE id = $2",
-            status, db_id
-        )
-        
-        # 2. Insert History
-        hist_id = str(uuid.uuid4())
-        await pool.execute(
-            """
-            INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
-            VALUES ($1, $2, $3, NOW())
-            """,
-            hist_id, db_id, status
+        await statements.execute(pool, SET_STATUS_WITH_HISTORY, db_id, status)
+        db.mark_write()
+
+    async def apply_status_changes(self, changes: Dict[str, str]) -> int:
+        """
+        Bulk variant: {asset_id: status} applied with one unnest statement.
+        Unknown assets are ignored. Returns the number of real status changes.
+        """
+        if not changes:
+            return 0
+        # Last write wins per asset: UPDATE ... FROM must not see duplicate targets
+        latest = {self._generate_uuid_from_string(k): v for k, v in changes.items()}
+        pool = await db.get_pool()
+        result = await statements.execute(pool, APPLY_STATUS_CHANGES, list(latest.keys()), list(latest.values()))
+        db.mark_write()
+        try:
+            return int(result.split(" ")[-1])
+        except (AttributeError, IndexError, ValueError):
+            return 0
+
+    async def upsert_assets_bulk(self, assets: List[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        Registers many assets ({id, type, name, status}) with one statement.
+        Ids map like upsert_asset. Returns {db_id: previous status}, None for
+        assets inserted by this call.
+        """
+        if not assets:
+            return {}
+        latest = {self._generate_uuid_from_string(a['id']): a for a in assets}
+        pool = await db.get_pool()
+        rows = await statements.fetch(
+            pool, UPSERT_ASSETS_BULK,
+            list(latest.keys()),
+            [a.get('type', 'Unknown') for a in latest.values()],
+            [a.get('name', a['id']) for a in latest.values()],
+            [a.get('status', 'Unknown') for a in latest.values()],
         )
+        db.mark_write()
+        return {row['id']: row['old_status'] for row in rows}
+
+    async def set_statuses_bulk(self, changes: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Like apply_status_changes, but returns {db_id: previous status} for every
+        matched asset (unknown ids are absent).
+        """
+        if not changes:
+            return {}
+        latest = {self._generate_uuid_from_string(k): v for k, v in changes.items()}
+        pool = await db.get_pool()
+        rows = await statements.fetch(pool, SET_STATUSES_BULK, list(latest.keys()), list(latest.values()))
+        db.mark_write()
+        return {row['id']: row['old_status'] for row in rows}
+
+    async def apply_telemetry(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Flushes coalesced telemetry {asset_id: {field: value}} (see TELEMETRY_FIELDS)
+        with one unnest statement. Unknown assets are ignored.
+        Returns the number of status changes written to history.
+        """
+        if not updates:
+            return 0
+        latest = {self._generate_uuid_from_string(k): v for k, v in updates.items()}
+        columns = [list(latest.keys())] + [[u.get(f) for u in latest.values()] for f in TELEMETRY_FIELDS]
+        pool = await db.get_pool()
+        result = await statements.execute(pool, APPLY_TELEMETRY, *columns)
+        try:
+            return int(result.split(" ")[-1])
+        except (AttributeError, IndexError, ValueError):
+            return 0
+
+    async def get_status_history(
+        self,
+        asset_id: str,
+        since: datetime.datetime,
+        until: Optional[datetime.datetime] = None,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """
+        Status history within [since, until).
+        The explicit occurred_at bounds let Postgres prune daily partitions.
+        """
+        pool = await db.get_pool()
+        db_id = self._generate_uuid_from_string(asset_id)
+        until = until or datetime.datetime.now(datetime.timezone.utc)
+        rows = await statements.fetch(pool, GET_STATUS_HISTORY, db_id, since, until, limit)
+        return [self._serialize_row(row) for row in rows]
+
+    async def get_status_intervals(
+        self,
+        asset_id: str,
+        since: datetime.datetime,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Status runs within [since, until), oldest first: compacted intervals plus
+        raw rows not compacted yet. ended_at is None for the run still in progress at until.
+        """
+        pool = await db.get_read_pool()
+        db_id = self._generate_uuid_from_string(asset_id)
+        until = until or datetime.datetime.now(datetime.timezone.utc)
+        rows = await statements.fetch(pool, GET_STATUS_INTERVALS, db_id, since, until)
+        return [self._serialize_row(row) for row in rows]
+
+    async def get_status_seconds(self, since: datetime.datetime, until: datetime.datetime) -> List[Dict[str, Any]]:
+        """Seconds each asset spent in each status within [since, until)."""
+        pool = await db.get_read_pool()
+        rows = await statements.fetch(pool, GET_STATUS_SECONDS, since, until)
+        return [self._serialize_row(row) for row in rows]
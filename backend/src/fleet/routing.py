@@ -0,0 +1,269 @@
+import heapq
+import json
+import math
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.fleet.geofence import GeofenceIndex, load_zones
+from src.fleet.overspeed import ZONE_SPEED_LIMITS_KMH
+from src.fleet.spatial import SpatialIndex
+from src.infrastructure.settings import settings
+
+Segment = FrozenSet[str]
+
+# Service roads on the ops map (same 800x600 space as the geofences): three
+# east-west roads per zone band, north-south links every 100 units inside a
+# zone, and a few gates between zones.
+_ROWS = {"A": (40, 120, 200), "P": (280, 360), "L": (460, 540)}
+_GATES = {("A", "P"): (200, 600), ("P", "L"): (100, 400, 700)}
+
+
+def _default_network() -> Dict[str, Any]:
+    nodes: Dict[str, Tuple[float, float]] = {}
+    edges: List[Tuple[str, str]] = []
+    for band, rows in _ROWS.items():
+        for r, y in enumerate(rows):
+            for col in range(9):
+                node = f"{band}{r}-{col}"
+                nodes[node] = (col * 100.0, float(y))
+                if col:
+                    edges.append((f"{band}{r}-{col - 1}", node))
+                if r:
+                    edges.append((f"{band}{r - 1}-{col}", node))
+    for (upper, lower), columns in _GATES.items():
+        last = len(_ROWS[upper]) - 1
+        for x in columns:
+            edges.append((f"{upper}{last}-{x // 100}", f"{lower}0-{x // 100}"))
+    return {"nodes": {n: list(p) for n, p in nodes.items()}, "edges": [list(e) for e in edges]}
+
+
+def segment(a: str, b: str) -> Segment:
+    return frozenset((a, b))
+
+
+class Route:
+    __slots__ = ("nodes", "seconds", "meters")
+
+    def __init__(self, nodes: List[str], seconds: float, meters: float):
+        self.nodes = nodes
+        self.seconds = seconds
+        self.meters = meters
+
+    def segments(self) -> Iterable[Segment]:
+        return (segment(a, b) for a, b in zip(self.nodes, self.nodes[1:]))
+
+
+class NoRouteError(Exception):
+    def __init__(self, source: str, target: str):
+        super().__init__(f"No open route from {source} to {target}")
+
+
+class RoadGraph:
+    """
+    Undirected service-road graph weighted by travel time (seconds at the
+    lowest posted limit of the zones an edge touches).
+
+    Routing is A* with ALT lower bounds: exact shortest times from a few
+    landmark nodes, so |d(L, v) - d(L, t)| never overestimates d(v, t).
+    Closing a segment only lengthens paths, which keeps the bounds valid,
+    so closures drop only the cached routes/trees that used the segment;
+    reopening can shorten paths, so it recomputes the landmark tables and
+    clears every cache.
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, Sequence[float]],
+        edges: Iterable[Sequence[str]],
+        zones: Optional[GeofenceIndex] = None,
+        meters_per_unit: Optional[float] = None,
+        landmarks: int = 4,
+        cache_size: int = 4096,
+    ):
+        self.meters_per_unit = meters_per_unit or settings.ROUTING_METERS_PER_MAP_UNIT
+        self.positions = {node: (float(p[0]), float(p[1])) for node, p in nodes.items()}
+        zones = zones or GeofenceIndex(load_zones())
+        self._adjacency: Dict[str, Dict[str, Tuple[float, float]]] = {node: {} for node in self.positions}
+        for a, b in edges:
+            meters = math.dist(self.positions[a], self.positions[b]) * self.meters_per_unit
+            speed = min(self._speed_at(zones, *self.positions[a]), self._speed_at(zones, *self.positions[b]))
+            seconds = meters / (speed / 3.6)
+            self._adjacency[a][b] = self._adjacency[b][a] = (seconds, meters)
+        self.closed: Set[Segment] = set()
+        self.snap_index = SpatialIndex(cell_size=100.0)
+        for node, (x, y) in self.positions.items():
+            self.snap_index.update(node, x, y)
+
+        self._landmark_count = min(landmarks, len(self.positions))
+        self._landmarks: List[Dict[str, float]] = []
+        self.cache_size = cache_size
+        self._routes: "OrderedDict[Tuple[str, str], Route]" = OrderedDict()
+        self._trees: "OrderedDict[str, Tuple[Dict[str, float], Dict[str, str]]]" = OrderedDict()
+        self._build_landmarks()
+
+    @staticmethod
+    def _speed_at(zones: GeofenceIndex, x: float, y: float) -> float:
+        limits = [ZONE_SPEED_LIMITS_KMH[z] for z in zones.zones_at(x, y) if z in ZONE_SPEED_LIMITS_KMH]
+        return min(limits) if limits else settings.OVERSPEED_DEFAULT_LIMIT_KMH
+
+    # --- graph -----------------------------------------------------------------
+
+    def _neighbours(self, node: str):
+        for other, (seconds, meters) in self._adjacency[node].items():
+            if segment(node, other) not in self.closed:
+                yield other, seconds, meters
+
+    def _dijkstra(self, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+        dist = {source: 0.0}
+        parent: Dict[str, str] = {}
+        heap = [(0.0, source)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            for other, seconds, _ in self._neighbours(node):
+                nd = d + seconds
+                if nd < dist.get(other, math.inf):
+                    dist[other] = nd
+                    parent[other] = node
+                    heapq.heappush(heap, (nd, other))
+        return dist, parent
+
+    def _build_landmarks(self) -> None:
+        # Farthest-first selection spreads landmarks to the map's edges
+        self._landmarks = []
+        if not self._landmark_count:
+            return
+        current = min(self.positions, key=lambda n: self.positions[n])
+        for _ in range(self._landmark_count):
+            table, _ = self._dijkstra(current)
+            self._landmarks.append(table)
+            covered = [min(t.get(n, math.inf) for t in self._landmarks) for n in self.positions]
+            reachable = [(c, n) for c, n in zip(covered, self.positions) if c != math.inf]
+            current = max(reachable)[1]
+
+    def _heuristic(self, node: str, target: str) -> float:
+        best = 0.0
+        for table in self._landmarks:
+            a, b = table.get(node), table.get(target)
+            if a is not None and b is not None:
+                best = max(best, abs(a - b))
+        return best
+
+    def snap(self, x: float, y: float) -> Tuple[str, float]:
+        """Nearest road node to a map point, and the straight-line meters to it."""
+        (units, node), = self.snap_index.nearest(x, y, 1)
+        return node, units * self.meters_per_unit
+
+    # --- queries ---------------------------------------------------------------
+
+    def route(self, source: str, target: str) -> Route:
+        key = (source, target)
+        cached = self._routes.get(key)
+        if cached is not None:
+            self._routes.move_to_end(key)
+            return cached
+        route = self._astar(source, target)
+        self._routes[key] = route
+        if len(self._routes) > self.cache_size:
+            self._routes.popitem(last=False)
+        return route
+
+    def _astar(self, source: str, target: str) -> Route:
+        g = {source: 0.0}
+        meters = {source: 0.0}
+        parent: Dict[str, str] = {}
+        heap = [(self._heuristic(source, target), source)]
+        while heap:
+            _, node = heapq.heappop(heap)
+            if node == target:
+                path = [node]
+                while path[-1] != source:
+                    path.append(parent[path[-1]])
+                path.reverse()
+                return Route(path, g[target], meters[target])
+            for other, seconds, length in self._neighbours(node):
+                candidate = g[node] + seconds
+                if candidate < g.get(other, math.inf):
+                    g[other] = candidate
+                    meters[other] = meters[node] + length
+                    parent[other] = node
+                    heapq.heappush(heap, (candidate + self._heuristic(other, target), other))
+        raise NoRouteError(source, target)
+
+    def times_to(self, target: str) -> Dict[str, float]:
+        """Travel seconds from every reachable node to target (one Dijkstra, cached)."""
+        cached = self._trees.get(target)
+        if cached is None:
+            cached = self._trees[target] = self._dijkstra(target)
+            if len(self._trees) > self.cache_size // 16:
+                self._trees.popitem(last=False)
+        else:
+            self._trees.move_to_end(target)
+        return cached[0]
+
+    def etas(
+        self, origins: Dict[str, Tuple[float, float]], x: float, y: float, offroad_kmh: float = 10.0
+    ) -> Dict[str, Optional[float]]:
+        """
+        Seconds for each origin (id -> map point) to reach (x, y): snap to the
+        nearest road node at offroad_kmh, then the road network. One shortest
+        path tree per destination serves every candidate. None = unreachable.
+        """
+        target, tail = self.snap(x, y)
+        tree = self.times_to(target)
+        offroad = offroad_kmh / 3.6
+        result: Dict[str, Optional[float]] = {}
+        for origin, (ox, oy) in origins.items():
+            node, head = self.snap(ox, oy)
+            seconds = tree.get(node)
+            result[origin] = None if seconds is None else seconds + (head + tail) / offroad
+        return result
+
+    # --- closures --------------------------------------------------------------
+
+    def close_segment(self, a: str, b: str) -> bool:
+        if b not in self._adjacency.get(a, {}):
+            raise KeyError(f"No road segment {a} - {b}")
+        seg = segment(a, b)
+        if seg in self.closed:
+            return False
+        self.closed.add(seg)
+        for key in [k for k, r in self._routes.items() if seg in set(r.segments())]:
+            del self._routes[key]
+        for target in [t for t, (_, parent) in self._trees.items() if parent.get(a) == b or parent.get(b) == a]:
+            del self._trees[target]
+        return True
+
+    def reopen_segment(self, a: str, b: str) -> bool:
+        seg = segment(a, b)
+        if seg not in self.closed:
+            return False
+        self.closed.discard(seg)
+        self._routes.clear()
+        self._trees.clear()
+        self._build_landmarks()
+        return True
+
+    def segments(self) -> List[Tuple[str, str]]:
+        return sorted({tuple(sorted((a, b))) for a, nbrs in self._adjacency.items() for b in nbrs})
+
+
+def load_network(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Road network from a JSON file ({"nodes": {id: [x, y]}, "edges": [[a, b], ...]})
+    or the built-in service roads when no file is configured.
+    """
+    path = path or settings.ROUTING_GRAPH_FILE
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return _default_network()
+
+
+def _build_graph() -> RoadGraph:
+    network = load_network()
+    return RoadGraph(network["nodes"], network["edges"])
+
+
+road_graph = _build_graph()
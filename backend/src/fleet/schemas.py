@@ -1,15 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from src.infrastructure.settings import settings
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 class AssetResponse(BaseModel):
     id: str
     asset_type: str
     name: str
     status: str
-    location: Optional[dict] = None # { lat: float, lng: float }
+    location: Optional[dict] = None # { lat: float, lng: float } (demo) or map { x: float, y: float }
+    zone_id: Optional[str] = None
     driver: Optional[str] = None
-    speed_kmh: Optional[int] = 0
+    last_heartbeat_utc: Optional[datetime] = None
+    speed_kmh: Optional[float] = 0
     stream_url: Optional[str] = None
 
 class AssetCreateRequest(BaseModel):
@@ -22,3 +25,85 @@ class AssetStatusUpdateRequest(BaseModel):
 class AssetStatusUpdateResponse(BaseModel):
     status: str
     updated_at_utc: datetime
+
+class BulkAssetCreate(AssetCreateRequest):
+    id: Optional[str] = None  # external id (e.g. fleet number); re-registering it updates the asset
+    status: Optional[str] = None  # defaults to idle
+
+class BulkAssetCreateRequest(BaseModel):
+    assets: List[BulkAssetCreate] = Field(..., min_length=1, max_length=settings.BULK_ASSETS_MAX)
+
+class BulkAssetResult(BaseModel):
+    id: str
+    db_id: Optional[str] = None
+    name: str
+    asset_type: str
+    status: str
+    result: str  # created | updated | duplicate
+
+class BulkAssetCreateResponse(BaseModel):
+    created: int
+    results: List[BulkAssetResult]
+
+class BulkStatusUpdate(AssetStatusUpdateRequest):
+    asset_id: str
+
+class BulkStatusUpdateRequest(BaseModel):
+    updates: List[BulkStatusUpdate] = Field(..., min_length=1, max_length=settings.BULK_ASSETS_MAX)
+
+class BulkStatusResult(BaseModel):
+    asset_id: str
+    status: str
+    result: str  # changed | unchanged | not_found | duplicate
+
+class BulkStatusUpdateResponse(BaseModel):
+    changed: int
+    updated_at_utc: datetime
+    results: List[BulkStatusResult]
+
+class DispatchCandidate(AssetResponse):
+    distance: float  # map units from the requested point
+    eta_s: Optional[float] = None  # road travel time, when ranked by ETA
+
+class RouteResponse(BaseModel):
+    nodes: List[str]
+    path: List[dict]  # [{x, y}] road nodes in travel order
+    meters: float
+    eta_s: float
+
+class RoadSegment(BaseModel):
+    a: str
+    b: str
+
+class StatusInterval(BaseModel):
+    status: str
+    started_at: datetime
+    ended_at: Optional[datetime] = None  # None: still in this status at the end of the window
+
+class UptimeStats(BaseModel):
+    observed_s: float
+    uptime_pct: float
+    utilisation_pct: float
+
+class AssetUptime(UptimeStats):
+    asset_id: str
+    seconds: Dict[str, float]  # by status
+
+class FleetUptime(UptimeStats):
+    assets: int
+
+class UptimeResponse(BaseModel):
+    since: datetime
+    until: datetime
+    fleet: FleetUptime
+    assets: List[AssetUptime]
+
+class TrackPoint(BaseModel):
+    ts_utc: datetime
+    x: float
+    y: float
+    speed_kmh: Optional[float] = None
+
+class TrackResponse(BaseModel):
+    asset_id: str
+    points: List[TrackPoint]
@@ -1,15 +1,149 @@
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from src.fleet.repository import AssetRepository
+from src.fleet.telemetry import TelemetryCoalescer, telemetry_coalescer
+from src.fleet.live_state import AssetState, LiveFleetState, live_fleet_state
+from src.fleet.geofence import GeofenceEngine, geofence_engine
+from src.fleet.overspeed import OverspeedDetector, overspeed_detector
+from src.fleet.routing import RoadGraph, road_graph
+from src.fleet.status_history import status_summary
+from src.fleet.positions import PositionStore, downsample, position_store, replay as replay_positions
+from src.shared.pagination import Page
+from src.infrastructure.settings import settings
 from src.shared.event_bus import event_bus
+import asyncio
+import logging
+import math
 import uuid
 
+logger = logging.getLogger(__name__)
+
+def _coordinate(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+class PositionHistoryUnavailableError(Exception):
+    def __init__(self):
+        super().__init__("Position history is not enabled (requires numpy and POSITION_STORE_DIR)")
+
 class FleetService:
-    def __init__(self, repository: AssetRepository = None):
+    def __init__(
+        self,
+        repository: AssetRepository = None,
+        telemetry: TelemetryCoalescer = None,
+        live_state: LiveFleetState = None,
+        geofences: GeofenceEngine = None,
+        overspeed: OverspeedDetector = None,
+        positions: Optional[PositionStore] = None,
+        roads: RoadGraph = None,
+    ):
         self.repository = repository or AssetRepository()
+        self.telemetry = telemetry or telemetry_coalescer
+        self.live_state = live_state if live_state is not None else live_fleet_state
+        self.geofences = geofences or geofence_engine
+        self.overspeed = overspeed or overspeed_detector
+        # None when numpy or POSITION_STORE_DIR is missing
+        self.positions = positions if positions is not None else position_store
+        self.roads = roads or road_graph
+
+    async def list_assets(self, limit: int = 50, cursor: Optional[str] = None, **filters) -> Page:
+        return await self.repository.get_all_assets(limit=limit, cursor=cursor, **filters)
+
+    async def warm_live_state(self) -> int:
+        return self.live_state.load(await self.repository.get_live_rows())
 
-    async def list_assets(self) -> List[Dict[str, Any]]:
-        return await self.repository.get_all_assets()
+    def live_assets(self, since_version: Optional[int] = None) -> Tuple[int, List[AssetState]]:
+        """(version, assets): full snapshot, or only assets changed after since_version."""
+        if since_version is None:
+            return self.live_state.snapshot()
+        return self.live_state.changes_since(since_version)
+
+    def nearest_available(
+        self,
+        x: float,
+        y: float,
+        k: int = 5,
+        asset_types: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        max_distance: Optional[float] = None,
+        rank: str = "distance",
+    ) -> List[Dict[str, Any]]:
+        """
+        Dispatch candidates: the k closest assets to (x, y) in an available status.
+        rank="eta" takes the DISPATCH_ETA_CANDIDATES closest in a straight line and
+        orders them by road travel time instead (unreachable ones last).
+        """
+        pool = max(k, settings.DISPATCH_ETA_CANDIDATES) if rank == "eta" else k
+        hits = self.live_state.nearest(
+            x, y, pool,
+            asset_types=asset_types,
+            statuses=statuses or settings.DISPATCH_AVAILABLE_STATUSES,
+            max_distance=max_distance,
+        )
+        etas: Dict[str, Optional[float]] = {}
+        if rank == "eta" and hits:
+            origins = {state.asset_id: (state.x, state.y) for _, state in hits}
+            etas = self.roads.etas(origins, x, y, settings.ROUTING_OFFROAD_KMH)
+            hits.sort(key=lambda hit: (etas[hit[1].asset_id] is None, etas[hit[1].asset_id] or 0.0, hit[0]))
+        return [
+            {
+                **state.to_dict(),
+                "distance": round(distance, 2),
+                "eta_s": None if etas.get(state.asset_id) is None else round(etas[state.asset_id], 1),
+            }
+            for distance, state in hits[:k]
+        ]
+
+    def route_between(self, from_x: float, from_y: float, to_x: float, to_y: float) -> Dict[str, Any]:
+        """Fastest open road route between two map points (raises NoRouteError)."""
+        source, head = self.roads.snap(from_x, from_y)
+        target, tail = self.roads.snap(to_x, to_y)
+        route = self.roads.route(source, target)
+        offroad_s = (head + tail) / (settings.ROUTING_OFFROAD_KMH / 3.6)
+        return {
+            "nodes": route.nodes,
+            "path": [{"x": self.roads.positions[n][0], "y": self.roads.positions[n][1]} for n in route.nodes],
+            "meters": round(route.meters + head + tail, 1),
+            "eta_s": round(route.seconds + offroad_s, 1),
+        }
+
+    async def status_intervals(self, asset_id: str, since: datetime, until: datetime) -> List[Dict[str, Any]]:
+        return await self.repository.get_status_intervals(asset_id, since, until)
+
+    async def uptime(self, since: datetime, until: datetime) -> Dict[str, Any]:
+        """Per-asset and fleet-wide uptime/utilisation over [since, until)."""
+        rows = await self.repository.get_status_seconds(since, until)
+        return {"since": since, "until": until, **status_summary(rows)}
+
+    def _require_positions(self) -> PositionStore:
+        if self.positions is None:
+            raise PositionHistoryUnavailableError()
+        return self.positions
+
+    async def get_track(
+        self, asset_id: str, since: datetime, until: datetime, bucket_s: float = 0
+    ) -> List[Dict[str, Any]]:
+        """Positions of one asset in [since, until), optionally averaged per bucket_s."""
+        store = self._require_positions()
+        cols = await asyncio.to_thread(store.range, asset_id, since.timestamp(), until.timestamp())
+        if bucket_s:
+            cols = downsample(cols, bucket_s)
+        return [
+            {
+                "ts_utc": datetime.fromtimestamp(ts, timezone.utc),
+                "x": x,
+                "y": y,
+                "speed_kmh": None if math.isnan(speed) else speed,
+            }
+            for ts, x, y, speed in zip(cols["ts"].tolist(), cols["x"].tolist(), cols["y"].tolist(), cols["speed"].tolist())
+        ]
+
+    def replay(self, asset_ids: List[str], since: datetime, until: datetime, speed: float = 1.0, frame_s: float = 1.0):
+        """Async iterator of (frame_start, {asset_id: (x, y, speed)}) paced at speed x real time."""
+        store = self._require_positions()
+        return replay_positions(store, asset_ids, since.timestamp(), until.timestamp(), speed=speed, frame_s=frame_s)
 
     async def register_asset(self, asset_type: str, name: str) -> Dict[str, Any]:
         """
@@ -26,6 +160,7 @@ class FleetService:
         
         # Upsert
         db_id = await self.repository.upsert_asset(payload)
+        self.live_state.apply(db_id, status='idle', asset_type=asset_type, name=name)
         
         # Publish
         await event_bus.publish(
@@ -44,6 +179,7 @@ class FleetService:
         """
         # Call new Repo method
         await self.repository.update_status_with_history(asset_id, status)
+        self.live_state.apply(self.repository._generate_uuid_from_string(asset_id), status=status)
         
         # Publish
         await event_bus.publish(
@@ -56,10 +192,195 @@ class FleetService:
         
         return {"status": status, "updated_at_utc": datetime.now(timezone.utc)}
 
+    async def register_assets_bulk(self, assets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Registers many assets: [{asset_type, name, id?, status?}]. A given id
+        (e.g. a GSE fleet number) makes registration idempotent; without one a
+        new uuid is issued. Results in request order:
+        created | updated (id already registered) | duplicate (id repeated in the request).
+        Re-registering with a different status publishes fleet.asset.status_changed.
+        """
+        results: List[Dict[str, Any]] = []
+        accepted: Dict[str, Dict[str, Any]] = {}
+        for asset in assets:
+            raw_id = str(asset.get("id") or uuid.uuid4())
+            status = asset.get("status") or "idle"
+            result = {"id": raw_id, "db_id": None, "name": asset["name"], "asset_type": asset["asset_type"],
+                      "status": status, "result": "pending"}
+            results.append(result)
+            if raw_id in accepted:
+                result["result"] = "duplicate"
+                continue
+            accepted[raw_id] = {"id": raw_id, "type": asset["asset_type"], "name": asset["name"], "status": status}
+
+        previous = await self.repository.upsert_assets_bulk(list(accepted.values()))
+
+        created = 0
+        events = []
+        for result in results:
+            if result["result"] != "pending":
+                continue
+            db_id = self.repository._generate_uuid_from_string(result["id"])
+            result["db_id"] = db_id
+            old_status = previous.get(db_id)
+            result["result"] = "created" if old_status is None else "updated"
+            self.live_state.apply(db_id, status=result["status"], asset_type=result["asset_type"], name=result["name"])
+            if old_status is not None and old_status != result["status"]:
+                events.append({
+                    "event_type": "fleet.asset.status_changed",
+                    "source_context": "fleet",
+                    "correlation_id": str(uuid.uuid4()),
+                    "entity_refs": {"assetId": result["id"]},
+                    "payload": {"asset_id": result["id"], "status": result["status"]},
+                })
+            if result["result"] == "created":
+                created += 1
+                events.append({
+                    "event_type": "fleet.asset.created",
+                    "source_context": "fleet",
+                    "correlation_id": str(uuid.uuid4()),
+                    "entity_refs": {"assetId": result["id"]},
+                    "payload": {"asset_id": result["id"], "name": result["name"], "type": result["asset_type"]},
+                })
+        # One pipelined round trip for every event
+        await event_bus.publish_batch(events)
+        return {"created": created, "results": results}
+
+    async def update_statuses_bulk(self, updates: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Sets many statuses ([{asset_id, status}]) in one statement. Results in
+        request order: changed | unchanged | not_found | duplicate (asset repeated
+        in the request; the first entry is applied).
+        """
+        results: List[Dict[str, Any]] = []
+        accepted: Dict[str, str] = {}
+        for update in updates:
+            result = {"asset_id": update["asset_id"], "status": update["status"], "result": "pending"}
+            results.append(result)
+            if update["asset_id"] in accepted:
+                result["result"] = "duplicate"
+                continue
+            accepted[update["asset_id"]] = update["status"]
+
+        previous = await self.repository.set_statuses_bulk(accepted)
+
+        now = datetime.now(timezone.utc)
+        events = []
+        for result in results:
+            if result["result"] != "pending":
+                continue
+            db_id = self.repository._generate_uuid_from_string(result["asset_id"])
+            if db_id not in previous:
+                result["result"] = "not_found"
+                continue
+            self.live_state.apply(db_id, status=result["status"], reported_at=now)
+            if previous[db_id] == result["status"]:
+                result["result"] = "unchanged"
+                continue
+            result["result"] = "changed"
+            events.append({
+                "event_type": "fleet.asset.status_changed",
+                "source_context": "fleet",
+                "correlation_id": str(uuid.uuid4()),
+                "entity_refs": {"assetId": result["asset_id"]},
+                "payload": {"asset_id": result["asset_id"], "status": result["status"]},
+            })
+        await event_bus.publish_batch(events)
+        return {"changed": len(events), "updated_at_utc": now, "results": results}
+
     async def process_telemetry(self, event_type: str, payload: Dict[str, Any]):
         """
-        Handles telemetry events from consumers.
+        Handles telemetry events from consumers: buffered in the coalescer,
+        written in bulk on its next flush (no DB call here).
         """
-        # For now, just log or no-op as this seems to be for demo visualization/updates
-        # The consumer expects this method to exist.
-        pass
+        # Robot events (fleet.robot_patrol_started) carry robotId instead
+        asset_id = payload.get("assetId") or payload.get("asset_id") or payload.get("robotId")
+        if not asset_id:
+            # Poison message: ACK and move on
+            logger.warning(f"Ignoring {event_type} without assetId")
+            return
+        db_id = self.repository._generate_uuid_from_string(asset_id)
+        if self.live_state.get(db_id) is None:
+            # Not registered (live state is loaded from assets and follows registrations):
+            # APPLY_TELEMETRY would ignore it, and a live entry would put it on the map and in dispatch
+            logger.debug(f"Ignoring {event_type} for unregistered asset {asset_id}")
+            return
+
+        location = payload.get("location")
+        if not isinstance(location, dict):
+            location = {}
+        fields = {
+            "status": payload.get("status"),
+            "x": _coordinate(location.get("x", location.get("lon"))),
+            "y": _coordinate(location.get("y", location.get("lat"))),
+            "zone_id": payload.get("zoneId"),
+            "driver_name": payload.get("driverName"),
+            "reported_at": datetime.now(timezone.utc),
+        }
+        speed_kmh = _coordinate(payload.get("speedKmh", payload.get("speed_kmh", payload.get("speed"))))
+        state = self.live_state.apply(
+            db_id,
+            asset_type=payload.get("assetType"),
+            speed_kmh=speed_kmh,
+            **fields,
+        )
+        self.telemetry.submit(str(asset_id), **fields)
+        if self.positions is not None and fields["x"] is not None and fields["y"] is not None:
+            self.positions.append(
+                str(asset_id), state.last_heartbeat.timestamp(), fields["x"], fields["y"],
+                speed_kmh if speed_kmh is not None else float("nan"),
+            )
+
+        events = []
+        if state.x is not None and state.y is not None:
+            events.extend(self._geofence_events(str(asset_id), state))
+        if speed_kmh is not None:
+            events.extend(self._overspeed_events(str(asset_id), state, speed_kmh))
+        if events:
+            await event_bus.publish_batch(events)
+
+    def _fleet_payload(self, asset_id: str, state: AssetState, zone_id: Optional[str]) -> Dict[str, Any]:
+        # Same shape as the simulation's fleet.* events
+        return {
+            "vehicleId": asset_id,
+            "driverName": state.driver_name,
+            "zoneId": zone_id,
+            "location": {"x": state.x, "y": state.y},
+            "timestamp": state.last_heartbeat.isoformat(),
+        }
+
+    def _geofence_events(self, asset_id: str, state: AssetState) -> List[Dict[str, Any]]:
+        """fleet.geofence_breached / fleet.geofence_exited, only when a restricted zone is entered or left."""
+        return [
+            {
+                "event_type": "fleet.geofence_breached" if change == "entered" else "fleet.geofence_exited",
+                "source_context": "fleet",
+                "severity": "critical" if change == "entered" else "info",
+                "correlation_id": str(uuid.uuid4()),
+                "entity_refs": {"assetId": asset_id},
+                "payload": self._fleet_payload(asset_id, state, zone.zone_id),
+            }
+            for zone, change in self.geofences.evaluate(state.asset_id, state.x, state.y)
+            if zone.restricted
+        ]
+
+    def _overspeed_events(self, asset_id: str, state: AssetState, speed_kmh: float) -> List[Dict[str, Any]]:
+        """fleet.overspeed_detected once per sustained violation (the correlation engine raises the incident)."""
+        zones = self.geofences.zones_of(state.asset_id) or ((state.zone_id,) if state.zone_id else ())
+        violation = self.overspeed.observe(state.asset_id, speed_kmh, state.last_heartbeat.timestamp(), zones)
+        if violation is None:
+            return []
+        return [
+            {
+                "event_type": "fleet.overspeed_detected",
+                "source_context": "fleet",
+                "severity": "warning",
+                "correlation_id": str(uuid.uuid4()),
+                "entity_refs": {"assetId": asset_id},
+                "payload": {
+                    **self._fleet_payload(asset_id, state, violation.zone_id),
+                    "speedKmh": round(violation.avg_kmh, 1),
+                    "limitKmh": violation.limit_kmh,
+                },
+            },
+        ]
@@ -0,0 +1,113 @@
+import heapq
+import math
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Uniform grid of point ids for k-nearest queries. Moving a point is a
+    dict lookup plus, when it crosses a cell boundary, two set operations.
+    nearest() scans square rings of cells outwards from the query point
+    and stops once the k-th best distance is closer than any unscanned
+    ring, so it touches only the cells around the answer. Once the rings
+    would visit more cells than are occupied (a query far from every point,
+    or a sparse index) it scans the points once instead, so a query never
+    costs more than O(occupied cells + points).
+    """
+
+    def __init__(self, cell_size: float = 50.0):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[Hashable]] = {}
+        self._points: Dict[Hashable, Tuple[float, float, Cell]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def update(self, key: Hashable, x: float, y: float) -> None:
+        cell = self._cell(x, y)
+        previous = self._points.get(key)
+        if previous is not None and previous[2] != cell:
+            self._discard(key, previous[2])
+        if previous is None or previous[2] != cell:
+            self._cells.setdefault(cell, set()).add(key)
+        self._points[key] = (x, y, cell)
+
+    def remove(self, key: Hashable) -> None:
+        previous = self._points.pop(key, None)
+        if previous is not None:
+            self._discard(key, previous[2])
+
+    def _discard(self, key: Hashable, cell: Cell) -> None:
+        members = self._cells[cell]
+        members.discard(key)
+        if not members:
+            del self._cells[cell]
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        predicate: Optional[Callable[[Hashable], bool]] = None,
+        max_distance: Optional[float] = None,
+    ) -> List[Tuple[float, Hashable]]:
+        """Up to k (distance, key) pairs, closest first, among keys passing predicate."""
+        if k <= 0 or not self._cells:
+            return []
+        cx, cy = self._cell(x, y)
+        # Past this ring every occupied cell has been scanned
+        max_ring = max(max(abs(c[0] - cx), abs(c[1] - cy)) for c in self._cells)
+        best: List[Tuple[float, Hashable]] = []  # max-heap on distance (negated)
+        limit = math.inf if max_distance is None else max_distance
+        visited = 0
+
+        for ring in range(max_ring + 1):
+            # Every point in ring r is at least (r - 1) * cell_size away
+            if ring > 0 and (ring - 1) * self.cell_size > limit:
+                break
+            if len(best) == k and (ring - 1) * self.cell_size > -best[0][0]:
+                break
+            visited += 8 * ring or 1
+            if visited > len(self._cells):
+                # Mostly empty rings from here on: one pass over the points is cheaper
+                best = []
+                self._offer(best, self._points, x, y, k, predicate, limit)
+                break
+            for cell in self._ring(cx, cy, ring):
+                members = self._cells.get(cell)
+                if members:
+                    self._offer(best, members, x, y, k, predicate, limit)
+        return sorted(((-d, key) for d, key in best), key=lambda item: item[0])
+
+    def _offer(self, best, keys, x, y, k, predicate, limit) -> None:
+        for key in keys:
+            px, py, _ = self._points[key]
+            d = math.hypot(px - x, py - y)
+            if d > limit or (len(best) == k and d >= -best[0][0]):
+                continue
+            if predicate is not None and not predicate(key):
+                continue
+            if len(best) == k:
+                heapq.heapreplace(best, (-d, key))
+            else:
+                heapq.heappush(best, (-d, key))
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int):
+        if ring == 0:
+            yield cx, cy
+            return
+        for col in range(cx - ring, cx + ring + 1):
+            yield col, cy - ring
+            yield col, cy + ring
+        for row in range(cy - ring + 1, cy + ring):
+            yield cx - ring, row
+            yield cx + ring, row
@@ -0,0 +1,190 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.infrastructure.settings import settings
+from src.infrastructure.database import db
+from src.infrastructure.partitions import PartitionManager, partition_upper_bound
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "asset_status_intervals"
+
+# Raw rows up to this instant have been folded into asset_status_intervals
+COMPACTED_UNTIL = (
+    f"COALESCE((SELECT watermark FROM rollup_watermarks WHERE name = '{WATERMARK_NAME}'), '-infinity'::timestamptz)"
+)
+
+# Each touched asset's open run, followed by its raw rows in ($1, $2]. A row
+# starts a new run only when its status differs from the previous one; each
+# run ends where the next begins. The open run is closed in place, new runs
+# are inserted, and the asset's last run stays open (ended_at NULL).
+COMPACT_SQL = """
+WITH raw AS (
+    SELECT asset_id, status, occurred_at AS at, false AS carried
+    FROM asset_status_history
+    WHERE occurred_at > $1 AND occurred_at <= $2
+), timeline AS (
+    SELECT asset_id, status, started_at AS at, true AS carried
+    FROM asset_status_intervals
+    WHERE ended_at IS NULL AND asset_id IN (SELECT asset_id FROM raw)
+    UNION ALL
+    SELECT asset_id, status, at, carried FROM raw
+), marked AS (
+    SELECT asset_id, status, at, carried,
+           status IS DISTINCT FROM LAG(status) OVER (PARTITION BY asset_id ORDER BY at, carried DESC) AS run_start
+    FROM timeline
+), runs AS (
+    SELECT asset_id, status, at, carried,
+           LEAD(at) OVER (PARTITION BY asset_id ORDER BY at, carried DESC) AS ended_at
+    FROM marked
+    WHERE run_start
+), closed AS (
+    UPDATE asset_status_intervals i
+    SET ended_at = r.ended_at
+    FROM runs r
+    WHERE r.carried AND r.ended_at IS NOT NULL
+      AND i.asset_id = r.asset_id AND i.started_at = r.at AND i.ended_at IS NULL
+)
+INSERT INTO asset_status_intervals (asset_id, status, started_at, ended_at)
+SELECT asset_id, status, at, ended_at FROM runs
+WHERE NOT carried
+ON CONFLICT (asset_id, started_at) DO NOTHING
+"""
+
+DELETE_COMPACTED_SQL = "DELETE FROM asset_status_history WHERE occurred_at <= $1"
+
+GET_WATERMARK_SQL = "SELECT watermark FROM rollup_watermarks WHERE name = $1"
+SET_WATERMARK_SQL = """
+INSERT INTO rollup_watermarks (name, watermark) VALUES ($1, $2)
+ON CONFLICT (name) DO UPDATE SET watermark = EXCLUDED.watermark
+"""
+
+
+def compaction_cutoff(now: datetime, raw_days: int) -> datetime:
+    """Whole UTC days older than raw_days, so compacted daily partitions can be dropped."""
+    return (now - timedelta(days=raw_days)).astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class StatusHistoryCompactor:
+    """
+    Folds raw asset_status_history rows older than the raw horizon into
+    run-length-encoded asset_status_intervals, then drops them: whole daily
+    partitions are dropped (metadata only), stray rows in the default
+    partition are deleted. The intervals and the watermark commit together,
+    so readers (which take raw rows only after the watermark) never see a
+    status twice or lose one.
+    """
+
+    def __init__(self, pool: Any, raw_days: Optional[int] = None):
+        self.pool = pool
+        self.raw_days = settings.ASSET_HISTORY_RAW_DAYS if raw_days is None else raw_days
+
+    async def compact(self, conn, cutoff: datetime) -> Optional[datetime]:
+        """Returns the previous watermark when the window was compacted, else None."""
+        async with conn.transaction():
+            # Another instance is compacting: skip, it will catch up
+            if not await conn.fetchval("SELECT pg_try_advisory_xact_lock(hashtext($1))", f"compact:{WATERMARK_NAME}"):
+                return None
+            since = await conn.fetchval(GET_WATERMARK_SQL, WATERMARK_NAME)
+            since = since or datetime(1970, 1, 1, tzinfo=timezone.utc)
+            if since >= cutoff:
+                return None
+            await conn.execute(COMPACT_SQL, since, cutoff)
+            await conn.execute(SET_WATERMARK_SQL, WATERMARK_NAME, cutoff)
+        return since
+
+    async def drop_compacted(self, conn, watermark: datetime) -> List[str]:
+        dropped = []
+        for name in await PartitionManager(self.pool).list_partitions(conn, "asset_status_history"):
+            upper = partition_upper_bound(name, "day")
+            if upper is not None and upper <= watermark:
+                await conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+                dropped.append(name)
+        await conn.execute(DELETE_COMPACTED_SQL, watermark)
+        return dropped
+
+    async def run(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        cutoff = compaction_cutoff(now or datetime.now(timezone.utc), self.raw_days)
+        async with self.pool.acquire() as conn:
+            since = await self.compact(conn, cutoff)
+            watermark = await conn.fetchval(GET_WATERMARK_SQL, WATERMARK_NAME)
+            dropped = await self.drop_compacted(conn, watermark) if watermark else []
+        if dropped:
+            logger.info(f"Dropped compacted status history partitions: {dropped}")
+        return {"compacted_from": since, "watermark": watermark, "dropped": dropped}
+
+
+def status_summary(
+    rows: Iterable[Any],
+    down_statuses: Optional[Iterable[str]] = None,
+    busy_statuses: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Uptime and utilisation from (asset_id, status, seconds) rows.
+    uptime = time not in a down status / observed time;
+    utilisation = time in a busy status / up time. Statuses match case-insensitively.
+    """
+    down = {s.lower() for s in (settings.FLEET_DOWN_STATUSES if down_statuses is None else down_statuses)}
+    busy = {s.lower() for s in (settings.FLEET_BUSY_STATUSES if busy_statuses is None else busy_statuses)}
+    assets: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        entry = assets.setdefault(row["asset_id"], {"asset_id": row["asset_id"], "seconds": {}})
+        entry["seconds"][row["status"]] = entry["seconds"].get(row["status"], 0.0) + row["seconds"]
+
+    totals = {"observed_s": 0.0, "up_s": 0.0, "busy_s": 0.0}
+    for entry in assets.values():
+        observed = sum(entry["seconds"].values())
+        up = sum(s for status, s in entry["seconds"].items() if status.lower() not in down)
+        in_use = sum(s for status, s in entry["seconds"].items() if status.lower() in busy and status.lower() not in down)
+        entry.update(_ratios(observed, up, in_use))
+        totals["observed_s"] += observed
+        totals["up_s"] += up
+        totals["busy_s"] += in_use
+
+    fleet = _ratios(totals["observed_s"], totals["up_s"], totals["busy_s"])
+    fleet["assets"] = len(assets)
+    return {"fleet": fleet, "assets": sorted(assets.values(), key=lambda e: e["asset_id"])}
+
+
+def _ratios(observed: float, up: float, busy: float) -> Dict[str, Any]:
+    return {
+        "observed_s": round(observed, 1),
+        # No observed time, no observed downtime
+        "uptime_pct": round(100.0 * up / observed, 2) if observed else 100.0,
+        "utilisation_pct": round(100.0 * busy / up, 2) if up else 0.0,
+    }
+
+
+class StatusHistoryCompaction:
+    """Background task running StatusHistoryCompactor periodically (started at app startup)."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def _loop(self):
+        while self._running:
+            try:
+                pool = await db.get_pool()
+                await StatusHistoryCompactor(pool).run()
+            except Exception as e:
+                logger.error(f"Status history compaction failed: {e}")
+            await asyncio.sleep(settings.ASSET_HISTORY_COMPACTION_INTERVAL_S)
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+status_history_compaction = StatusHistoryCompaction()
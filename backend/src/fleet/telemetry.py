@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from src.infrastructure.settings import settings
+from src.fleet.repository import AssetRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetryCoalescer:
+    """
+    Buffers asset telemetry per asset and flushes it as one bulk statement
+    every TELEMETRY_FLUSH_INTERVAL_S. Last write wins per field, so write
+    volume follows fleet size, not message rate. A status that flips and
+    flips back inside one window is a no-op and leaves no history row.
+    """
+
+    def __init__(self, repository: Optional[AssetRepository] = None, flush_interval_s: Optional[float] = None):
+        self.repository = repository or AssetRepository()
+        self.flush_interval_s = settings.TELEMETRY_FLUSH_INTERVAL_S if flush_interval_s is None else flush_interval_s
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._wake: Optional[asyncio.Event] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        asset_id: str,
+        status: Optional[str] = None,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        zone_id: Optional[str] = None,
+        driver_name: Optional[str] = None,
+        reported_at: Optional[datetime] = None,
+    ) -> None:
+        """O(1), no I/O: merges into the asset's pending entry (None keeps the earlier value)."""
+        fields = {"status": status, "x": x, "y": y, "zone_id": zone_id, "driver_name": driver_name}
+        entry = self._pending.setdefault(asset_id, {})
+        entry.update({k: v for k, v in fields.items() if v is not None})
+        entry["reported_at"] = reported_at or datetime.now(timezone.utc)
+
+    async def flush(self) -> int:
+        """Writes everything pending; returns the number of status changes recorded."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            return await self.repository.apply_telemetry(batch)
+        except BaseException:
+            # Failed or cancelled mid-write: put the batch back under anything
+            # that arrived meanwhile (newer wins)
+            for asset_id, older in batch.items():
+                newer = self._pending.get(asset_id)
+                self._pending[asset_id] = {**older, **newer} if newer else older
+            raise
+
+    async def _loop(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            if not self._running:
+                break
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Telemetry flush failed ({self.pending} assets pending): {e}")
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        # Wake the loop rather than cancel it: a flush in progress finishes first
+        self._running = False
+        if self._task:
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final telemetry flush failed, {self.pending} assets dropped: {e}")
+
+
+telemetry_coalescer = TelemetryCoalescer()
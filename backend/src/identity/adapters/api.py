@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Security
+from fastapi import APIRouter, Depends, HTTPException, status, Security, Query, Response
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from src.identity.service import AuthService, InvalidCredentialsError, InvalidTokenError, InsufficientPermissionsError, AuthError
+from src.shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursorError
+from src.infrastructure.settings import settings
 
 router = APIRouter(tags=["Identity"])
 service = AuthService()
@@ -29,6 +31,19 @@ class CreateUserRequest(BaseModel):
     password: str
     roles: List[str]
 
+class BulkCreateUsersRequest(BaseModel):
+    users: List[CreateUserRequest] = Field(..., min_length=1, max_length=settings.BULK_USERS_MAX)
+
+class BulkUserResult(BaseModel):
+    username: str
+    status: str  # created | exists | duplicate | invalid
+    user_id: Optional[str] = None
+    roles: List[str]
+
+class BulkCreateUsersResponse(BaseModel):
+    created: int
+    results: List[BulkUserResult]
+
 # --- Dependencies ---
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
@@ -97,3 +112,29 @@ async def create_new_user(
         }
     except AuthError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/admin/users", response_model=List[UserResponse])
+async def list_users(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    admin_user: dict = Depends(require_role("admin"))
+):
+    try:
+        page = await service.list_users(limit=limit, cursor=cursor, is_active=is_active)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [
+        {"user_id": user["id"], "username": user["username"], "roles": user["roles"]}
+        for user in page.items
+    ]
+
+@router.post("/admin/users/bulk", response_model=BulkCreateUsersResponse)
+async def create_users_bulk(
+    request: BulkCreateUsersRequest,
+    admin_user: dict = Depends(require_role("admin"))
+):
+    return await service.create_users_bulk([user.model_dump() for user in request.users])
@@ -1,10 +1,39 @@
 from typing import Dict, List, Optional, Any
 from src.infrastructure.database import db
+from src.infrastructure.statements import statements
+from src.shared.pagination import Page, build_page, clamp_limit, keyset_query
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+GET_USER_BY_USERNAME = statements.register("identity.get_user_by_username", "SELECT * FROM users WHERE username = $1")
+GET_USER_BY_ID = statements.register("identity.get_user_by_id", "SELECT * FROM users WHERE id = $1")
+GET_USER_ROLES = statements.register(
+    "identity.get_user_roles",
+    """
+    SELECT r.name
+    FROM roles r
+    JOIN user_roles ur ON r.id = ur.role_id
+    WHERE ur.user_id = $1
+    """,
+)
+
+# Roles and links for any number of (user, role) pairs in one statement each
+UPSERT_ROLES_SQL = """
+    INSERT INTO roles (id, name)
+    SELECT id::uuid, name FROM unnest($1::text[], $2::text[]) AS t(id, name)
+    ON CONFLICT (id) DO NOTHING
+"""
+LINK_ROLES_SQL = """
+    INSERT INTO user_roles (user_id, role_id)
+    SELECT user_id::uuid, role_id::uuid FROM unnest($1::text[], $2::text[]) AS t(user_id, role_id)
+    ON CONFLICT (user_id, role_id) DO NOTHING
+"""
+
+# Never project password_hash into listings
+USER_LIST_COLUMNS = ("id", "username", "is_active", "created_at")
+
 class UserRepository:
     """
     Persistence Adapter for Identity Context.
@@ -18,19 +47,12 @@ class UserRepository:
             return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(val)))
 
     def _serialize_row(self, row: Any) -> Dict[str, Any]:
-        """Convert asyncpg Row to dict and stringify UUIDs."""
-        record = dict(row)
-        for key, val in record.items():
-            if isinstance(val, uuid.UUID):
-                record[key] = str(val)
-        return record
+        """Convert asyncpg Row to dict. UUIDs already decode to str (pool codec, see database.py)."""
+        return dict(row)
 
     async def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         pool = await db.get_pool()
-        row = await pool.fetchrow(
-            "SELECT * FROM users WHERE username = $1", 
-            username
-        )
+        row = await statements.fetchrow(pool, GET_USER_BY_USERNAME, username)
         return self._serialize_row(row) if row else None
 
     async def get_user_with_roles(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -40,19 +62,14 @@ class UserRepository:
         pool = await db.get_pool()
         
         # Get User
-        user_row = await pool.fetchrow("SELECT * FROM users WHERE id = $1", user_id)
+        user_row = await statements.fetchrow(pool, GET_USER_BY_ID, user_id)
         if not user_row:
             return None
             
         user = self._serialize_row(user_row)
         
         # Get Roles
-        rows = await pool.fetch("""
-            SELECT r.name 
-            FROM roles r
-            JOIN user_roles ur ON r.id = ur.role_id
-            WHERE ur.user_id = $1
-        """, user_id)
+        rows = await statements.fetch(pool, GET_USER_ROLES, user_id)
         
         user['roles'] = [r['name'] for r in rows]
         return user
@@ -78,26 +95,79 @@ class UserRepository:
                     VALUES ($1, $2, $3, TRUE, NOW())
                 """, user_id, username, password_hash)
                 
-                # 2. Assign Roles
-                for role_name in roles:
-                    # Role ID is deterministic based on name
-                    role_id = self._generate_uuid_from_string(role_name)
-                    
-                    # Ensure Role Exists (Idempotent)
-                    await conn.execute("""
-                        INSERT INTO roles (id, name) VALUES ($1, $2)
-                        ON CONFLICT (id) DO NOTHING
-                    """, role_id, role_name)
-                    
-                    # Link
-                    await conn.execute("""
-                        INSERT INTO user_roles (user_id, role_id) VALUES ($1, $2)
-                        ON CONFLICT (user_id, role_id) DO NOTHING
-                    """, user_id, role_id)
+                # 2. Assign Roles (two statements whatever the number of roles)
+                await self._assign_roles(conn, [(user_id, role_name) for role_name in roles])
                     
         return user_id
 
-    async def list_users(self) -> List[Dict[str, Any]]:
+    async def _assign_roles(self, conn, pairs: List[tuple]) -> None:
+        """Ensures roles exist (id is deterministic from the name) and links them, via unnest."""
+        if not pairs:
+            return
+        role_ids = {name: self._generate_uuid_from_string(name) for _, name in pairs}
+        await conn.execute(UPSERT_ROLES_SQL, list(role_ids.values()), list(role_ids.keys()))
+        await conn.execute(
+            LINK_ROLES_SQL, [str(user_id) for user_id, _ in pairs], [role_ids[name] for _, name in pairs]
+        )
+
+    async def create_users_bulk(self, users: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Provisions many users in one transaction and a fixed number of statements.
+        Each user: {username, password_hash, roles}. Existing usernames are left
+        untouched. Returns {username: user_id} for the users actually created.
+        """
+        if not users:
+            return {}
         pool = await db.get_pool()
-        rows = await pool.fetch("SELECT * FROM users")
-        return [self._serialize_row(row) for row in rows]
+        ids = [str(user.get('id') or uuid.uuid4()) for user in users]
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    """
+                    INSERT INTO users (id, username, password_hash, is_active, created_at)
+                    SELECT id::uuid, username, password_hash, TRUE, NOW()
+                    FROM unnest($1::text[], $2::text[], $3::text[]) AS t(id, username, password_hash)
+                    ON CONFLICT (username) DO NOTHING
+                    RETURNING id, username
+                    """,
+                    ids, [user['username'] for user in users], [user['password_hash'] for user in users]
+                )
+                created = {row['username']: str(row['id']) for row in rows}
+
+                pairs = [
+                    (created[user['username']], role_name)
+                    for user in users if user['username'] in created
+                    for role_name in user.get('roles', [])
+                ]
+                await self._assign_roles(conn, pairs)
+
+        db.mark_write()
+        return created
+
+    async def list_users(
+        self, limit: int = 50, cursor: Optional[str] = None, is_active: Optional[bool] = None
+    ) -> Page:
+        """Newest first, keyset-paginated on (created_at, id). Roles fetched in one query per page."""
+        limit = clamp_limit(limit)
+        sql, args = keyset_query("users", USER_LIST_COLUMNS, {"is_active": is_active}, cursor, limit)
+        pool = await db.get_read_pool()
+        rows = await pool.fetch(sql, *args)
+        page = build_page(rows, limit, self._serialize_row)
+
+        if page.items:
+            role_rows = await pool.fetch(
+                """
+                SELECT ur.user_id, r.name
+                FROM user_roles ur
+                JOIN roles r ON r.id = ur.role_id
+                WHERE ur.user_id = ANY($1::uuid[])
+                """,
+                [user["id"] for user in page.items]
+            )
+            roles: Dict[str, List[str]] = {}
+            for row in role_rows:
+                roles.setdefault(str(row["user_id"]), []).append(row["name"])
+            for user in page.items:
+                user["roles"] = roles.get(user["id"], [])
+        return page
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from src.identity.repository import UserRepository
+from src.shared.pagination import Page
 from src.shared.event_bus import event_bus
 from src.infrastructure.settings import settings
+import asyncio
 import uuid
 import logging
 
@@ -26,6 +29,10 @@ pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 # Generate a valid fallback hash at module load time to ensure it works
 FALLBACK_HASH = pwd_context.hash("fallback_timing_mitigation_password")
 
+# PBKDF2 runs in hashlib with the GIL released: bulk hashing scales across threads
+# and keeps the event loop responsive.
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="pwd-hash")
+
 class AuthError(Exception):
     pass
 
@@ -153,6 +160,68 @@ class AuthService:
 
         return {"id": user_id, "username": username, "roles": roles}
 
+    async def list_users(self, limit: int = 50, cursor: Optional[str] = None, is_active: Optional[bool] = None) -> Page:
+        return await self.repository.list_users(limit=limit, cursor=cursor, is_active=is_active)
+
+    async def create_users_bulk(self, users: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Admin bulk provisioning. users: [{username, password, roles}].
+        Returns per-user results in request order:
+        created | exists | duplicate (repeated in the request) | invalid.
+        """
+        results: List[Dict[str, Any]] = []
+        accepted: List[Dict[str, Any]] = []
+        seen = set()
+        for user in users:
+            username = (user.get("username") or "").strip()
+            password = user.get("password") or ""
+            roles = list(dict.fromkeys(user.get("roles") or []))
+            result = {"username": username, "status": "pending", "user_id": None, "roles": roles}
+            results.append(result)
+            if not username or not password:
+                result["status"] = "invalid"
+            elif username in seen:
+                result["status"] = "duplicate"
+            else:
+                seen.add(username)
+                accepted.append({"username": username, "password": password, "roles": roles})
+
+        # Hash in the worker pool, concurrently
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(*(
+            loop.run_in_executor(_hash_executor, self._get_password_hash, user["password"])
+            for user in accepted
+        ))
+        for user, password_hash in zip(accepted, hashes):
+            user["password_hash"] = password_hash
+            del user["password"]
+
+        created = await self.repository.create_users_bulk(accepted)
+
+        for result in results:
+            if result["status"] != "pending":
+                continue
+            if result["username"] in created:
+                result["status"] = "created"
+                result["user_id"] = created[result["username"]]
+            else:
+                result["status"] = "exists"
+
+        for result in results:
+            if result["status"] == "created":
+                await event_bus.publish(
+                    event_type="identity.user_created",
+                    source_context="identity",
+                    correlation_id=str(uuid.uuid4()),
+                    entity_refs={"userId": result["user_id"]},
+                    payload={
+                        "username": result["username"],
+                        "roles": result["roles"],
+                    },
+                )
+
+        return {"created": len(created), "results": results}
+
     def validate_token(self, token: str) -> Dict[str, Any]:
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -1,11 +1,60 @@
 import asyncpg
 from src.infrastructure.settings import settings
+from src.infrastructure.statements import statements, PreparedConnection
+from src.infrastructure.migrator import MigrationRunner
 import asyncio
-import os
+import contextvars
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Monotonic time of the last write in the current request/task (read-your-writes guard)
+_last_write_at: contextvars.ContextVar[float] = contextvars.ContextVar("db_last_write_at", default=0.0)
+
+
+async def init_connection(conn) -> None:
+    """
+    Pool `init` hook. Codecs are registered before statements are prepared:
+    a prepared statement keeps the codecs it was prepared with.
+    - uuid is exchanged in text form, so rows carry wire-ready str ids
+      (no per-row UUID -> str pass in the repositories).
+    - timestamptz stays a native datetime: it is compared and sorted in Python
+      (cursors, SLA checks) and Pydantic serializes it once at the response.
+    """
+    await conn.set_type_codec("uuid", encoder=str, decoder=str, schema="pg_catalog", format="text")
+    await statements.prepare_all(conn)
+
 
 class Database:
     _pool = None
-    _loop_id: int = None
+    # Event loop the pool is bound to. asyncpg pools cannot be shared across loops.
+    _loop: asyncio.AbstractEventLoop = None
+
+    # Optional read replica (settings.DATABASE_REPLICA_URL), same loop-binding rules
+    _replica_pool = None
+    _replica_loop: asyncio.AbstractEventLoop = None
+    # After a failed replica connect, reads fall back to the primary until this time
+    _replica_retry_at: float = 0.0
+    REPLICA_RETRY_S = 30.0
+
+    @classmethod
+    async def _create_pool(cls, dsn: str = None):
+        """
+        Pool factory. Sizing/timeouts come from Settings; every new connection
+        registers codecs and prepares the registered hot statements (init_connection).
+        """
+        return await asyncpg.create_pool(
+            dsn or settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            max_queries=settings.DB_POOL_MAX_QUERIES,
+            max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+            command_timeout=settings.DB_COMMAND_TIMEOUT,
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            connection_class=PreparedConnection,
+            init=init_connection,
+        )
 
     @classmethod
     async def init_pool(cls):
@@ -16,74 +65,175 @@ class Database:
         # If pool exists, close it (safe cleanup)
         await cls.close()
 
-        cls._pool = await asyncpg.create_pool(settings.DATABASE_URL)
-        # Store ID of loop to detect cross-loop usage later
-        try:
-            loop = asyncio.get_running_loop()
-            cls._loop_id = id(loop)
-        except RuntimeError:
-            cls._loop_id = None
-        
-        return cls._pool
+        pool = await cls._create_pool()
+        cls.bind_pool(pool)
+        return pool
 
     @classmethod
     async def get_pool(cls):
-        # Validation: Check if pool belongs to current loop
-        try:
-            current_loop = asyncio.get_running_loop()
-            current_loop_id = id(current_loop)
-        except RuntimeError:
-            current_loop_id = None
-
-        # If pool exists but is bound to old loop or closed -> Reset
-        if cls._pool:
-             is_closed = False
-             try:
-                 is_closed = cls._pool.is_closed()
-             except Exception:
-                 is_closed = getattr(cls._pool, "_closed", False)
-
-             if is_closed or (cls._loop_id and current_loop_id != cls._loop_id):
-                  await cls.close() # Ensure full cleanup
-                  cls._pool = None
+        """
+        Hot path (called by every repository method): a single identity check
+        of the running loop against the bound loop. Rebinding only happens when
+        the pool is missing, closed by close(), or owned by another loop.
+        """
+        pool = cls._pool
+        if pool is not None and cls._loop is asyncio.get_running_loop():
+            return pool
+        return await cls._rebind_pool()
+
+    @classmethod
+    async def get_read_pool(cls):
+        """
+        Pool for read-only queries that tolerate replication lag.
+        Falls back to the primary when no replica is configured, when the
+        replica is unreachable, or right after a write in the same request.
+        """
+        if not settings.DATABASE_REPLICA_URL or cls.recently_wrote():
+            return await cls.get_pool()
+        pool = cls._replica_pool
+        if pool is not None and cls._replica_loop is asyncio.get_running_loop():
+            return pool
+        return await cls._rebind_replica_pool()
+
+    @classmethod
+    async def _rebind_replica_pool(cls):
+        loop = asyncio.get_running_loop()
+
+        if cls._replica_pool is not None and (
+            cls._replica_loop is not loop or cls._pool_is_closed(cls._replica_pool)
+        ):
+            cls._discard_replica_pool()
+
+        if cls._replica_pool is None:
+            if time.monotonic() < cls._replica_retry_at:
+                return await cls.get_pool()
+            try:
+                pool = await cls._create_pool(settings.DATABASE_REPLICA_URL)
+            except Exception as e:
+                logger.warning(f"Read replica unavailable, reading from primary: {e}")
+                cls._replica_retry_at = time.monotonic() + cls.REPLICA_RETRY_S
+                return await cls.get_pool()
+            if cls._replica_pool is not None and cls._replica_loop is loop:
+                await pool.close()
+            else:
+                cls.bind_replica_pool(pool, loop)
+
+        return cls._replica_pool
+
+    @staticmethod
+    def mark_write():
+        """Called after a committed write: pins this request's reads to the primary."""
+        _last_write_at.set(time.monotonic())
+
+    @staticmethod
+    def recently_wrote() -> bool:
+        window = settings.DB_READ_YOUR_WRITES_WINDOW_S
+        if window <= 0:
+            return False
+        last = _last_write_at.get()
+        return last > 0 and time.monotonic() - last < window
+
+    @classmethod
+    async def _rebind_pool(cls):
+        loop = asyncio.get_running_loop()
+
+        if cls._pool is not None and cls._loop is not loop:
+            # Pool belongs to a previous (likely closed) loop: it cannot be awaited from here
+            cls._discard_pool()
+
+        if cls._pool is not None and cls._pool_is_closed(cls._pool):
+            cls._discard_pool()
 
         if cls._pool is None:
             # Lazy init
-            cls._pool = await asyncpg.create_pool(settings.DATABASE_URL)
-            cls._loop_id = current_loop_id
-            
+            pool = await cls._create_pool()
+            if cls._pool is not None and cls._loop is loop:
+                # Another task bound a pool while we were connecting
+                await pool.close()
+            else:
+                cls.bind_pool(pool, loop)
+
         return cls._pool
 
+    @staticmethod
+    def _pool_is_closed(pool) -> bool:
+        try:
+            return pool.is_closed()
+        except Exception:
+            return getattr(pool, "_closed", False)
+
     @classmethod
-    async def close(cls):
-        if cls._pool:
+    def _discard_pool(cls):
+        try:
+            cls._pool.terminate()
+        except Exception:
+            pass # Already closed or bound to a dead loop
+        cls.reset()
+
+    @classmethod
+    def _discard_replica_pool(cls):
+        try:
+            cls._replica_pool.terminate()
+        except Exception:
+            pass
+        cls._replica_pool = None
+        cls._replica_loop = None
+
+    @classmethod
+    def bind_replica_pool(cls, pool, loop: asyncio.AbstractEventLoop = None):
+        """Replica counterpart of bind_pool."""
+        if loop is None:
             try:
-                await cls._pool.close()
-            except Exception:
-                pass # Already closed or erroring
-            cls._pool = None
-            cls._loop_id = None
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        cls._replica_pool = pool
+        cls._replica_loop = loop
+
+    @classmethod
+    def bind_pool(cls, pool, loop: asyncio.AbstractEventLoop = None):
+        """
+        Binds `pool` to `loop` (default: the running loop).
+        Also the injection point for tests that provide their own pool.
+        """
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        cls._pool = pool
+        cls._loop = loop
+
+    @classmethod
+    def reset(cls):
+        """Drops the binding without touching the pool (test hook, e.g. between event loops)."""
+        cls._pool = None
+        cls._loop = None
+        cls._replica_pool = None
+        cls._replica_loop = None
+        cls._replica_retry_at = 0.0
+
+    @classmethod
+    async def close(cls):
+        for pool in (cls._replica_pool, cls._pool):
+            if pool:
+                try:
+                    await pool.close()
+                except Exception:
+                    pass # Already closed or erroring
+        cls.reset()
 
     @classmethod
     async def init_schema(cls):
+        """
+        Applies pending versioned migrations (src/infrastructure/migrations).
+        Databases created from the legacy schema.sql are adopted as the baseline.
+        """
         pool = await cls.get_pool()
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        schema_path = os.path.join(base_dir, "infrastructure", "schema.sql")
-        
-        try:
-            with open(schema_path, "r") as f:
-                schema_sql = f.read()
-        except FileNotFoundError:
-            print(f"[WARN] Schema file not found at {schema_path}. Skipping init.")
-            return
-
-        async with pool.acquire() as conn:
-            # Strategy: check if 'users' table exists, if not, run schema.
-            exists = await conn.fetchval("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'users')")
-            if not exists:
-                await conn.execute(schema_sql)
-                print("Schema initialized.")
-            else:
-                print("Schema already exists, skipping initialization.")
+        applied = await MigrationRunner(pool).run()
+        if applied:
+            print(f"Schema migrated: applied {applied}")
+        else:
+            print("Schema up to date.")
 
 db = Database
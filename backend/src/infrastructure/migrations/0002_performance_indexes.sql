@@ -0,0 +1,20 @@
+-- migrate:no-transaction
+-- Secondary indexes for the hot read paths. Built CONCURRENTLY so writes are not blocked.
+
+-- TicketRepository.get_by_incident_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_incident_id ON tickets (incident_id);
+
+-- SocRepository.list_incidents (ORDER BY created_at DESC LIMIT n)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_incidents_created_at ON incidents (created_at DESC);
+
+-- SLA breach scan (/analytics/summary): status != 'Closed' AND NOW() > sla_deadline
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_status_sla ON tickets (status, sla_deadline);
+
+-- Open tickets only: the breach scan never needs closed rows
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_open_sla ON tickets (sla_deadline) WHERE status <> 'Closed';
+
+-- Asset status history per asset, newest first
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_asset_status_history_asset ON asset_status_history (asset_id, occurred_at DESC);
+
+-- Incident audit trail
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_incident_transitions_incident ON incident_transitions (incident_id, occurred_at);
@@ -0,0 +1,122 @@
+-- Range-partition the append-only history tables by occurred_at.
+-- Future partitions are created ahead of time and expired ones dropped by
+-- PartitionManager (src/infrastructure/partitions.py). Rows that arrive
+-- before their partition exists land in <table>_default and are moved out
+-- when the partition is created.
+
+CREATE OR REPLACE FUNCTION ensure_time_partition(parent TEXT, granularity TEXT, ts TIMESTAMPTZ)
+RETURNS TEXT LANGUAGE plpgsql AS $$
+DECLARE
+  lower_bound TIMESTAMPTZ;
+  upper_bound TIMESTAMPTZ;
+  part_name TEXT;
+  default_name TEXT := parent || '_default';
+BEGIN
+  IF granularity NOT IN ('day', 'month') THEN
+    RAISE EXCEPTION 'Unsupported partition granularity: %', granularity;
+  END IF;
+
+  lower_bound := date_trunc(granularity, ts AT TIME ZONE 'UTC') AT TIME ZONE 'UTC';
+  upper_bound := lower_bound + ('1 ' || granularity)::interval;
+  part_name := parent || '_p' || to_char(lower_bound AT TIME ZONE 'UTC',
+                                         CASE granularity WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END);
+
+  IF to_regclass(part_name) IS NOT NULL THEN
+    RETURN part_name;
+  END IF;
+
+  EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', part_name, parent);
+
+  IF to_regclass(default_name) IS NOT NULL THEN
+    EXECUTE format(
+      'WITH moved AS (DELETE FROM %I WHERE occurred_at >= %L AND occurred_at < %L RETURNING *) '
+      'INSERT INTO %I SELECT * FROM moved',
+      default_name, lower_bound, upper_bound, part_name);
+  END IF;
+
+  EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                 parent, part_name, lower_bound, upper_bound);
+  RETURN part_name;
+END
+$$;
+
+-- FLEET: asset_status_history (daily partitions)
+ALTER TABLE asset_status_history RENAME TO asset_status_history_legacy;
+ALTER INDEX asset_status_history_pkey RENAME TO asset_status_history_legacy_pkey;
+
+CREATE TABLE asset_status_history (
+  id UUID NOT NULL,
+  asset_id UUID REFERENCES assets(id) ON DELETE CASCADE,
+  status TEXT NOT NULL,
+  occurred_at TIMESTAMPTZ NOT NULL,
+  PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE asset_status_history_default PARTITION OF asset_status_history DEFAULT;
+
+SELECT ensure_time_partition('asset_status_history', 'day', bucket)
+FROM (SELECT DISTINCT date_trunc('day', occurred_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket
+      FROM asset_status_history_legacy) buckets;
+SELECT ensure_time_partition('asset_status_history', 'day', now());
+
+INSERT INTO asset_status_history (id, asset_id, status, occurred_at)
+SELECT id, asset_id, status, occurred_at FROM asset_status_history_legacy;
+
+DROP TABLE asset_status_history_legacy;
+
+CREATE INDEX idx_asset_status_history_asset ON asset_status_history (asset_id, occurred_at DESC);
+
+-- INCIDENTS: incident_transitions (monthly partitions)
+ALTER TABLE incident_transitions RENAME TO incident_transitions_legacy;
+ALTER INDEX incident_transitions_pkey RENAME TO incident_transitions_legacy_pkey;
+
+CREATE TABLE incident_transitions (
+  id UUID NOT NULL,
+  incident_id UUID REFERENCES incidents(id) ON DELETE CASCADE,
+  from_state TEXT NOT NULL,
+  to_state TEXT NOT NULL,
+  triggered_by TEXT NOT NULL,
+  occurred_at TIMESTAMPTZ NOT NULL,
+  PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE incident_transitions_default PARTITION OF incident_transitions DEFAULT;
+
+SELECT ensure_time_partition('incident_transitions', 'month', bucket)
+FROM (SELECT DISTINCT date_trunc('month', occurred_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket
+      FROM incident_transitions_legacy) buckets;
+SELECT ensure_time_partition('incident_transitions', 'month', now());
+
+INSERT INTO incident_transitions (id, incident_id, from_state, to_state, triggered_by, occurred_at)
+SELECT id, incident_id, from_state, to_state, triggered_by, occurred_at FROM incident_transitions_legacy;
+
+DROP TABLE incident_transitions_legacy;
+
+CREATE INDEX idx_incident_transitions_incident ON incident_transitions (incident_id, occurred_at);
+
+-- AUDIT: audit_log (monthly partitions)
+ALTER TABLE audit_log RENAME TO audit_log_legacy;
+ALTER INDEX audit_log_pkey RENAME TO audit_log_legacy_pkey;
+
+CREATE TABLE audit_log (
+  id UUID NOT NULL,
+  event_id UUID NOT NULL,
+  event_type TEXT NOT NULL,
+  actor TEXT,
+  occurred_at TIMESTAMPTZ NOT NULL,
+  PRIMARY KEY (id, occurred_at)
+) PARTITION BY RANGE (occurred_at);
+
+CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT;
+
+SELECT ensure_time_partition('audit_log', 'month', bucket)
+FROM (SELECT DISTINCT date_trunc('month', occurred_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket
+      FROM audit_log_legacy) buckets;
+SELECT ensure_time_partition('audit_log', 'month', now());
+
+INSERT INTO audit_log (id, event_id, event_type, actor, occurred_at)
+SELECT id, event_id, event_type, actor, occurred_at FROM audit_log_legacy;
+
+DROP TABLE audit_log_legacy;
+
+CREATE INDEX idx_audit_log_event_type ON audit_log (event_type, occurred_at);
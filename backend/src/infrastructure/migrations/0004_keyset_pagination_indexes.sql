@@ -0,0 +1,17 @@
+-- migrate:no-transaction
+-- Composite (created_at DESC, id DESC) indexes backing keyset pagination on the
+-- list endpoints; the leading equality column covers the common filter.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_incidents_created_id ON incidents (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_incidents_state_created_id ON incidents (state, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_created_id ON tickets (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_status_created_id ON tickets (status, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assets_created_id ON assets (created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assets_status_created_id ON assets (status, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_id ON users (created_at DESC, id DESC);
+
+-- Superseded by idx_incidents_created_id
+DROP INDEX CONCURRENTLY IF EXISTS idx_incidents_created_at;
@@ -0,0 +1,19 @@
+-- migrate:no-transaction
+-- At most one ticket per incident, enforced by the database so escalation can
+-- insert with ON CONFLICT (incident_id) DO NOTHING instead of check-then-insert.
+
+-- Racing escalations may have produced duplicates: keep the oldest ticket
+-- linked and detach the others (no ticket is deleted).
+UPDATE tickets t
+SET incident_id = NULL
+FROM (
+  SELECT id, row_number() OVER (PARTITION BY incident_id ORDER BY created_at, id) AS rn
+  FROM tickets
+  WHERE incident_id IS NOT NULL
+) d
+WHERE t.id = d.id AND d.rn > 1;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_tickets_incident_id ON tickets (incident_id);
+
+-- Superseded by uq_tickets_incident_id
+DROP INDEX CONCURRENTLY IF EXISTS idx_tickets_incident_id;
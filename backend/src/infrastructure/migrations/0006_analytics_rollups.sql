@@ -0,0 +1,48 @@
+-- migrate:no-transaction
+-- Hourly/daily analytics rollups, maintained incrementally by RollupRefresher
+-- (src/analytics/rollups.py). Each source advances its own watermark.
+
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+  name TEXT PRIMARY KEY,
+  watermark TIMESTAMPTZ NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS incident_rollups (
+  granularity TEXT NOT NULL,
+  bucket_start TIMESTAMPTZ NOT NULL,
+  type TEXT NOT NULL,
+  severity TEXT NOT NULL,
+  created INTEGER NOT NULL DEFAULT 0,
+  escalated INTEGER NOT NULL DEFAULT 0,
+  resolved INTEGER NOT NULL DEFAULT 0,
+  closed INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (granularity, bucket_start, type, severity)
+);
+
+CREATE TABLE IF NOT EXISTS ticket_sla_rollups (
+  granularity TEXT NOT NULL,
+  bucket_start TIMESTAMPTZ NOT NULL,
+  closed INTEGER NOT NULL DEFAULT 0,
+  met_sla INTEGER NOT NULL DEFAULT 0,
+  breached_sla INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (granularity, bucket_start)
+);
+
+CREATE TABLE IF NOT EXISTS asset_status_rollups (
+  granularity TEXT NOT NULL,
+  bucket_start TIMESTAMPTZ NOT NULL,
+  status TEXT NOT NULL,
+  seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+  PRIMARY KEY (granularity, bucket_start, status)
+);
+
+-- Status each asset was in at the asset watermark: the open interval carried
+-- into the next refresh, so history before the watermark is never rescanned.
+CREATE TABLE IF NOT EXISTS asset_status_rollup_carry (
+  asset_id UUID PRIMARY KEY,
+  status TEXT NOT NULL,
+  since TIMESTAMPTZ NOT NULL
+);
+
+-- Ticket SLA outcomes are rolled up by closing time
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_closed_at ON tickets (closed_at) WHERE closed_at IS NOT NULL;
@@ -0,0 +1,7 @@
+-- Last reported position/zone/driver per asset, written by the telemetry
+-- coalescer (src/fleet/telemetry.py). Nullable, no default: metadata-only ALTERs.
+
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS location_x DOUBLE PRECISION;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS location_y DOUBLE PRECISION;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS zone_id TEXT;
+ALTER TABLE assets ADD COLUMN IF NOT EXISTS driver_name TEXT;
@@ -0,0 +1,16 @@
+-- Run-length-encoded asset status history, compacted from asset_status_history
+-- by StatusHistoryCompactor (src/fleet/status_history.py). One row per run of
+-- the same status; ended_at is NULL for each asset's last compacted run, which
+-- stays open until raw rows after the compaction watermark continue it.
+
+CREATE TABLE IF NOT EXISTS asset_status_intervals (
+  asset_id UUID NOT NULL,
+  status TEXT NOT NULL,
+  started_at TIMESTAMPTZ NOT NULL,
+  ended_at TIMESTAMPTZ,
+  PRIMARY KEY (asset_id, started_at)
+);
+
+-- Fleet-wide window scans (uptime) and the open run per asset
+CREATE INDEX IF NOT EXISTS idx_asset_status_intervals_started ON asset_status_intervals (started_at);
+CREATE INDEX IF NOT EXISTS idx_asset_status_intervals_open ON asset_status_intervals (asset_id) WHERE ended_at IS NULL;
@@ -0,0 +1,176 @@
+import hashlib
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# First line directive: run statement by statement outside a transaction
+# (required by CREATE INDEX CONCURRENTLY).
+NO_TRANSACTION_DIRECTIVE = "-- migrate:no-transaction"
+
+# Arbitrary constant shared by all app instances: only one runner migrates at a time
+ADVISORY_LOCK_KEY = 72_903_114
+
+_FILENAME_RE = re.compile(r"^(\d+)_([\w\-]+)\.sql$")
+_CONCURRENT_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE
+)
+
+
+class MigrationError(Exception):
+    pass
+
+
+class Migration:
+    def __init__(self, version: int, name: str, sql: str):
+        self.version = version
+        self.name = name
+        self.sql = sql
+        self.transactional = not sql.lstrip().lower().startswith(NO_TRANSACTION_DIRECTIVE)
+        self.checksum = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+
+    def statements(self) -> List[str]:
+        """Splits a non-transactional migration into single statements (comments dropped)."""
+        lines = [line for line in self.sql.splitlines() if not line.strip().startswith("--")]
+        return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+    def __repr__(self):
+        return f"<Migration {self.version:04d}_{self.name}>"
+
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = _FILENAME_RE.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            migrations.append(Migration(int(match.group(1)), match.group(2), f.read()))
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise MigrationError(f"Duplicate migration versions in {directory}")
+    return sorted(migrations, key=lambda m: m.version)
+
+
+class MigrationRunner:
+    """
+    Versioned, incremental schema migrations.
+    - Applied versions are recorded in `schema_migrations`.
+    - Each migration runs in its own transaction unless it starts with
+      `-- migrate:no-transaction` (e.g. CREATE INDEX CONCURRENTLY).
+    - A session advisory lock serializes concurrent runners (multiple app instances).
+    """
+
+    BASELINE_VERSION = 1
+
+    def __init__(self, pool: Any, directory: str = MIGRATIONS_DIR):
+        self.pool = pool
+        self.directory = directory
+
+    async def _ensure_table(self, conn) -> None:
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+              version INTEGER PRIMARY KEY,
+              name TEXT NOT NULL,
+              checksum TEXT NOT NULL,
+              applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """
+        )
+
+    async def _applied(self, conn) -> Dict[int, str]:
+        rows = await conn.fetch("SELECT version, checksum FROM schema_migrations")
+        return {row["version"]: row["checksum"] for row in rows}
+
+    async def _record(self, conn, migration: Migration) -> None:
+        await conn.execute(
+            "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)",
+            migration.version, migration.name, migration.checksum
+        )
+
+    async def _adopt_legacy_schema(self, conn, migrations: List[Migration], applied: Dict[int, str]) -> None:
+        """Databases created by the old init_schema (schema.sql) already hold the baseline."""
+        if applied:
+            return
+        exists = await conn.fetchval(
+            "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'users')"
+        )
+        baseline = next((m for m in migrations if m.version == self.BASELINE_VERSION), None)
+        if exists and baseline:
+            await self._record(conn, baseline)
+            applied[baseline.version] = baseline.checksum
+            logger.info("Existing schema adopted as baseline migration.")
+
+    async def _drop_invalid_index(self, conn, statement: str) -> None:
+        """A failed CONCURRENTLY build leaves an INVALID index that IF NOT EXISTS would skip."""
+        match = _CONCURRENT_INDEX_RE.search(statement)
+        if not match:
+            return
+        invalid = await conn.fetchval(
+            """
+            SELECT NOT i.indisvalid
+            FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = $1
+            """,
+            match.group(1)
+        )
+        if invalid:
+            logger.warning(f"Dropping invalid index {match.group(1)} left by an interrupted build.")
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {match.group(1)}")
+
+    async def _apply(self, conn, migration: Migration) -> None:
+        logger.info(f"Applying migration {migration.version:04d}_{migration.name}...")
+        if migration.transactional:
+            async with conn.transaction():
+                await conn.execute(migration.sql)
+                await self._record(conn, migration)
+            return
+
+        for statement in migration.statements():
+            await self._drop_invalid_index(conn, statement)
+            await conn.execute(statement)
+        await self._record(conn, migration)
+
+    async def pending(self) -> List[Migration]:
+        migrations = discover_migrations(self.directory)
+        async with self.pool.acquire() as conn:
+            await self._ensure_table(conn)
+            applied = await self._applied(conn)
+        return [m for m in migrations if m.version not in applied]
+
+    async def run(self, target: Optional[int] = None) -> List[int]:
+        """Applies pending migrations up to `target` (inclusive). Returns applied versions."""
+        migrations = discover_migrations(self.directory)
+        done = []
+
+        async with self.pool.acquire() as conn:
+            await conn.execute("SELECT pg_advisory_lock($1)", ADVISORY_LOCK_KEY)
+            try:
+                await self._ensure_table(conn)
+                applied = await self._applied(conn)
+                await self._adopt_legacy_schema(conn, migrations, applied)
+
+                for migration in migrations:
+                    if target is not None and migration.version > target:
+                        break
+                    if migration.version in applied:
+                        if applied[migration.version] != migration.checksum:
+                            logger.warning(f"Migration {migration!r} changed after it was applied.")
+                        continue
+                    try:
+                        await self._apply(conn, migration)
+                    except Exception as e:
+                        raise MigrationError(f"Migration {migration!r} failed: {e}") from e
+                    done.append(migration.version)
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock($1)", ADVISORY_LOCK_KEY)
+
+        if done:
+            logger.info(f"Applied migrations: {done}")
+        return done
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.settings import settings
+from src.infrastructure.database import db
+
+logger = logging.getLogger(__name__)
+
+
+def partitioned_tables() -> Dict[str, Dict[str, Any]]:
+    """
+    Time-partitioned tables (see migration 0003) and their policy.
+    retention_days <= 0 keeps partitions forever.
+    """
+    return {
+        "asset_status_history": {"granularity": "day", "premake": 7, "retention_days": settings.ASSET_HISTORY_RETENTION_DAYS},
+        "incident_transitions": {"granularity": "month", "premake": 2, "retention_days": settings.INCIDENT_TRANSITIONS_RETENTION_DAYS},
+        "audit_log": {"granularity": "month", "premake": 2, "retention_days": settings.AUDIT_LOG_RETENTION_DAYS},
+    }
+
+
+_PARTITION_SUFFIX_RE = re.compile(r"_p(\d{6}|\d{8})$")
+
+
+def _add_months(ts: datetime, months: int) -> datetime:
+    month_index = ts.month - 1 + months
+    return ts.replace(year=ts.year + month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    ts = ts.astimezone(timezone.utc)
+    if granularity == "day":
+        return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "month":
+        return ts.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unsupported partition granularity: {granularity}")
+
+
+def next_bucket(ts: datetime, granularity: str, steps: int = 1) -> datetime:
+    start = bucket_start(ts, granularity)
+    if granularity == "day":
+        return start + timedelta(days=steps)
+    return _add_months(start, steps)
+
+
+def partition_upper_bound(partition_name: str, granularity: str) -> Optional[datetime]:
+    """Exclusive upper bound encoded in a partition name (e.g. asset_status_history_p20261019)."""
+    match = _PARTITION_SUFFIX_RE.search(partition_name)
+    if not match:
+        return None  # e.g. <table>_default
+    suffix = match.group(1)
+    try:
+        if len(suffix) == 8:
+            lower = datetime.strptime(suffix, "%Y%m%d").replace(tzinfo=timezone.utc)
+        else:
+            lower = datetime.strptime(suffix, "%Y%m").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return next_bucket(lower, granularity)
+
+
+class PartitionManager:
+    """
+    Creates future partitions ahead of time and drops expired ones.
+    Dropping a partition is a metadata operation: no DELETE, no vacuum debt.
+    """
+
+    def __init__(self, pool: Any, tables: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.pool = pool
+        self.tables = tables if tables is not None else partitioned_tables()
+
+    async def ensure_future_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        now = now or datetime.now(timezone.utc)
+        created = []
+        async with self.pool.acquire() as conn:
+            for table, policy in self.tables.items():
+                for step in range(policy["premake"] + 1):
+                    ts = next_bucket(now, policy["granularity"], step) if step else now
+                    name = await conn.fetchval(
+                        "SELECT ensure_time_partition($1, $2, $3)", table, policy["granularity"], ts
+                    )
+                    created.append(name)
+        return created
+
+    async def list_partitions(self, conn, table: str) -> List[str]:
+        rows = await conn.fetch(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass($1)
+            ORDER BY c.relname
+            """,
+            table
+        )
+        return [row["relname"] for row in rows]
+
+    async def drop_expired(self, now: Optional[datetime] = None) -> List[str]:
+        now = now or datetime.now(timezone.utc)
+        dropped = []
+        async with self.pool.acquire() as conn:
+            for table, policy in self.tables.items():
+                retention_days = policy.get("retention_days") or 0
+                if retention_days <= 0:
+                    continue
+                cutoff = now - timedelta(days=retention_days)
+                for name in await self.list_partitions(conn, table):
+                    upper = partition_upper_bound(name, policy["granularity"])
+                    if upper is None or upper > cutoff:
+                        continue
+                    await conn.execute(f'DROP TABLE IF EXISTS "{name}"')
+                    dropped.append(name)
+        if dropped:
+            logger.info(f"Dropped expired partitions: {dropped}")
+        return dropped
+
+    async def run_maintenance(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        return {
+            "ensured": await self.ensure_future_partitions(now),
+            "dropped": await self.drop_expired(now),
+        }
+
+
+class PartitionMaintenance:
+    """Background task running PartitionManager periodically (started at app startup)."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def _loop(self):
+        while self._running:
+            try:
+                pool = await db.get_pool()
+                await PartitionManager(pool).run_maintenance()
+            except Exception as e:
+                logger.error(f"Partition maintenance failed: {e}")
+            await asyncio.sleep(settings.PARTITION_MAINTENANCE_INTERVAL_S)
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+
+partition_maintenance = PartitionMaintenance()
@@ -1,10 +1,12 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
     # Core
     DATABASE_URL: str
+    # Optional streaming replica for read-only queries (dashboards, lists, analytics)
+    DATABASE_REPLICA_URL: Optional[str] = None
     REDIS_URL: str
 
     # Security secret (required by AuthService)
@@ -16,6 +18,89 @@ class Settings(BaseSettings):
     # If true, disables ALL Redis usage (In-Memory EventBus/Consumers)
     DEMO_NO_REDIS: bool = False
 
+    # Database Pool (asyncpg)
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    # Recycle a connection after this many queries
+    DB_POOL_MAX_QUERIES: int = 50000
+    # Close connections idle for longer than this (seconds, 0 disables)
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    # Max wait for a free connection before failing (seconds)
+    DB_POOL_ACQUIRE_TIMEOUT: float = 10.0
+    # Default per-query timeout (seconds)
+    DB_COMMAND_TIMEOUT: float = 30.0
+    # asyncpg's per-connection cache for unregistered (ad-hoc) queries
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # After a write, reads in the same request/task stay on the primary for this long
+    # (seconds, 0 disables the read-your-writes guard)
+    DB_READ_YOUR_WRITES_WINDOW_S: float = 2.0
+
+    # Partitioned history tables: retention (days, 0 keeps forever) and maintenance cadence
+    ASSET_HISTORY_RETENTION_DAYS: int = 90
+    INCIDENT_TRANSITIONS_RETENTION_DAYS: int = 730
+    AUDIT_LOG_RETENTION_DAYS: int = 365
+    PARTITION_MAINTENANCE_INTERVAL_S: float = 3600.0
+    # Asset status history: raw rows older than ASSET_HISTORY_RAW_DAYS (whole days) are
+    # compacted into asset_status_intervals and dropped; retention above is the backstop
+    ASSET_HISTORY_RAW_DAYS: int = 7
+    ASSET_HISTORY_COMPACTION_INTERVAL_S: float = 3600.0
+    # Uptime counts time outside FLEET_DOWN_STATUSES; utilisation is time in
+    # FLEET_BUSY_STATUSES over up time (case-insensitive)
+    FLEET_DOWN_STATUSES: List[str] = ["offline", "maintenance", "repair", "out_of_service", "out_of_service_charging"]
+    FLEET_BUSY_STATUSES: List[str] = ["active", "moving", "in_service", "dispatched"]
+
+    # Analytics rollups: refresh cadence, how far behind now() the watermark stays
+    # (seconds), and how many days the first refresh backfills
+    ROLLUP_REFRESH_INTERVAL_S: float = 60.0
+    ROLLUP_LAG_S: float = 30.0
+    ROLLUP_BACKFILL_DAYS: int = 30
+
+    # Fleet telemetry: coalesced per asset and flushed in bulk at this cadence (seconds)
+    TELEMETRY_FLUSH_INTERVAL_S: float = 0.25
+    # Overspeed detection: samples per sliding window (debounce), km/h above the
+    # limit to start a violation, km/h below it to clear, seconds before re-arming
+    OVERSPEED_WINDOW_SAMPLES: int = 10
+    OVERSPEED_TOLERANCE_KMH: float = 3.0
+    OVERSPEED_HYSTERESIS_KMH: float = 5.0
+    OVERSPEED_COOLDOWN_S: float = 30.0
+    OVERSPEED_DEFAULT_LIMIT_KMH: float = 40.0
+    # Position history (numpy .npz chunks per asset-hour); unset disables it
+    POSITION_STORE_DIR: Optional[str] = None
+    POSITION_STORE_FLUSH_INTERVAL_S: float = 60.0
+    # Geofence zone polygons (JSON, map coordinates); unset uses the built-in airport zones
+    GEOFENCE_ZONES_FILE: Optional[str] = None
+    # Largest |x| / |y| (map units) accepted by coordinate query parameters
+    MAP_COORD_LIMIT: float = 10_000.0
+    # Dispatch recommendations: statuses counted as available when none are requested
+    DISPATCH_AVAILABLE_STATUSES: List[str] = ["idle", "available", "in_service"]
+    # Road routing: graph JSON (unset uses the built-in service roads), map scale,
+    # speed off the road network, and how many straight-line candidates to rank by ETA
+    ROUTING_GRAPH_FILE: Optional[str] = None
+    ROUTING_METERS_PER_MAP_UNIT: float = 5.0
+    ROUTING_OFFROAD_KMH: float = 10.0
+    DISPATCH_ETA_CANDIDATES: int = 40
+
+    # Incident correlation: fleet signals for the same asset, zone and incident type
+    # join one incident while each arrives within the window (seconds) of the
+    # previous one, up to the max window; CORRELATION_WINDOWS_S overrides the
+    # window per signal event type. incident.updated goes out at most once per
+    # update interval per incident, listing at most MAX_SIGNAL_REFS new signals
+    CORRELATION_WINDOW_S: float = 60.0
+    CORRELATION_MAX_WINDOW_S: float = 600.0
+    CORRELATION_WINDOWS_S: Dict[str, float] = {}
+    CORRELATION_UPDATE_INTERVAL_S: float = 5.0
+    CORRELATION_TICK_S: float = 0.25
+    CORRELATION_MAX_SIGNAL_REFS: int = 50
+
+    # Identity: threads hashing passwords during bulk provisioning
+    PASSWORD_HASH_WORKERS: int = 4
+    # Max users accepted by one bulk provisioning request
+    BULK_USERS_MAX: int = 1000
+    # Max incidents accepted by one bulk incident request (escalation, transitions)
+    BULK_INCIDENTS_MAX: int = 500
+    # Max assets accepted by one bulk fleet request (registration, status updates)
+    BULK_ASSETS_MAX: int = 1000
+
     # Feature Flags
     AUTO_MIGRATE: bool = False
     SEED_ADMIN: bool = False
@@ -0,0 +1,155 @@
+import asyncpg
+import logging
+import time
+from typing import Any, Dict
+from src.infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Raised when a prepared statement no longer matches the schema (e.g. after a migration)
+_STALE_STATEMENT_ERRORS = (
+    asyncpg.exceptions.InvalidCachedStatementError,
+    asyncpg.exceptions.OutdatedSchemaCacheError,
+)
+
+
+class PreparedConnection(asyncpg.Connection):
+    """
+    Pool connection class that carries its own named prepared statements.
+    Used as `connection_class` for the application pool.
+    """
+    __slots__ = ("_prepared_statements",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prepared_statements = {}
+
+
+class StatementStats:
+    __slots__ = ("calls", "errors", "total_s", "max_s")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, elapsed: float, failed: bool = False) -> None:
+        self.calls += 1
+        self.total_s += elapsed
+        if elapsed > self.max_s:
+            self.max_s = elapsed
+        if failed:
+            self.errors += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_s * 1000, 3),
+            "avg_ms": round(self.total_s * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_s * 1000, 3),
+        }
+
+
+class StatementRegistry:
+    """
+    Central registry of hot queries.
+    - Repositories register their SQL once at import time under a stable name.
+    - Every new pool connection prepares all registered statements (pool `init` hook),
+      so request-path calls skip parse/plan work.
+    - Execution is timed per statement name (see stats()).
+    """
+
+    def __init__(self):
+        self._sql: Dict[str, str] = {}
+        self._stats: Dict[str, StatementStats] = {}
+
+    def register(self, name: str, sql: str) -> str:
+        existing = self._sql.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"Statement '{name}' already registered with different SQL")
+        self._sql[name] = sql
+        self._stats.setdefault(name, StatementStats())
+        return name
+
+    def sql(self, name: str) -> str:
+        return self._sql[name]
+
+    async def prepare_all(self, conn) -> None:
+        """
+        Pool `init` hook. Statements that cannot be prepared yet
+        (e.g. table missing before migrations ran) are prepared lazily on first use.
+        """
+        cache = getattr(conn, "_prepared_statements", None)
+        if not isinstance(cache, dict):
+            return
+        for name, sql in self._sql.items():
+            try:
+                cache[name] = await conn.prepare(sql)
+            except asyncpg.PostgresError as e:
+                logger.debug(f"Deferred preparing '{name}': {e}")
+
+    async def _get_prepared(self, conn, name: str, refresh: bool = False):
+        cache = getattr(conn, "_prepared_statements", None)
+        if not isinstance(cache, dict):
+            return None
+        stmt = None if refresh else cache.get(name)
+        if stmt is None:
+            stmt = await conn.prepare(self._sql[name])
+            cache[name] = stmt
+        return stmt
+
+    async def _run_on_conn(self, conn, name: str, method: str, args):
+        stmt = await self._get_prepared(conn, name)
+        if stmt is None:
+            # Plain connection (not from the app pool): fall back to asyncpg's own cache
+            return await getattr(conn, method)(self._sql[name], *args)
+
+        for attempt in (0, 1):
+            try:
+                if method == "execute":
+                    await stmt.fetch(*args)
+                    return stmt.get_statusmsg()
+                return await getattr(stmt, method)(*args)
+            except _STALE_STATEMENT_ERRORS:
+                if attempt:
+                    raise
+                stmt = await self._get_prepared(conn, name, refresh=True)
+
+    async def _run(self, target, name: str, method: str, args):
+        started = time.perf_counter()
+        failed = False
+        try:
+            if isinstance(target, asyncpg.Pool):
+                async with target.acquire(timeout=settings.DB_POOL_ACQUIRE_TIMEOUT) as conn:
+                    return await self._run_on_conn(conn, name, method, args)
+            return await self._run_on_conn(target, name, method, args)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._stats[name].record(time.perf_counter() - started, failed)
+
+    # `target` is either a Pool or an acquired connection (e.g. inside a transaction)
+    async def fetch(self, target, name: str, *args):
+        return await self._run(target, name, "fetch", args)
+
+    async def fetchrow(self, target, name: str, *args):
+        return await self._run(target, name, "fetchrow", args)
+
+    async def fetchval(self, target, name: str, *args):
+        return await self._run(target, name, "fetchval", args)
+
+    async def execute(self, target, name: str, *args) -> str:
+        return await self._run(target, name, "execute", args)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: s.as_dict() for name, s in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        for name in self._stats:
+            self._stats[name] = StatementStats()
+
+
+statements = StatementRegistry()
@@ -6,8 +6,16 @@ from src.infrastructure.database import db
 from src.infrastructure.settings import settings
 from src.shared.event_bus import event_bus
 from src.shared.consumers import consumer_manager
+from src.soc.correlation import correlation_engine
 from src.identity.bootstrap import seed_admin_if_enabled
 from src.infrastructure.demo import is_demo_mode
+from src.infrastructure.partitions import partition_maintenance
+from src.analytics.rollups import rollup_maintenance
+from src.fleet.status_history import status_history_compaction
+from src.shared.pagination import NEXT_CURSOR_HEADER
+from src.fleet.live_state import FLEET_VERSION_HEADER
+from src.fleet.service import FleetService
+from src.soc.service import SocService
 
 # Import Routers
 from src.identity.adapters.api import router as identity_router
@@ -77,6 +85,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, FLEET_VERSION_HEADER, "ETag"],
 )
 
 @app.middleware("http")
@@ -113,10 +122,24 @@ async def startup_event():
         await seed_admin_if_enabled()
         
         if not is_demo_mode():
+            # Live fleet map state and open incidents, then the consumers that keep them current
+            await FleetService().warm_live_state()
+            await SocService().warm_read_model()
             await consumer_manager.start()
             print("Startup: Consumer Manager Started")
+
+            # 5. History partitions: premake future, drop expired (PROD ONLY)
+            await partition_maintenance.start()
+
+            # 6. Analytics rollups: incremental refresh from history (PROD ONLY)
+            await rollup_maintenance.start()
+
+            # 7. Status history: compact old raw rows into intervals (PROD ONLY)
+            await status_history_compaction.start()
         else:
             print("Startup: Consumer Manager SKIPPED (Demo Mode)")
+            # Simulated signals are correlated in-process (see publish_signal)
+            await correlation_engine.start()
         
     except Exception as e:
         print(f"Startup Error: {e}")
@@ -127,6 +150,9 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     await consumer_manager.stop()
+    await partition_maintenance.stop()
+    await rollup_maintenance.stop()
+    await status_history_compaction.stop()
     await db.close()
 
 # Streaming Endpoint
@@ -6,11 +6,29 @@ from typing import Any, Dict
 from src.shared.event_bus import event_bus
 from src.infrastructure.settings import settings
 from src.infrastructure.database import db
+from src.infrastructure.statements import statements
 from src.fleet.service import FleetService
+from src.fleet.telemetry import telemetry_coalescer
+from src.fleet.positions import position_store
+from src.soc.read_model import incident_read_model
+from src.soc.correlation import SIGNAL_TYPES, correlation_engine
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+INSERT_INCIDENT = statements.register(
+    "consumers.insert_incident",
+    """
+    INSERT INTO incidents (id, type, severity, state, correlation_id, created_at)
+    VALUES ($1, $2, $3, $4, $5, NOW())
+    ON CONFLICT (id) DO NOTHING
+    RETURNING created_at
+    """,
+)
+UPDATE_INCIDENT_STATE = statements.register(
+    "consumers.update_incident_state", "UPDATE incidents SET state = $1 WHERE id = $2"
+)
+
 def generate_uuid_from_string(val: str) -> str:
     try:
         return str(uuid.UUID(val))
@@ -75,11 +93,14 @@ class ConsumerManager:
                 db_id = generate_uuid_from_string(inc_id)
                 db_corr_id = generate_uuid_from_string(corr_id)
 
-                await pool.execute("""
-                    INSERT INTO incidents (id, type, severity, state, correlation_id, created_at)
-                    VALUES ($1, $2, $3, $4, $5, NOW())
-                    ON CONFLICT (id) DO NOTHING
-                """, db_id, inc_type, severity, state, db_corr_id)
+                created_at = await statements.fetchval(pool, INSERT_INCIDENT, db_id, inc_type, severity, state, db_corr_id)
+                # Redelivery of a known incident inserts nothing: leave the projection as is
+                if created_at is not None:
+                    location = payload.get("location")
+                    incident_read_model.upsert(
+                        db_id, inc_type, severity, state, db_corr_id, created_at,
+                        location=location if isinstance(location, dict) else None,
+                    )
 
             elif event_type == "incident.state_changed":
                 inc_id = get_any(payload, ["incident_id", "incidentId", "id"])
@@ -87,7 +108,8 @@ class ConsumerManager:
                 if not inc_id or not to_state: raise ValueError("Missing ID or State")
                 
                 db_id = generate_uuid_from_string(inc_id)
-                await pool.execute("UPDATE incidents SET state = $1 WHERE id = $2", to_state, db_id)
+                await statements.execute(pool, UPDATE_INCIDENT_STATE, to_state, db_id)
+                incident_read_model.set_state(db_id, to_state)
 
             elif event_type in ["fleet.asset_status_changed", "fleet.asset.status_changed"]:
                 await self.fleet_service.process_telemetry(event_type, payload)
@@ -95,6 +117,12 @@ class ConsumerManager:
             elif event_type in ["fleet.robot_patrol_started"]:
                 await self.fleet_service.process_telemetry(event_type, payload)
 
+            elif event_type in SIGNAL_TYPES:
+                # Incidents are raised by the correlation engine, not per signal
+                correlation_engine.observe(
+                    event_data.get("event_id"), event_type, payload, event_data.get("correlation_id")
+                )
+
         except Exception as e:
             logger.debug(f"Process failed for {event_type}: {e}")
             raise
@@ -152,6 +180,10 @@ class ConsumerManager:
         
         # Reset tasks list to avoid accumulating stale tasks
         self._tasks = []
+        await telemetry_coalescer.start()
+        await correlation_engine.start()
+        if position_store is not None:
+            await position_store.start()
 
         if settings.DEMO_NO_REDIS:
             logger.warning("[DEMO MODE] Starting In-Memory Consumers (No Redis).")
@@ -172,5 +204,10 @@ class ConsumerManager:
         if self._tasks:
             await asyncio.gather(*self._tasks, return_exceptions=True)
         self._tasks = []
+        # Consumers are stopped: nothing else will be buffered
+        await telemetry_coalescer.stop()
+        await correlation_engine.stop()
+        if position_store is not None:
+            await position_store.stop()
 
 consumer_manager = ConsumerManager()
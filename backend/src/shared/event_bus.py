@@ -90,24 +90,23 @@ class EventBus:
         ts = int(datetime.utcnow().timestamp() * 1000)
         return f"{ts}-{len(cls._demo_events)}"
 
-    @classmethod
-    async def publish(cls, event_type: str, payload: dict, source_context: str, severity: str = "info", correlation_id: str = None, entity_refs: dict = None, stream: str = GLOBAL_STREAM):
-        event_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat()
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
-
-        envelope = {
-            "event_id": event_id,
+    @staticmethod
+    def _envelope(event_type: str, payload: dict, source_context: str, severity: str = "info", correlation_id: str = None, entity_refs: dict = None) -> Dict[str, str]:
+        return {
+            "event_id": str(uuid.uuid4()),
             "event_type": event_type,
             "source_context": source_context,
             "severity": severity,
-            "timestamp": timestamp,
-            "correlation_id": correlation_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "correlation_id": correlation_id or str(uuid.uuid4()),
             "entity_refs": json.dumps(entity_refs or {}),
             "payload": json.dumps(payload),
         }
 
+    @classmethod
+    async def publish(cls, event_type: str, payload: dict, source_context: str, severity: str = "info", correlation_id: str = None, entity_refs: dict = None, stream: str = GLOBAL_STREAM):
+        envelope = cls._envelope(event_type, payload, source_context, severity, correlation_id, entity_refs)
+
         # --- DEMO MODE ---
         if cls._is_demo_mode:
             stream_id = cls._generate_demo_id()
@@ -127,6 +126,42 @@ class EventBus:
         r = await cls.get_redis()
         return await r.xadd(stream, envelope)
 
+    @classmethod
+    async def publish_batch(cls, events: List[Dict[str, Any]], stream: str = GLOBAL_STREAM) -> List[str]:
+        """
+        Publishes many events at once. Each item takes publish()'s keyword arguments
+        (event_type, payload, source_context, severity, correlation_id, entity_refs).
+        Redis: one pipelined round trip. Demo: one lock acquisition, one notify.
+        Returns stream ids in input order.
+        """
+        if not events:
+            return []
+        envelopes = [cls._envelope(**event) for event in events]
+
+        # --- DEMO MODE ---
+        if cls._is_demo_mode:
+            ids = []
+            if cls._demo_cond:
+                async with cls._demo_cond:
+                    for envelope in envelopes:
+                        stream_id = cls._generate_demo_id()
+                        cls._demo_events.append((stream_id, envelope))
+                        ids.append(stream_id)
+                    cls._demo_cond.notify_all()
+            else:
+                for envelope in envelopes:
+                    stream_id = cls._generate_demo_id()
+                    cls._demo_events.append((stream_id, envelope))
+                    ids.append(stream_id)
+            return ids
+
+        # --- REDIS MODE ---
+        r = await cls.get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            for envelope in envelopes:
+                pipe.xadd(stream, envelope)
+            return await pipe.execute()
+
     @classmethod
     async def read_next_for_sse(cls, last_id: str = "$", block_ms: int = 5000) -> Optional[Tuple[str, Dict[str, Any]]]:
         # --- DEMO MODE ---
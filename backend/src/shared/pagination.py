@@ -0,0 +1,90 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid pagination cursor '{cursor}'")
+
+
+class Page(NamedTuple):
+    items: List[Any]  # dicts or asyncpg Records
+    next_cursor: Optional[str]
+
+
+def encode_cursor(created_at: datetime, row_id: Any) -> str:
+    """Opaque cursor for the (created_at, id) keyset of the last row of a page."""
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    # Paginated tables are keyed by uuid: a malformed id would otherwise fail in the query
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["c"]), str(uuid.UUID(data["i"]))
+    except Exception:
+        raise InvalidCursorError(cursor)
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def keyset_query(
+    table: str,
+    columns: Sequence[str],
+    filters: Dict[str, Any],
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[str, List[Any]]:
+    """
+    SELECT for one page, newest first, walking the (created_at DESC, id DESC) index.
+    `filters` maps trusted column names to values; None values are skipped.
+    Fetches limit + 1 rows so build_page can tell whether a next page exists.
+    """
+    clauses, args = [], []
+    for column, value in filters.items():
+        if value is None:
+            continue
+        args.append(value)
+        clauses.append(f"{column} = ${len(args)}")
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        args.extend([created_at, row_id])
+        clauses.append(f"(created_at, id) < (${len(args) - 1}, ${len(args)})")
+
+    args.append(limit + 1)
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+    sql = (
+        f"SELECT {', '.join(columns)} FROM {table} {where}"
+        f"ORDER BY created_at DESC, id DESC LIMIT ${len(args)}"
+    )
+    return sql, args
+
+
+def build_page(
+    rows: Sequence[Any], limit: int, serialize: Optional[Callable[[Any], Dict[str, Any]]] = None
+) -> Page:
+    """
+    Without `serialize` the items are the asyncpg Records themselves
+    (read-only mapping access, no intermediate dict per row).
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"]) if has_more else None
+    items = list(rows) if serialize is None else [serialize(row) for row in rows]
+    return Page(items, next_cursor)
@@ -0,0 +1,243 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.shared.event_bus import event_bus
+from src.shared.consumers import normalize_message, get_any, generate_uuid_from_string
+from src.infrastructure.database import db
+
+logger = logging.getLogger(__name__)
+
+INCIDENT_COLUMNS = ["id", "type", "severity", "state", "correlation_id", "created_at", "closed_at"]
+
+
+def _parse_event_timestamp(value: Any) -> datetime:
+    """Envelope timestamps are naive UTC ISO strings (EventBus.publish)."""
+    try:
+        ts = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return datetime.now(timezone.utc)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+class IncidentProjection:
+    """
+    In-memory fold of incident.* events into `incidents` rows.
+    Mirrors the semantics of ConsumerManager.process_event:
+    - incident.created inserts once (ON CONFLICT DO NOTHING)
+    - incident.state_changed updates state of a known incident
+    """
+
+    def __init__(self):
+        self.rows: Dict[str, List[Any]] = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def apply(self, event_data: Dict[str, Any]) -> None:
+        event_type = (event_data.get("event_type") or "").strip()
+        payload = event_data.get("payload", {})
+
+        if event_type == "incident.created":
+            inc_id = get_any(payload, ["id", "incidentId", "incident_id"])
+            if not inc_id:
+                self.skipped += 1
+                return
+            db_id = generate_uuid_from_string(inc_id)
+            if db_id in self.rows:
+                return
+            corr_id = get_any(payload, ["correlation_id", "correlationId"]) or event_data.get("correlation_id")
+            self.rows[db_id] = [
+                db_id,
+                get_any(payload, ["type", "incidentType"], "UNKNOWN"),
+                get_any(payload, ["severity"], "info"),
+                get_any(payload, ["state"], "New"),
+                generate_uuid_from_string(corr_id or db_id),
+                _parse_event_timestamp(event_data.get("timestamp")),
+                None,
+            ]
+            self.applied += 1
+
+        elif event_type == "incident.state_changed":
+            inc_id = get_any(payload, ["incident_id", "incidentId", "id"])
+            to_state = get_any(payload, ["to_state", "toState", "state"])
+            if not inc_id or not to_state:
+                self.skipped += 1
+                return
+            row = self.rows.get(generate_uuid_from_string(inc_id))
+            if row is None:
+                # Live consumer UPDATE would match nothing either
+                self.skipped += 1
+                return
+            row[3] = to_state
+            self.applied += 1
+
+    def records(self) -> Iterator[Tuple[Any, ...]]:
+        for row in self.rows.values():
+            yield tuple(row)
+
+
+class ReadModelRebuilder:
+    """
+    Rebuilds the `incidents` read model from the full event history.
+
+    1. Streams the global stream with large XRANGE pages (no consumer group).
+    2. Folds events in memory (IncidentProjection).
+    3. COPYs the result into a staging table.
+    4. Merges staging into `incidents` inside one short transaction.
+
+    The merge (rather than a RENAME swap) keeps the foreign keys held by
+    `tickets` and `incident_transitions` pointing at the live table; readers
+    see either the old or the rebuilt projection, never a mix.
+    """
+
+    STAGING_TABLE = "incidents_rebuild"
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        pool: Any = None,
+        stream: str = event_bus.GLOBAL_STREAM,
+        page_size: int = 10000,
+    ):
+        self._redis = redis_client
+        self._pool = pool
+        self.stream = stream
+        self.page_size = page_size
+
+    async def _get_redis(self):
+        if self._redis is None:
+            self._redis = await event_bus.get_redis()
+        return self._redis
+
+    async def _get_pool(self):
+        if self._pool is None:
+            self._pool = await db.get_pool()
+        return self._pool
+
+    async def iter_pages(self, start_id: str = "-", end_id: str = "+") -> AsyncIterator[List[Tuple[str, Dict[str, Any]]]]:
+        """Yields XRANGE pages until the stream is exhausted."""
+        r = await self._get_redis()
+        cursor = start_id
+        while True:
+            page = await r.xrange(self.stream, min=cursor, max=end_id, count=self.page_size)
+            if not page:
+                return
+            yield page
+            if len(page) < self.page_size:
+                return
+            # Exclusive continuation (Redis >= 6.2), same as EventBus.list_events
+            cursor = "(" + page[-1][0]
+
+    async def replay(
+        self,
+        projection: IncidentProjection,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        stats = {"events": 0, "pages": 0, "last_id": None, "elapsed_s": 0.0, "events_per_s": 0.0}
+        started = time.perf_counter()
+
+        async for page in self.iter_pages():
+            for message_id, message_data in page:
+                projection.apply(normalize_message(message_data))
+            stats["events"] += len(page)
+            stats["pages"] += 1
+            stats["last_id"] = page[-1][0]
+
+            elapsed = time.perf_counter() - started
+            stats["elapsed_s"] = elapsed
+            stats["events_per_s"] = stats["events"] / elapsed if elapsed > 0 else 0.0
+            logger.info(
+                f"[rebuild] {stats['events']} events replayed "
+                f"({stats['events_per_s']:.0f} ev/s, last_id={stats['last_id']})"
+            )
+            if on_progress:
+                on_progress(dict(stats))
+
+        return stats
+
+    async def load_and_swap(self, projection: IncidentProjection, prune: bool = False) -> Dict[str, int]:
+        """
+        COPY the projection into a staging table, then merge it into
+        `incidents` atomically. With prune=True, incidents absent from the
+        history (and not referenced by a ticket) are removed.
+        """
+        pool = await self._get_pool()
+        staging = self.STAGING_TABLE
+        result = {"copied": 0, "upserted": 0, "pruned": 0}
+
+        async with pool.acquire() as conn:
+            await conn.execute(f"DROP TABLE IF EXISTS {staging}")
+            await conn.execute(f"CREATE TEMP TABLE {staging} (LIKE incidents INCLUDING DEFAULTS)")
+            # Pool connections decode uuid as text (see database.py), a codec binary COPY
+            # cannot encode: stage ids as text and cast during the merge.
+            await conn.execute(
+                f"ALTER TABLE {staging} ALTER COLUMN id TYPE TEXT, ALTER COLUMN correlation_id TYPE TEXT"
+            )
+            try:
+                # Bulk load happens outside the swap transaction (no locks on incidents)
+                await conn.copy_records_to_table(staging, records=projection.records(), columns=INCIDENT_COLUMNS)
+                result["copied"] = len(projection.rows)
+
+                async with conn.transaction():
+                    await conn.execute("LOCK TABLE incidents IN SHARE ROW EXCLUSIVE MODE")
+                    status = await conn.execute(
+                        f"""
+                        INSERT INTO incidents (id, type, severity, state, correlation_id, created_at, closed_at)
+                        SELECT id::uuid, type, severity, state, correlation_id::uuid, created_at, closed_at FROM {staging}
+                        ON CONFLICT (id) DO UPDATE
+                        SET type = EXCLUDED.type,
+                            severity = EXCLUDED.severity,
+                            state = EXCLUDED.state,
+                            correlation_id = EXCLUDED.correlation_id,
+                            created_at = EXCLUDED.created_at,
+                            closed_at = EXCLUDED.closed_at
+                        WHERE (incidents.type, incidents.severity, incidents.state, incidents.correlation_id,
+                               incidents.created_at, incidents.closed_at)
+                              IS DISTINCT FROM
+                              (EXCLUDED.type, EXCLUDED.severity, EXCLUDED.state, EXCLUDED.correlation_id,
+                               EXCLUDED.created_at, EXCLUDED.closed_at)
+                        """
+                    )
+                    result["upserted"] = _status_count(status)
+
+                    if prune:
+                        status = await conn.execute(
+                            f"""
+                            DELETE FROM incidents i
+                            WHERE NOT EXISTS (SELECT 1 FROM {staging} s WHERE s.id::uuid = i.id)
+                              AND NOT EXISTS (SELECT 1 FROM tickets t WHERE t.incident_id = i.id)
+                            """
+                        )
+                        result["pruned"] = _status_count(status)
+            finally:
+                await conn.execute(f"DROP TABLE IF EXISTS {staging}")
+
+        return result
+
+    async def run(
+        self,
+        prune: bool = False,
+        dry_run: bool = False,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        projection = IncidentProjection()
+        stats = await self.replay(projection, on_progress=on_progress)
+        stats["incidents"] = len(projection.rows)
+        stats["skipped"] = projection.skipped
+
+        if not dry_run:
+            stats.update(await self.load_and_swap(projection, prune=prune))
+
+        logger.info(f"[rebuild] done: {stats}")
+        return stats
+
+
+def _status_count(status: Optional[str]) -> int:
+    """Parse asyncpg command tags such as 'INSERT 0 12' or 'DELETE 3'."""
+    try:
+        return int((status or "").split(" ")[-1])
+    except ValueError:
+        return 0
@@ -0,0 +1,68 @@
+import math
+from typing import Dict, Hashable, List, Tuple
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: `slots` buckets of `tick_s` seconds each, one timer
+    per key. A timer lands in bucket (deadline tick % slots), so scheduling
+    is O(1) and advance() visits only the buckets the clock has passed,
+    whatever the number of pending timers. Timers more than one revolution
+    out stay in their bucket until their own tick comes round.
+
+    Rescheduling or cancelling a key does not search its bucket: the old
+    entry no longer matches the key's deadline and is dropped when visited.
+    Timers fire on the first advance() at or after their deadline, at most
+    one tick late.
+    """
+
+    def __init__(self, tick_s: float = 1.0, slots: int = 512, now: float = 0.0):
+        if tick_s <= 0 or slots <= 0:
+            raise ValueError("tick_s and slots must be positive")
+        self.tick_s = tick_s
+        self.slots = slots
+        self._buckets: List[List[Tuple[int, Hashable]]] = [[] for _ in range(slots)]
+        self._deadlines: Dict[Hashable, int] = {}
+        self._tick = int(now // tick_s)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> float:
+        """When `key` fires (rounded up to its tick); KeyError when it has no timer."""
+        return self._deadlines[key] * self.tick_s
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Sets (or moves) the key's timer. Deadlines already passed fire on the next tick."""
+        tick = max(math.ceil(deadline / self.tick_s), self._tick + 1)
+        if self._deadlines.get(key) == tick:
+            return
+        self._deadlines[key] = tick
+        self._buckets[tick % self.slots].append((tick, key))
+
+    def cancel(self, key: Hashable) -> bool:
+        return self._deadlines.pop(key, None) is not None
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Moves the clock to `now`; returns the keys whose timers fired."""
+        target = int(now // self.tick_s)
+        due: List[Hashable] = []
+        # Past one revolution every bucket has been visited once already
+        for tick in range(self._tick + 1, self._tick + 1 + min(target - self._tick, self.slots)):
+            index = tick % self.slots
+            keep = []
+            for entry in self._buckets[index]:
+                entry_tick, key = entry
+                if self._deadlines.get(key) != entry_tick:
+                    continue  # cancelled or rescheduled
+                if entry_tick <= target:
+                    del self._deadlines[key]
+                    due.append(key)
+                else:
+                    keep.append(entry)
+            self._buckets[index] = keep
+        self._tick = max(self._tick, target)
+        return due
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from src.shared.event_bus import event_bus
-from src.simulation.scenarios import run_default_scenario
+from src.simulation.scenarios import publish_signal, run_default_scenario
 import uuid
 import datetime
 
@@ -39,40 +39,14 @@ async def trigger_fleet_action(action: str, background_tasks: BackgroundTasks):
             }
         }
         
-        # NOTE: fleet.* events are canonical for backend/analytics; OPS UI relies on incident.created in MVP.
-        
-        # 1. Publish Fleet Event (Canonical)
-        await event_bus.publish(
-            event_type="fleet.overspeed_detected",
-            source_context="simulation",
-            correlation_id=correlation_id,
-            entity_refs={"scenarioRunId": scenario_run_id},
-            payload=common_payload
-        )
-        
-        # 2. Publish Incident Event (Ops Feed Visibility)
-        incident_id = str(uuid.uuid4())
-        incident_payload = {
-            "id": incident_id,
-            "type": "FLEET_OVERSPEED",
-            "severity": "warning",
-            "state": "New",
-            "correlation_id": correlation_id,
-            **common_payload
-        }
-        
-        await event_bus.publish(
-            event_type="incident.created",
-            source_context="simulation",
-            correlation_id=correlation_id,
-            entity_refs={"scenarioRunId": scenario_run_id},
-            payload=incident_payload
-        )
+        # Publish the fleet signal only: the correlation engine raises (or updates)
+        # the incident, so repeated triggers for one vehicle join one incident.
+        await publish_signal(event_bus, "fleet.overspeed_detected", correlation_id, scenario_run_id, common_payload)
         
         return {
             "status": "triggered", 
             "action": "overspeed", 
-            "incident_id": incident_id,
+            "correlation_id": correlation_id,
             "run_id": scenario_run_id
         }
 
@@ -93,39 +67,14 @@ async def trigger_fleet_action(action: str, background_tasks: BackgroundTasks):
             }
         }
 
-        # NOTE: fleet.* events are canonical for backend/analytics; OPS UI relies on incident.created in MVP.
-        
-        # 1. Publish Fleet Event (Canonical)
-        await event_bus.publish(
-            event_type="fleet.geofence_breached",
-            source_context="simulation",
-            correlation_id=correlation_id,
-            entity_refs={"scenarioRunId": scenario_run_id},
-            payload=common_payload
-        )
+        # Publish the fleet signal only: the correlation engine raises (or updates)
+        # the incident, so repeated triggers for one vehicle join one incident.
+        await publish_signal(event_bus, "fleet.geofence_breached", correlation_id, scenario_run_id, common_payload)
 
-        # 2. Publish Incident Event (Ops Feed Visibility)
-        incident_id = str(uuid.uuid4())
-        incident_payload = {
-            "id": incident_id,
-            "type": "GEOFENCE_BREACH",
-            "severity": "critical",
-            "state": "New",
-            "correlation_id": correlation_id,
-            **common_payload
-        }
-        
-        await event_bus.publish(
-            event_type="incident.created",
-            source_context="simulation",
-            correlation_id=correlation_id,
-            entity_refs={"scenarioRunId": scenario_run_id},
-            payload=incident_payload
-        )
         return {
             "status": "triggered", 
             "action": "geofence", 
-            "incident_id": incident_id,
+            "correlation_id": correlation_id,
             "run_id": scenario_run_id
         }
 
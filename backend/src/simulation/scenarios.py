@@ -1,6 +1,8 @@
 import asyncio
 import uuid
 import datetime
+from src.infrastructure.demo import is_demo_mode
+from src.soc.correlation import correlation_engine
 
 # Canonical Zone IDs
 ZONE_AIRSIDE = "AIRSIDE_PERIMETER"
@@ -155,10 +157,21 @@ async def publish_fleet_event(event_bus, event_type, asset_id, driver, zone, x,
         "evidenceRefs": evidence
     }
     
-    await event_bus.publish(
+    await publish_signal(event_bus, event_type, correlation_id, scenario_run_id, payload)
+
+async def publish_signal(event_bus, event_type, correlation_id, scenario_run_id, payload):
+    """
+    Publishes a fleet.* signal. Incidents are raised from signals by the
+    correlation engine, fed by the consumers; demo mode runs no consumers,
+    so the signal is correlated here instead.
+    """
+    signal_id = await event_bus.publish(
         event_type=event_type,
         source_context="simulation",
         correlation_id=correlation_id,
         entity_refs={"scenarioRunId": scenario_run_id},
         payload=payload
     )
+    if is_demo_mode():
+        correlation_engine.observe(signal_id, event_type, payload, correlation_id)
+    return signal_id
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from typing import List, Optional
 from datetime import datetime, timezone
 import uuid
 
 from src.soc.service import SocService, IncidentNotFoundError, InvalidTransitionError, ConcurrentModificationError
 from src.ticketing.service import TicketService
 from src.soc.schemas import IncidentResponse, IncidentTransitionRequest, IncidentTransitionResponse, EscalationResponse, EvidenceItem, ClaimResponse
+from src.soc.schemas import BulkEscalationRequest, BulkEscalationResult, BulkEscalationResponse
+from src.soc.schemas import BulkTransitionRequest, BulkTransitionResult, BulkTransitionResponse
+from src.infrastructure.demo import is_demo_mode
+from src.shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursorError
 
 router = APIRouter(tags=["SOC"])
 
@@ -16,9 +20,55 @@ def get_ticket_service():
     return TicketService()
 
 @router.get("/incidents", response_model=List[IncidentResponse])
-async def get_incidents():
-    # rows = await service.list_incidents()
-    rows = [] # Bypass DB for now to resolve stuck loading
+async def get_incidents(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    state: Optional[str] = None,
+    severity: Optional[str] = None,
+    type: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    service: SocService = Depends(get_soc_service)
+):
+    # 1. Real Production Logic: one keyset page, next cursor in X-Next-Cursor
+    if not is_demo_mode():
+        # Open incidents come from the in-memory read model, versioned by ETag;
+        # Closed ones (and everything before warm-up) from Postgres
+        read_model = service.read_model
+        live = read_model.serves(state)
+        if live:
+            etag = read_model.etag()
+            if if_none_match == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+        try:
+            if live:
+                page = read_model.page(
+                    limit=limit, cursor=cursor, state=state, severity=severity, incident_type=type
+                )
+            else:
+                page = await service.list_incidents(
+                    limit=limit, cursor=cursor, state=state, severity=severity, incident_type=type
+                )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if live:
+            response.headers["ETag"] = etag
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return [
+            IncidentResponse(
+                id=row['id'],
+                type=row['type'],
+                severity=row['severity'],
+                state=row['state'],
+                created_at_utc=row['created_at'],
+                correlation_id=row['correlation_id'],
+                location=row.get('location') if live else None
+            )
+            for row in page.items
+        ]
+
+    rows = [] # Demo Mode: synthetic incidents only
     
     # Map raw rows to Pydantic
     incidents = []
@@ -99,17 +149,11 @@ async def transition_incident(
         raise HTTPException(status_code=400, detail="Invalid Incident UUID format")
 
     try:
-        success = await service.transition_incident(id, transition.to_state, transition.triggered_by)
-        if not success:
-             # Should technically act like idempotent success or conflict?
-             # For now, if service returns False, it implies no-op or stale check fail handled by exceptions
-             pass
-             
-        # Fetch updated state for response
-        incident = await service.get_incident(id)
+        # The transition returns the new row (or the unchanged state when idempotent): no re-fetch
+        result = await service.transition_incident(id, transition.to_state, transition.triggered_by)
         return IncidentTransitionResponse(
-            id=str(incident['id']),
-            state=incident['state'],
+            id=id,
+            state=result['new_state'],
             updated_at_utc=datetime.now(timezone.utc) # Approx, or add updated_at to DB
         )
         
@@ -120,6 +164,87 @@ async def transition_incident(
     except ConcurrentModificationError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
+@router.post("/incidents/transition", response_model=BulkTransitionResponse)
+async def transition_incidents(
+    request: BulkTransitionRequest,
+    service: SocService = Depends(get_soc_service)
+):
+    """
+    Batch transitions (e.g. closing out a shift): one set-based CAS statement,
+    one event batch. Per-item results in request order.
+    """
+    transitions, invalid_ids = [], set()
+    for index, item in enumerate(request.transitions):
+        try:
+            uuid.UUID(item.incident_id)
+        except ValueError:
+            invalid_ids.add(index)
+            continue
+        transitions.append(item.model_dump())
+
+    # Invalid ids never reach the service; it classifies everything else, in order
+    results = iter(await service.transition_incidents_bulk(transitions, request.triggered_by) if transitions else [])
+    ordered = [
+        BulkTransitionResult(incident_id=item.incident_id, status="invalid", error="Invalid Incident UUID format")
+        if index in invalid_ids else BulkTransitionResult(**next(results))
+        for index, item in enumerate(request.transitions)
+    ]
+
+    return BulkTransitionResponse(
+        transitioned=sum(r.status == "success" for r in ordered),
+        results=ordered
+    )
+
+@router.post("/incidents/escalate", response_model=BulkEscalationResponse)
+async def escalate_incidents(
+    request: BulkEscalationRequest,
+    soc_service: SocService = Depends(get_soc_service),
+    ticket_service: TicketService = Depends(get_ticket_service)
+):
+    """
+    Batch escalation (e.g. alarm storms): one set-based transition, one set-based
+    idempotent ticket insert, one event batch per step. Per-incident results.
+    """
+    results = {}
+    valid_ids = []
+    for incident_id in request.incident_ids:
+        try:
+            uuid.UUID(incident_id)
+            valid_ids.append(incident_id)
+        except ValueError:
+            results.setdefault(incident_id, BulkEscalationResult(
+                incident_id=incident_id, status="invalid_id", error="Invalid Incident UUID format"
+            ))
+
+    # 1. Transition all incidents to Escalated
+    transitions = await soc_service.transition_incidents(valid_ids, "Escalated", request.triggered_by) if valid_ids else []
+
+    # 2. Tickets for every incident now escalated (new or already)
+    escalated = [t for t in transitions if t["status"] in ("transitioned", "unchanged")]
+    tickets = await ticket_service.create_tickets_from_incidents(
+        [{**t["incident"], "id": t["incident_id"]} for t in escalated]
+    ) if escalated else []
+    tickets_by_incident = {t["incident_id"]: t for t in tickets}
+
+    for t in transitions:
+        if t["status"] == "duplicate":
+            continue
+        ticket = tickets_by_incident.get(t["incident_id"])
+        status = {"transitioned": "escalated", "unchanged": "already_escalated"}.get(t["status"], t["status"])
+        results[t["incident_id"]] = BulkEscalationResult(
+            incident_id=t["incident_id"],
+            status=status,
+            ticket_id=ticket["ticket_id"] if ticket else None,
+            ticket_status=ticket["ticket_status"] if ticket else None,
+            error=t["error"]
+        )
+
+    ordered = [results[i] for i in dict.fromkeys(request.incident_ids)]
+    return BulkEscalationResponse(
+        escalated=sum(r.status == "escalated" for r in ordered),
+        results=ordered
+    )
+
 @router.post("/incidents/{id}/escalate", response_model=EscalationResponse)
 async def escalate_incident(
     id: str,
@@ -134,12 +259,12 @@ async def escalate_incident(
 
     # 1. Transition Incident
     try:
-        await soc_service.transition_incident(id, "Escalated", transition.triggered_by)
+        result = await soc_service.transition_incident(id, "Escalated", transition.triggered_by)
     except IncidentNotFoundError as e:
          raise HTTPException(status_code=404, detail=str(e))
 
-    # 2. Fetch Incident
-    incident = await soc_service.get_incident(id)
+    # 2. Incident row comes back with the transition; fetch only if it was already escalated
+    incident = result.get("incident") or await soc_service.get_incident(id)
     if not incident:
          raise HTTPException(404, "Incident lost during escalation")
          
@@ -0,0 +1,294 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.settings import settings
+from src.shared.event_bus import event_bus
+from src.shared.timer_wheel import TimerWheel
+
+logger = logging.getLogger(__name__)
+
+# Fleet signal event types that raise incidents: (incident type, severity)
+SIGNAL_TYPES: Dict[str, Tuple[str, str]] = {
+    "fleet.collision_detected": ("FLEET_COLLISION", "critical"),
+    "fleet.geofence_breached": ("GEOFENCE_BREACH", "critical"),
+    "fleet.overspeed_detected": ("FLEET_OVERSPEED", "warning"),
+}
+# Signal ids remembered after their incident's window closed (redelivery guard)
+SEEN_SIGNALS_MAX = 10_000
+
+ClusterKey = Tuple[Optional[str], Optional[str], str]
+
+
+class Cluster:
+    __slots__ = (
+        "key", "incident_id", "correlation_id", "severity", "opened_at", "last_at",
+        "window_s", "signal_count", "pending", "flush_at", "last_payload",
+    )
+
+    def __init__(self, key: ClusterKey, correlation_id: str, severity: str, now: float, window_s: float):
+        self.key = key
+        self.incident_id = str(uuid.uuid4())
+        self.correlation_id = correlation_id
+        self.severity = severity
+        self.opened_at = now
+        self.last_at = now
+        self.window_s = window_s
+        self.signal_count = 0
+        # Signal refs not yet reported in an incident.* event
+        self.pending: List[Dict[str, Any]] = []
+        self.flush_at: Optional[float] = None
+        self.last_payload: Dict[str, Any] = {}
+
+    def closes_at(self, max_window_s: float) -> float:
+        return min(self.last_at + self.window_s, self.opened_at + max_window_s)
+
+
+class CorrelationEngine:
+    """
+    Groups fleet signals into incidents by (asset, zone, incident type).
+
+    The first signal for a key opens a cluster and queues incident.created
+    (the signal's payload plus a `signals` ref list). Signals arriving within
+    the window of the previous one join it; their refs are reported in one
+    incident.updated per update interval, so a storm of N signals costs one
+    incident and at most one update per interval instead of N incidents.
+    A cluster closes once it has been quiet for its window, or at the max
+    window, with a final incident.updated (`windowClosed: true`) if signals
+    are still unreported; the next signal for that key opens a new incident.
+
+    Each cluster has one timer in a TimerWheel. Signals only move `last_at`;
+    the timer is pushed out lazily when it fires early, so the hot path never
+    reschedules. Events go to an outbox published by the background loop
+    (one publish_batch per tick), and signal ids (event_id) already seen are
+    ignored, so redelivered signals do not count twice.
+
+    State is per process: with several consumers in a group, signals for one
+    key spread across processes correlate per process.
+    """
+
+    def __init__(
+        self,
+        window_s: Optional[float] = None,
+        max_window_s: Optional[float] = None,
+        update_interval_s: Optional[float] = None,
+        windows: Optional[Dict[str, float]] = None,
+        max_signal_refs: Optional[int] = None,
+        tick_s: Optional[float] = None,
+        now: Optional[float] = None,
+    ):
+        self.window_s = window_s or settings.CORRELATION_WINDOW_S
+        self.max_window_s = max_window_s or settings.CORRELATION_MAX_WINDOW_S
+        self.update_interval_s = settings.CORRELATION_UPDATE_INTERVAL_S if update_interval_s is None else update_interval_s
+        self.windows = settings.CORRELATION_WINDOWS_S if windows is None else windows
+        self.max_signal_refs = max_signal_refs or settings.CORRELATION_MAX_SIGNAL_REFS
+        self.tick_s = tick_s or settings.CORRELATION_TICK_S
+
+        self.wheel = TimerWheel(self.tick_s, now=time.time() if now is None else now)
+        self._clusters: Dict[ClusterKey, Cluster] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._outbox: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._wake: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._clusters)
+
+    @property
+    def pending(self) -> int:
+        return len(self._outbox)
+
+    def get(self, key: ClusterKey) -> Optional[Cluster]:
+        return self._clusters.get(key)
+
+    @staticmethod
+    def key_for(event_type: str, payload: Dict[str, Any]) -> Optional[ClusterKey]:
+        signal = SIGNAL_TYPES.get(event_type)
+        if signal is None:
+            return None
+        asset_id = payload.get("vehicleId") or payload.get("assetId") or payload.get("robotId")
+        return (
+            str(asset_id) if asset_id is not None else None,
+            payload.get("zoneId") or payload.get("zone_id"),
+            signal[0],
+        )
+
+    def _remember(self, signal_id: str) -> bool:
+        if signal_id in self._seen:
+            return False
+        self._seen[signal_id] = None
+        if len(self._seen) > SEEN_SIGNALS_MAX:
+            self._seen.popitem(last=False)
+        return True
+
+    def observe(
+        self,
+        signal_id: Optional[str],
+        event_type: str,
+        payload: Dict[str, Any],
+        correlation_id: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Feeds one fleet signal; returns the id of the incident it joined, or
+        None for non-signal event types and signals already seen.
+        """
+        key = self.key_for(event_type, payload)
+        if key is None:
+            return None
+        signal_id = signal_id or str(uuid.uuid4())
+        if not self._remember(signal_id):
+            return None
+        now = time.time() if now is None else now
+        ref = {"signalId": signal_id, "eventType": event_type, "timestamp": payload.get("timestamp")}
+
+        cluster = self._clusters.get(key)
+        if cluster is not None and now >= cluster.closes_at(self.max_window_s):
+            # Window lapsed but its timer has not fired yet
+            self._close(cluster)
+            cluster = None
+
+        if cluster is None:
+            window_s = self.windows.get(event_type, self.window_s)
+            cluster = Cluster(key, correlation_id or signal_id, SIGNAL_TYPES[event_type][1], now, window_s)
+            cluster.signal_count = 1
+            cluster.last_payload = payload
+            self._clusters[key] = cluster
+            self._outbox.append(self._created(cluster, payload, ref))
+            self.wheel.schedule(key, cluster.closes_at(self.max_window_s))
+            return cluster.incident_id
+
+        cluster.signal_count += 1
+        cluster.last_at = now
+        cluster.last_payload = payload
+        cluster.pending.append(ref)
+        if cluster.flush_at is None:
+            cluster.flush_at = now + self.update_interval_s
+            if cluster.flush_at < self.wheel.deadline(key):
+                self.wheel.schedule(key, cluster.flush_at)
+        return cluster.incident_id
+
+    def tick(self, now: Optional[float] = None) -> int:
+        """Runs due cluster timers: queues incident.updated, closes quiet clusters. Returns clusters closed."""
+        now = time.time() if now is None else now
+        closed = 0
+        for key in self.wheel.advance(now):
+            cluster = self._clusters.get(key)
+            if cluster is None:
+                continue
+            closes_at = cluster.closes_at(self.max_window_s)
+            if now >= closes_at:
+                self._close(cluster)
+                closed += 1
+                continue
+            if cluster.flush_at is not None and now >= cluster.flush_at:
+                self._outbox.append(self._updated(cluster, window_closed=False))
+            self.wheel.schedule(key, closes_at if cluster.flush_at is None else min(closes_at, cluster.flush_at))
+        return closed
+
+    def _close(self, cluster: Cluster) -> None:
+        if cluster.pending:
+            self._outbox.append(self._updated(cluster, window_closed=True))
+        self.wheel.cancel(cluster.key)
+        del self._clusters[cluster.key]
+
+    def _refs(self, cluster: Cluster) -> List[Dict[str, Any]]:
+        refs, cluster.pending, cluster.flush_at = cluster.pending, [], None
+        return refs[-self.max_signal_refs:]
+
+    def _envelope(self, event_type: str, cluster: Cluster, payload: Dict[str, Any]) -> Dict[str, Any]:
+        asset_id, zone_id, _ = cluster.key
+        return {
+            "event_type": event_type,
+            "source_context": "soc",
+            "severity": cluster.severity,
+            "correlation_id": cluster.correlation_id,
+            "entity_refs": {"assetId": asset_id, "zoneId": zone_id, "incidentId": cluster.incident_id},
+            "payload": payload,
+        }
+
+    def _created(self, cluster: Cluster, payload: Dict[str, Any], ref: Dict[str, Any]) -> Dict[str, Any]:
+        # Same shape the simulation used to publish per signal, plus the signal refs
+        return self._envelope("incident.created", cluster, {
+            **payload,
+            "id": cluster.incident_id,
+            "type": cluster.key[2],
+            "severity": cluster.severity,
+            "state": "New",
+            "correlation_id": cluster.correlation_id,
+            "signalCount": 1,
+            "signals": [ref],
+        })
+
+    def _updated(self, cluster: Cluster, window_closed: bool) -> Dict[str, Any]:
+        asset_id, zone_id, incident_type = cluster.key
+        last = cluster.last_payload
+        return self._envelope("incident.updated", cluster, {
+            "id": cluster.incident_id,
+            "type": incident_type,
+            "severity": cluster.severity,
+            "correlation_id": cluster.correlation_id,
+            "vehicleId": asset_id,
+            "zoneId": zone_id,
+            "location": last.get("location"),
+            "timestamp": last.get("timestamp"),
+            "signalCount": cluster.signal_count,
+            "signals": self._refs(cluster),
+            "windowClosed": window_closed,
+        })
+
+    def drain(self) -> List[Dict[str, Any]]:
+        events, self._outbox = self._outbox, []
+        return events
+
+    async def flush(self) -> int:
+        """Publishes the outbox in one batch; on failure or cancellation it is kept for the next attempt."""
+        events = self.drain()
+        if not events:
+            return 0
+        try:
+            await event_bus.publish_batch(events)
+        except BaseException:
+            self._outbox[:0] = events
+            raise
+        return len(events)
+
+    async def _loop(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.tick_s)
+            except asyncio.TimeoutError:
+                pass
+            if not self._running:
+                break
+            try:
+                self.tick()
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Incident correlation flush failed ({self.pending} events pending): {e}")
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        # Wake the loop rather than cancel it: a publish in progress finishes first
+        self._running = False
+        if self._task:
+            self._wake.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final correlation flush failed, {self.pending} events dropped: {e}")
+
+
+correlation_engine = CorrelationEngine()
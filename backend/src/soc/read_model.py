@@ -0,0 +1,190 @@
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.shared.pagination import Page, clamp_limit, decode_cursor, encode_cursor
+
+# Incidents in these states leave the projection (served from Postgres instead)
+TERMINAL_STATES = frozenset({"Closed"})
+INDEXED_FIELDS = ("state", "severity", "type")
+
+
+class IncidentView:
+    __slots__ = ("id", "type", "severity", "state", "correlation_id", "created_at", "closed_at", "location")
+
+    def __init__(
+        self,
+        id: str,
+        type: str,
+        severity: str,
+        state: str,
+        correlation_id: Optional[str],
+        created_at: datetime,
+        closed_at: Optional[datetime] = None,
+        location: Optional[dict] = None,
+    ):
+        self.id = id
+        self.type = type
+        self.severity = severity
+        self.state = state
+        self.correlation_id = correlation_id
+        self.created_at = created_at
+        self.closed_at = closed_at
+        self.location = location
+
+    @property
+    def key(self) -> Tuple[datetime, str]:
+        return self.created_at, self.id
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Same keys as an incidents row (see SocRepository.list_incidents)
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class IncidentReadModel:
+    """
+    Per-process projection of open incidents, warmed from Postgres at startup
+    and kept current by incident.* events (and by this process's own
+    transitions). Incidents are kept in (created_at, id) order with a set
+    index per state/severity/type, so list pages and filters never touch
+    the DB and use the same keyset cursors as the Postgres path.
+
+    Every change bumps `version`; etag() is derived from it, so a poll that
+    presents the current ETag can be answered 304 without building a page.
+    Versions start at the process start time (µs), so ETags from another
+    process or before a restart never match.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, IncidentView] = {}
+        self._order: List[Tuple[datetime, str]] = []
+        self._index: Dict[str, Dict[str, Set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        self.base_version = time.time_ns() // 1000
+        self.version = self.base_version
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, incident_id: str) -> Optional[IncidentView]:
+        return self._by_id.get(incident_id)
+
+    def etag(self) -> str:
+        return f'W/"incidents-{self.version}"'
+
+    # --- writes ----------------------------------------------------------------
+
+    def _unindex(self, view: IncidentView) -> None:
+        for field in INDEXED_FIELDS:
+            ids = self._index[field].get(getattr(view, field))
+            if ids is not None:
+                ids.discard(view.id)
+                if not ids:
+                    del self._index[field][getattr(view, field)]
+
+    def _index_view(self, view: IncidentView) -> None:
+        for field in INDEXED_FIELDS:
+            self._index[field].setdefault(getattr(view, field), set()).add(view.id)
+
+    def _remove(self, view: IncidentView) -> None:
+        self._unindex(view)
+        position = bisect_left(self._order, view.key)
+        if position < len(self._order) and self._order[position] == view.key:
+            del self._order[position]
+        del self._by_id[view.id]
+
+    def upsert(
+        self,
+        id: str,
+        type: str,
+        severity: str,
+        state: str,
+        correlation_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        closed_at: Optional[datetime] = None,
+        location: Optional[dict] = None,
+    ) -> Optional[IncidentView]:
+        """Adds or replaces an incident; terminal states remove it. Returns the stored view."""
+        existing = self._by_id.get(id)
+        if existing is not None:
+            created_at = created_at or existing.created_at
+            location = location or existing.location
+            self._remove(existing)
+        self.version += 1
+        if state in TERMINAL_STATES:
+            return None
+        view = IncidentView(
+            id, type, severity, state, correlation_id,
+            created_at or datetime.now(timezone.utc), closed_at, location,
+        )
+        self._by_id[id] = view
+        insort(self._order, view.key)
+        self._index_view(view)
+        return view
+
+    def set_state(self, incident_id: str, state: str) -> bool:
+        """Applies incident.state_changed. False when the incident is not in the projection."""
+        view = self._by_id.get(incident_id)
+        if view is None:
+            return False
+        if view.state == state:
+            return True
+        if state in TERMINAL_STATES:
+            self._remove(view)
+        else:
+            self._unindex(view)
+            view.state = state
+            self._index_view(view)
+        self.version += 1
+        return True
+
+    def load(self, rows: Iterable[Any]) -> int:
+        """Warms the projection from incidents rows (see SocRepository.get_open_incidents)."""
+        count = 0
+        for row in rows:
+            if self.upsert(
+                row["id"], row["type"], row["severity"], row["state"],
+                row["correlation_id"], row["created_at"], row["closed_at"],
+            ) is not None:
+                count += 1
+        self.ready = True
+        return count
+
+    # --- reads -----------------------------------------------------------------
+
+    def serves(self, state: Optional[str]) -> bool:
+        """Whether a list query can be answered here (terminal states live only in Postgres)."""
+        return self.ready and state not in TERMINAL_STATES
+
+    def page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        state: Optional[str] = None,
+        severity: Optional[str] = None,
+        incident_type: Optional[str] = None,
+    ) -> Page:
+        """Newest first, same ordering and cursors as keyset_query over incidents."""
+        limit = clamp_limit(limit)
+        bound = decode_cursor(cursor) if cursor else None
+        filters = [(f, v) for f, v in zip(INDEXED_FIELDS, (state, severity, incident_type)) if v is not None]
+
+        if filters:
+            # Smallest index set first, then sort only the survivors
+            sets = sorted((self._index[f].get(v, set()) for f, v in filters), key=len)
+            ids = set.intersection(*sets) if len(sets) > 1 else sets[0]
+            keys = sorted(self._by_id[i].key for i in ids)
+        else:
+            keys = self._order
+
+        end = bisect_left(keys, bound) if bound else len(keys)
+        start = max(0, end - (limit + 1))
+        window = keys[start:end][::-1]
+        has_more = len(window) > limit
+        views = [self._by_id[key[1]] for key in window[:limit]]
+        next_cursor = encode_cursor(*views[-1].key) if has_more else None
+        return Page([view.to_dict() for view in views], next_cursor)
+
+
+incident_read_model = IncidentReadModel()
@@ -1,6 +1,120 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from src.infrastructure.database import db
+from src.infrastructure.statements import statements
+from src.shared.pagination import Page, build_page, clamp_limit, keyset_query
 import uuid
+import datetime
+
+GET_INCIDENT = statements.register("soc.get_incident", "SELECT * FROM incidents WHERE id = $1")
+INCIDENT_LIST_COLUMNS = ("id", "type", "severity", "state", "correlation_id", "created_at", "closed_at")
+
+TRANSITION_INCIDENT = statements.register(
+    "soc.transition_incident",
+    """
+    WITH cur AS (
+      SELECT id, state FROM incidents WHERE id = $1
+    ), upd AS (
+      UPDATE incidents i
+      SET state = $2
+      FROM cur
+      WHERE i.id = cur.id
+        AND i.state = cur.state
+        AND cur.state = ANY($3::text[])
+      RETURNING i.id, i.type, i.severity, i.state, i.correlation_id, i.created_at, i.closed_at
+    ), audit AS (
+      INSERT INTO incident_transitions (id, incident_id, from_state, to_state, triggered_by, occurred_at)
+      SELECT gen_random_uuid(), upd.id, cur.state, upd.state, $4, NOW()
+      FROM upd JOIN cur ON cur.id = upd.id
+    )
+    SELECT cur.state AS previous_state, upd.id IS NOT NULL AS applied,
+           upd.id, upd.type, upd.severity, upd.state, upd.correlation_id, upd.created_at, upd.closed_at
+    FROM cur LEFT JOIN upd ON upd.id = cur.id
+    """,
+)
+# Set-based counterpart of TRANSITION_INCIDENT. Rows are locked in id order
+# (no deadlocks between concurrent batches); every found incident is returned
+# with its state after the statement.
+TRANSITION_INCIDENTS = statements.register(
+    "soc.transition_incidents",
+    """
+    WITH input AS (
+      SELECT DISTINCT id::uuid AS id FROM unnest($1::text[]) AS t(id)
+    ), cur AS (
+      SELECT i.id, i.type, i.severity, i.state, i.correlation_id, i.created_at, i.closed_at
+      FROM incidents i JOIN input ON input.id = i.id
+      ORDER BY i.id
+      FOR UPDATE OF i
+    ), upd AS (
+      UPDATE incidents i
+      SET state = $2
+      FROM cur
+      WHERE i.id = cur.id
+        AND cur.state = ANY($3::text[])
+      RETURNING i.id, i.state
+    ), audit AS (
+      INSERT INTO incident_transitions (id, incident_id, from_state, to_state, triggered_by, occurred_at)
+      SELECT gen_random_uuid(), upd.id, cur.state, upd.state, $4, NOW()
+      FROM upd JOIN cur ON cur.id = upd.id
+    )
+    SELECT cur.id, cur.state AS previous_state, upd.id IS NOT NULL AS applied,
+           cur.type, cur.severity, COALESCE(upd.state, cur.state) AS state,
+           cur.correlation_id, cur.created_at, cur.closed_at
+    FROM cur LEFT JOIN upd ON upd.id = cur.id
+    """,
+)
+# Per-item targets: each incident moves to its own to_state, only along an edge
+# of the state machine (passed in as from/to arrays) and, when expected_state
+# is given, only from that state. Same locking and result shape as above.
+TRANSITION_INCIDENTS_EACH = statements.register(
+    "soc.transition_incidents_each",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, to_state, expected_state
+      FROM unnest($1::text[], $2::text[], $3::text[]) AS t(id, to_state, expected_state)
+    ), edges AS (
+      SELECT from_state, to_state FROM unnest($4::text[], $5::text[]) AS e(from_state, to_state)
+    ), cur AS (
+      SELECT i.id, i.type, i.severity, i.state, i.correlation_id, i.created_at, i.closed_at,
+             input.to_state AS target, input.expected_state
+      FROM incidents i JOIN input ON input.id = i.id
+      ORDER BY i.id
+      FOR UPDATE OF i
+    ), upd AS (
+      UPDATE incidents i
+      SET state = cur.target
+      FROM cur
+      WHERE i.id = cur.id
+        AND (cur.expected_state IS NULL OR cur.state = cur.expected_state)
+        AND (cur.state, cur.target) IN (SELECT from_state, to_state FROM edges)
+      RETURNING i.id, i.state
+    ), audit AS (
+      INSERT INTO incident_transitions (id, incident_id, from_state, to_state, triggered_by, occurred_at)
+      SELECT gen_random_uuid(), upd.id, cur.state, upd.state, $6, NOW()
+      FROM upd JOIN cur ON cur.id = upd.id
+    )
+    SELECT cur.id, cur.state AS previous_state, upd.id IS NOT NULL AS applied,
+           cur.type, cur.severity, COALESCE(upd.state, cur.state) AS state,
+           cur.correlation_id, cur.created_at, cur.closed_at
+    FROM cur LEFT JOIN upd ON upd.id = cur.id
+    """,
+)
+GET_OPEN_INCIDENTS = statements.register(
+    "soc.get_open_incidents",
+    """
+    SELECT id, type, severity, state, correlation_id, created_at, closed_at
+    FROM incidents
+    WHERE state <> ALL($1::text[])
+    """,
+)
+GET_TRANSITIONS = statements.register(
+    "soc.get_transitions",
+    """
+    SELECT id, incident_id, from_state, to_state, triggered_by, occurred_at
+    FROM incident_transitions
+    WHERE incident_id = $1 AND occurred_at >= $2 AND occurred_at < $3
+    ORDER BY occurred_at
+    """,
+)
 
 class SocRepository:
     """
@@ -20,12 +134,8 @@ class SocRepository:
             return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(val)))
 
     def _serialize_row(self, row: Any) -> Dict[str, Any]:
-        """Convert asyncpg Row to dict and stringify UUIDs."""
-        record = dict(row)
-        for key, val in record.items():
-            if isinstance(val, uuid.UUID):
-                record[key] = str(val)
-        return record
+        """Convert asyncpg Row to dict. UUIDs already decode to str (pool codec, see database.py)."""
+        return dict(row)
 
     async def get_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
         pool = await db.get_pool()
@@ -33,64 +143,123 @@ class SocRepository:
         # 1. Transform ID
         db_id = self._generate_uuid_from_string(incident_id)
         
-        row = await pool.fetchrow("SELECT * FROM incidents WHERE id = $1", db_id)
+        row = await statements.fetchrow(pool, GET_INCIDENT, db_id)
         if not row:
             return None
             
         return self._serialize_row(row)
 
-    async def list_incidents(self, limit: int = 50) -> List[Dict[str, Any]]:
+    async def list_incidents(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        state: Optional[str] = None,
+        severity: Optional[str] = None,
+        incident_type: Optional[str] = None,
+    ) -> Page:
+        """Newest first, keyset-paginated on (created_at, id). Items are read-only Records."""
+        limit = clamp_limit(limit)
+        sql, args = keyset_query(
+            "incidents",
+            INCIDENT_LIST_COLUMNS,
+            {"state": state, "severity": severity, "type": incident_type},
+            cursor,
+            limit,
+        )
+        pool = await db.get_read_pool()
+        rows = await pool.fetch(sql, *args)
+        return build_page(rows, limit)
+
+    async def get_open_incidents(self, terminal_states: List[str]) -> List[Any]:
+        """Every incident not in a terminal state, for warming the IncidentReadModel."""
         pool = await db.get_pool()
-        rows = await pool.fetch("SELECT * FROM incidents ORDER BY created_at DESC LIMIT $1", limit)
-        
+        return await statements.fetch(pool, GET_OPEN_INCIDENTS, terminal_states)
+
+    async def get_incident_transitions(
+        self,
+        incident_id: str,
+        since: datetime.datetime,
+        until: Optional[datetime.datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Audit trail within [since, until).
+        Bounded on occurred_at so only the matching monthly partitions are scanned.
+        """
+        pool = await db.get_pool()
+        db_id = self._generate_uuid_from_string(incident_id)
+        until = until or datetime.datetime.now(datetime.timezone.utc)
+        rows = await statements.fetch(pool, GET_TRANSITIONS, db_id, since, until)
         return [self._serialize_row(row) for row in rows]
 
-    async def transition_incident_state_with_audit(
-        self, incident_id: str, old_state: str, new_state: str, triggered_by: str
-    ) -> bool:
+    async def transition_incident_state(
+        self, incident_id: str, to_state: str, allowed_from: List[str], triggered_by: str
+    ) -> Optional[Dict[str, Any]]:
         """
-        Transactional state update + audit log.
-        Atomic Compare-And-Swap (CAS) update for state.
-        Returns True if successful, False if state changed underneath.
+        CAS update + audit insert + new row in one statement (one round trip).
+        The update only applies when the current state is in `allowed_from`
+        and unchanged since the statement's snapshot.
+        Returns None if the incident does not exist, else
+        {"previous_state", "applied", "incident" (new row, None if not applied)}.
         """
         pool = await db.get_pool()
-        
-        # 1. Transform ID
         db_id = self._generate_uuid_from_string(incident_id)
-        
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # 2. Atomic Update (CAS)
-                # This update ensures we only transition if the state is what we expect (Concurrency Control)
-                result = await conn.execute(
-                    """
-                    UPDATE incidents 
-                    SET state = $1 
-                    WHERE id = $2 AND state = $3
-                    """,
-                    new_state, db_id, old_state
-                )
-                
-                # Check for "UPDATE 1" robustly
-                if not result or not result.startswith("UPDATE"):
-                     return False
-                
-                try:
-                    count = int(result.split(" ")[1])
-                except (IndexError, ValueError):
-                    return False
-                    
-                if count != 1:
-                    return False
-                
-                # 3. Insert Audit within the same transaction
-                trans_id = str(uuid.uuid4())
-                await conn.execute(
-                    """
-                    INSERT INTO incident_transitions (id, incident_id, from_state, to_state, triggered_by, occurred_at)
-                    VALUES ($1, $2, $3, $4, $5, NOW())
-                    """,
-                    trans_id, db_id, old_state, new_state, triggered_by
-                )
-                
-                return True
+
+        row = await statements.fetchrow(pool, TRANSITION_INCIDENT, db_id, to_state, allowed_from, triggered_by)
+        if not row:
+            return None
+
+        applied = row["applied"]
+        if applied:
+            db.mark_write()
+        incident = {key: row[key] for key in INCIDENT_LIST_COLUMNS} if applied else None
+        return {"previous_state": row["previous_state"], "applied": applied, "incident": incident}
+
+    async def transition_incidents_state(
+        self, incident_ids: List[str], to_state: str, allowed_from: List[str], triggered_by: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk CAS transition + audit in one statement.
+        Returns {db_id: {"previous_state", "applied", "incident"}} for the incidents
+        found; "incident" is the row as it stands after the statement.
+        """
+        if not incident_ids:
+            return {}
+        pool = await db.get_pool()
+        db_ids = [self._generate_uuid_from_string(i) for i in incident_ids]
+
+        rows = await statements.fetch(pool, TRANSITION_INCIDENTS, db_ids, to_state, allowed_from, triggered_by)
+        return self._transition_results(rows)
+
+    async def transition_incidents_each(
+        self, transitions: List[Tuple[str, str, Optional[str]]], edges: List[Tuple[str, str]], triggered_by: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk CAS transition + audit with a target per incident, in one statement.
+        `transitions` are (incident_id, to_state, expected_state or None) with
+        distinct ids; `edges` are the state machine's (from_state, to_state) pairs.
+        Same result shape as transition_incidents_state.
+        """
+        if not transitions:
+            return {}
+        pool = await db.get_pool()
+        db_ids = [self._generate_uuid_from_string(t[0]) for t in transitions]
+
+        rows = await statements.fetch(
+            pool, TRANSITION_INCIDENTS_EACH,
+            db_ids, [t[1] for t in transitions], [t[2] for t in transitions],
+            [e[0] for e in edges], [e[1] for e in edges], triggered_by,
+        )
+        return self._transition_results(rows)
+
+    @staticmethod
+    def _transition_results(rows: List[Any]) -> Dict[str, Dict[str, Any]]:
+        results = {}
+        for row in rows:
+            results[row["id"]] = {
+                "previous_state": row["previous_state"],
+                "applied": row["applied"],
+                "incident": {key: row[key] for key in INCIDENT_LIST_COLUMNS},
+            }
+        if any(r["applied"] for r in results.values()):
+            db.mark_write()
+        return results
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from src.infrastructure.settings import settings
 
 class IncidentResponse(BaseModel):
     id: str
@@ -26,6 +27,41 @@ class EscalationResponse(BaseModel):
     ticket_id: str
     ticket_status: str
 
+class BulkEscalationRequest(BaseModel):
+    incident_ids: List[str] = Field(..., min_length=1, max_length=settings.BULK_INCIDENTS_MAX)
+    triggered_by: str
+
+class BulkEscalationResult(BaseModel):
+    incident_id: str
+    status: str  # escalated | already_escalated | not_found | invalid_id | invalid_transition | unknown_state
+    ticket_id: Optional[str] = None
+    ticket_status: Optional[str] = None
+    error: Optional[str] = None
+
+class BulkEscalationResponse(BaseModel):
+    escalated: int
+    results: List[BulkEscalationResult]
+
+class BulkTransitionItem(BaseModel):
+    incident_id: str
+    to_state: str
+    expected_state: Optional[str] = None  # Only transition from this state (optimistic check)
+
+class BulkTransitionRequest(BaseModel):
+    transitions: List[BulkTransitionItem] = Field(..., min_length=1, max_length=settings.BULK_INCIDENTS_MAX)
+    triggered_by: str
+
+class BulkTransitionResult(BaseModel):
+    incident_id: str
+    status: str  # success | unchanged | conflict | invalid | not_found | duplicate
+    from_state: Optional[str] = None
+    state: Optional[str] = None
+    error: Optional[str] = None
+
+class BulkTransitionResponse(BaseModel):
+    transitioned: int
+    results: List[BulkTransitionResult]
+
 class EvidenceItem(BaseModel):
     id: str
     type: str
@@ -1,5 +1,7 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.soc.repository import SocRepository
+from src.soc.read_model import IncidentReadModel, TERMINAL_STATES, incident_read_model
+from src.shared.pagination import Page
 from src.shared.event_bus import event_bus
 import uuid
 
@@ -23,14 +25,19 @@ class ConcurrentModificationError(SocServiceError):
     def __init__(self, incident_id: str):
         super().__init__(f"Concurrent modification detected for incident {incident_id}. Please retry.")
 
+class StateConflictError(SocServiceError):
+    def __init__(self, incident_id: str, current_state: str, expected_state: str):
+        super().__init__(f"Incident {incident_id} is in state '{current_state}', expected '{expected_state}'")
+
 class SocService:
     """
     Domain Service for SOC Context.
     Enforces State Machine rules and Business Logic.
     """
     
-    def __init__(self):
+    def __init__(self, read_model: IncidentReadModel = None):
         self.repository = SocRepository()
+        self.read_model = read_model if read_model is not None else incident_read_model
         
         # Defined Strict Transitions
         self.VALID_TRANSITIONS = {
@@ -46,8 +53,24 @@ class SocService:
     async def get_incident(self, incident_id: str) -> Optional[Dict]:
         return await self.repository.get_incident(incident_id)
 
-    async def list_incidents(self) -> List[Dict]:
-        return await self.repository.list_incidents()
+    async def list_incidents(self, limit: int = 50, cursor: Optional[str] = None, **filters) -> Page:
+        return await self.repository.list_incidents(limit=limit, cursor=cursor, **filters)
+
+    async def warm_read_model(self) -> int:
+        return self.read_model.load(await self.repository.get_open_incidents(sorted(TERMINAL_STATES)))
+
+    def _project(self, incident: Optional[Dict]) -> None:
+        # Keep this process's projection current without waiting for its own event
+        if not incident or not incident.get("id"):
+            return
+        if self.read_model.set_state(incident["id"], incident["state"]):
+            return
+        # Not projected yet (e.g. created before warm-up finished): needs the full row
+        if "type" in incident and "severity" in incident:
+            self.read_model.upsert(
+                incident["id"], incident["type"], incident["severity"], incident["state"],
+                incident.get("correlation_id"), incident.get("created_at"), incident.get("closed_at"),
+            )
 
     async def transition_incident(self, incident_id: str, to_state: str, triggered_by: str) -> Dict:
         """
@@ -61,35 +84,36 @@ class SocService:
         if not to_state or to_state not in self.VALID_TRANSITIONS:
             raise UnknownStateError(to_state)
         
-        # 2. Fetch current state
-        incident = await self.repository.get_incident(incident_id)
-        if not incident:
-            raise IncidentNotFoundError(incident_id)
-            
-        current_state = (incident.get("state") or "").strip()
-        
-        # Validate Current State Existence (Robustness)
-        if not current_state or current_state not in self.VALID_TRANSITIONS:
-            raise UnknownStateError(current_state)
-        
-        # Idempotency: if already in target state, success with no side effects
-        if to_state == current_state:
-            return {"status": "success", "new_state": to_state, "idempotent": True}
-        
-        # 3. Validate Transition Logic
-        allowed_next_states = self.VALID_TRANSITIONS.get(current_state, [])
-        if to_state not in allowed_next_states:
-            raise InvalidTransitionError(current_state, to_state, allowed_next_states)
-
-        # 4. Persistence (Transactional Atomic CAS + Audit)
-        success = await self.repository.transition_incident_state_with_audit(
-            incident_id, current_state, to_state, triggered_by
+        # 2. Single round trip: CAS update + audit from any state allowed to reach to_state.
+        # The state machine is then checked against the returned previous state.
+        result = await self.repository.transition_incident_state(
+            incident_id, to_state, self.allowed_from(to_state), triggered_by
         )
-        
-        if not success:
+        if not result:
+            raise IncidentNotFoundError(incident_id)
+
+        current_state = (result.get("previous_state") or "").strip()
+
+        if not result["applied"]:
+            # Validate Current State Existence (Robustness)
+            if not current_state or current_state not in self.VALID_TRANSITIONS:
+                raise UnknownStateError(current_state)
+
+            # Idempotency: if already in target state, success with no side effects
+            if to_state == current_state:
+                return {"status": "success", "new_state": to_state, "previous_state": current_state, "idempotent": True}
+
+            allowed_next_states = self.VALID_TRANSITIONS.get(current_state, [])
+            if to_state not in allowed_next_states:
+                raise InvalidTransitionError(current_state, to_state, allowed_next_states)
+
+            # Allowed, yet the CAS did not apply: the state moved underneath us
             raise ConcurrentModificationError(incident_id)
 
-        # 5. Emit Event
+        incident = result["incident"]
+        self._project(incident)
+
+        # 3. Emit Event
         # Correlation ID robustness
         db_correlation_id = incident.get('correlation_id')
         if isinstance(db_correlation_id, str) and db_correlation_id and db_correlation_id != "None":
@@ -112,4 +136,164 @@ class SocService:
             }
         )
         
-        return {"status": "success", "new_state": to_state}
+        return {"status": "success", "new_state": to_state, "previous_state": current_state, "incident": incident}
+
+    async def transition_incidents(self, incident_ids: List[str], to_state: str, triggered_by: str) -> List[Dict]:
+        """
+        Set-based transition of many incidents (one statement, one event batch).
+        Returns one result per requested id, in order, with status:
+        transitioned | unchanged (already in to_state) | duplicate | not_found | invalid_transition | unknown_state.
+        """
+        to_state = (to_state or "").strip()
+        if not to_state or to_state not in self.VALID_TRANSITIONS:
+            raise UnknownStateError(to_state)
+
+        rows = await self.repository.transition_incidents_state(
+            incident_ids, to_state, self.allowed_from(to_state), triggered_by
+        )
+
+        results, events, seen = [], [], set()
+        for incident_id in incident_ids:
+            db_id = self.repository._generate_uuid_from_string(incident_id)
+            row = rows.get(db_id)
+            result = {"incident_id": incident_id, "status": "not_found", "incident": None, "error": None}
+            results.append(result)
+            if not row:
+                result["error"] = str(IncidentNotFoundError(incident_id))
+                continue
+
+            result["incident"] = row["incident"]
+            current_state = (row["previous_state"] or "").strip()
+            if db_id in seen:
+                result["status"] = "duplicate"  # Same incident repeated in the request
+                continue
+            seen.add(db_id)
+
+            if row["applied"]:
+                result["status"] = "transitioned"
+                self._project(row["incident"])
+                correlation_id = row["incident"].get("correlation_id") or str(uuid.uuid4())
+                events.append({
+                    "event_type": "incident.state_changed",
+                    "source_context": "soc",
+                    "correlation_id": correlation_id,
+                    "entity_refs": {"incidentId": incident_id},
+                    "payload": {
+                        "incident_id": incident_id,
+                        "from_state": current_state,
+                        "to_state": to_state,
+                        "triggered_by": triggered_by
+                    },
+                })
+            elif current_state == to_state:
+                result["status"] = "unchanged"
+            elif current_state not in self.VALID_TRANSITIONS:
+                result["status"] = "unknown_state"
+                result["error"] = str(UnknownStateError(current_state))
+            else:
+                result["status"] = "invalid_transition"
+                result["error"] = str(InvalidTransitionError(
+                    current_state, to_state, self.VALID_TRANSITIONS.get(current_state, [])
+                ))
+
+        await event_bus.publish_batch(events)
+        return results
+
+    async def transition_incidents_bulk(self, transitions: List[Dict], triggered_by: str) -> List[Dict]:
+        """
+        Per-item transitions ({incident_id, to_state, expected_state?}), e.g. closing
+        out a shift. Items are checked against the state machine in memory first;
+        the rest go to one set-based CAS statement (one audit insert) and their
+        events to one batch. Returns one result per item, in order, with status:
+        success | unchanged (already in to_state) | conflict (not in expected_state,
+        or moved concurrently) | invalid | not_found | duplicate.
+        """
+        results, pending, seen = [], [], set()
+        for item in transitions:
+            incident_id = item["incident_id"]
+            to_state = (item.get("to_state") or "").strip()
+            expected_state = (item.get("expected_state") or "").strip() or None
+            result = {
+                "incident_id": incident_id, "status": "invalid",
+                "from_state": None, "state": None, "error": None,
+            }
+            results.append(result)
+
+            db_id = self.repository._generate_uuid_from_string(incident_id)
+            if db_id in seen:
+                result["status"] = "duplicate"  # Same incident repeated in the request
+                continue
+            seen.add(db_id)
+
+            if to_state not in self.VALID_TRANSITIONS:
+                result["error"] = str(UnknownStateError(to_state))
+            elif expected_state is not None and expected_state not in self.VALID_TRANSITIONS:
+                result["error"] = str(UnknownStateError(expected_state))
+            elif (expected_state is not None and expected_state != to_state
+                  and to_state not in self.VALID_TRANSITIONS[expected_state]):
+                result["error"] = str(InvalidTransitionError(
+                    expected_state, to_state, self.VALID_TRANSITIONS[expected_state]
+                ))
+            else:
+                pending.append((result, db_id, to_state, expected_state))
+
+        rows = await self.repository.transition_incidents_each(
+            [(r["incident_id"], to_state, expected_state) for r, _, to_state, expected_state in pending],
+            self.transition_edges(), triggered_by,
+        ) if pending else {}
+
+        events = []
+        for result, db_id, to_state, expected_state in pending:
+            incident_id = result["incident_id"]
+            row = rows.get(db_id)
+            if not row:
+                result["status"] = "not_found"
+                result["error"] = str(IncidentNotFoundError(incident_id))
+                continue
+
+            current_state = (row["previous_state"] or "").strip()
+            result["from_state"] = current_state
+            result["state"] = row["incident"]["state"]
+
+            if row["applied"]:
+                result["status"] = "success"
+                self._project(row["incident"])
+                correlation_id = row["incident"].get("correlation_id") or str(uuid.uuid4())
+                events.append({
+                    "event_type": "incident.state_changed",
+                    "source_context": "soc",
+                    "correlation_id": correlation_id,
+                    "entity_refs": {"incidentId": incident_id},
+                    "payload": {
+                        "incident_id": incident_id,
+                        "from_state": current_state,
+                        "to_state": to_state,
+                        "triggered_by": triggered_by
+                    },
+                })
+            elif current_state == to_state:
+                result["status"] = "unchanged"
+            elif expected_state is not None and current_state != expected_state:
+                result["status"] = "conflict"
+                result["error"] = str(StateConflictError(incident_id, current_state, expected_state))
+            elif current_state not in self.VALID_TRANSITIONS:
+                result["error"] = str(UnknownStateError(current_state))
+            elif to_state not in self.VALID_TRANSITIONS[current_state]:
+                result["error"] = str(InvalidTransitionError(
+                    current_state, to_state, self.VALID_TRANSITIONS[current_state]
+                ))
+            else:
+                # Allowed, yet the CAS did not apply: the state moved underneath us
+                result["status"] = "conflict"
+                result["error"] = str(ConcurrentModificationError(incident_id))
+
+        await event_bus.publish_batch(events)
+        return results
+
+    def transition_edges(self) -> List[Tuple[str, str]]:
+        """Every (from_state, to_state) pair the state machine allows."""
+        return [(state, next_state) for state, next_states in self.VALID_TRANSITIONS.items() for next_state in next_states]
+
+    def allowed_from(self, to_state: str) -> List[str]:
+        """States from which `to_state` is a valid transition."""
+        return [state for state, next_states in self.VALID_TRANSITIONS.items() if to_state in next_states]
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
 from datetime import datetime, timedelta, timezone
 from src.ticketing.service import TicketService
 from src.ticketing.schemas import TicketResponse, TicketCreateRequest
 from src.infrastructure.demo import is_demo_mode
+from src.shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursorError
 import uuid
 
 router = APIRouter(tags=["Ticketing"])
@@ -12,7 +13,14 @@ def get_ticket_service():
     return TicketService()
 
 @router.get("/tickets", response_model=List[TicketResponse])
-async def get_tickets():
+async def get_tickets(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    incident_id: Optional[str] = None,
+    service: TicketService = Depends(get_ticket_service)
+):
     # 1. Demo Mode Gate
     if is_demo_mode():
         now = datetime.now(timezone.utc)
@@ -61,8 +69,23 @@ async def get_tickets():
         ]
         return mock_tickets
 
-    # 2. Real Logic Fallback (No DB logic implemented yet)
-    return []
+    # 2. Real Logic: one keyset page, next cursor in X-Next-Cursor
+    try:
+        page = await service.list_tickets(limit=limit, cursor=cursor, status=status, incident_id=incident_id)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return [
+        TicketResponse(
+            id=row['id'],
+            incident_id=row['incident_id'] or "",
+            status=row['status'],
+            sla_deadline_utc=row['sla_deadline'],
+            created_at_utc=row['created_at']
+        )
+        for row in page.items
+    ]
 
 @router.post("/tickets", response_model=TicketResponse)
 async def create_ticket(
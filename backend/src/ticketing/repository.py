@@ -1,18 +1,63 @@
 from typing import List, Optional, Dict, Any
 from src.infrastructure.database import db
+from src.infrastructure.statements import statements
+from src.shared.pagination import Page, build_page, clamp_limit, keyset_query
 import uuid
 import datetime
 
+GET_TICKET = statements.register("tickets.get_ticket", "SELECT * FROM tickets WHERE id = $1")
+GET_TICKET_BY_INCIDENT = statements.register("tickets.get_by_incident_id", "SELECT * FROM tickets WHERE incident_id = $1")
+
+# Idempotent set-based ticket creation, relying on uq_tickets_incident_id (migration 0005).
+# Rows report whether each ticket was created now or already existed.
+CREATE_TICKETS_FOR_INCIDENTS = statements.register(
+    "tickets.create_for_incidents",
+    """
+    WITH input AS (
+      SELECT id::uuid AS id, incident_id::uuid AS incident_id, status, sla_deadline
+      FROM unnest($1::text[], $2::text[], $3::text[], $4::timestamptz[]) AS t(id, incident_id, status, sla_deadline)
+    ), ins AS (
+      INSERT INTO tickets (id, incident_id, status, sla_deadline, created_at)
+      SELECT id, incident_id, status, sla_deadline, NOW() FROM input
+      ON CONFLICT (incident_id) DO NOTHING
+      RETURNING id, incident_id, status, sla_deadline
+    )
+    SELECT id, incident_id, status, sla_deadline, TRUE AS created FROM ins
+    UNION ALL
+    SELECT t.id, t.incident_id, t.status, t.sla_deadline, FALSE
+    FROM tickets t JOIN input i ON i.incident_id = t.incident_id
+    WHERE NOT EXISTS (SELECT 1 FROM ins WHERE ins.incident_id = t.incident_id)
+    """,
+)
+GET_TICKETS_BY_INCIDENTS = statements.register(
+    "tickets.get_by_incident_ids",
+    "SELECT id, incident_id, status, sla_deadline, FALSE AS created FROM tickets WHERE incident_id = ANY($1::text[]::uuid[])",
+)
+
+TICKET_LIST_COLUMNS = ("id", "incident_id", "status", "sla_deadline", "created_at", "closed_at")
+
 class TicketRepository:
     """
     Persistence Adapter for Ticketing Context.
     Handles SQL for Tickets and Assignments.
     """
 
-    async def get_all_tickets(self) -> List[Dict[str, Any]]:
-        pool = await db.get_pool()
-        rows = await pool.fetch("SELECT * FROM tickets")
-        return [dict(row) for row in rows]
+    async def get_all_tickets(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        incident_id: Optional[str] = None,
+    ) -> Page:
+        """Newest first, keyset-paginated on (created_at, id). Items are read-only Records."""
+        limit = clamp_limit(limit)
+        db_inc_id = self._generate_uuid_from_string(incident_id) if incident_id else None
+        sql, args = keyset_query(
+            "tickets", TICKET_LIST_COLUMNS, {"status": status, "incident_id": db_inc_id}, cursor, limit
+        )
+        pool = await db.get_read_pool()
+        rows = await pool.fetch(sql, *args)
+        return build_page(rows, limit)
 
     def _generate_uuid_from_string(self, val: str) -> str:
         """
@@ -25,17 +70,13 @@ class TicketRepository:
             return str(uuid.uuid5(uuid.NAMESPACE_DNS, str(val)))
             
     def _serialize_row(self, row: Any) -> Dict[str, Any]:
-        """Convert asyncpg Row to dict and stringify UUIDs."""
-        record = dict(row)
-        for key, val in record.items():
-            if isinstance(val, uuid.UUID):
-                record[key] = str(val)
-        return record
+        """Convert asyncpg Row to dict. UUIDs already decode to str (pool codec, see database.py)."""
+        return dict(row)
 
     async def get_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
         pool = await db.get_pool()
         db_id = self._generate_uuid_from_string(ticket_id)
-        row = await pool.fetchrow("SELECT * FROM tickets WHERE id = $1", db_id)
+        row = await statements.fetchrow(pool, GET_TICKET, db_id)
         return self._serialize_row(row) if row else None
 
     async def get_by_incident_id(self, incident_id: str) -> Optional[Dict[str, Any]]:
@@ -44,7 +85,7 @@ class TicketRepository:
         # but Incidents originating from SOC should have valid UUIDs.
         # Defensively mapping it ensures consistency.
         db_inc_id = self._generate_uuid_from_string(incident_id)
-        row = await pool.fetchrow("SELECT * FROM tickets WHERE incident_id = $1", db_inc_id)
+        row = await statements.fetchrow(pool, GET_TICKET_BY_INCIDENT, db_inc_id)
         return self._serialize_row(row) if row else None
 
     async def create_ticket(self, data: Dict[str, Any]) -> str:
@@ -63,8 +104,38 @@ class TicketRepository:
             """,
             db_id, db_inc_id, data['status'], data['sla_deadline'], data.get('created_at', datetime.datetime.now())
         )
+        db.mark_write()
         return db_id
 
+    async def create_tickets_for_incidents(self, tickets: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk idempotent creation: at most one ticket per incident (ON CONFLICT).
+        tickets: [{id, incident_id (DB UUID), status, sla_deadline}].
+        Returns {incident_id: {id, incident_id, status, sla_deadline, created}}.
+        """
+        if not tickets:
+            return {}
+        pool = await db.get_pool()
+        rows = await statements.fetch(
+            pool, CREATE_TICKETS_FOR_INCIDENTS,
+            [t['id'] for t in tickets],
+            [t['incident_id'] for t in tickets],
+            [t['status'] for t in tickets],
+            [t['sla_deadline'] for t in tickets],
+        )
+        results = {row['incident_id']: self._serialize_row(row) for row in rows}
+
+        # A conflicting ticket committed after the statement's snapshot is skipped
+        # by ON CONFLICT but invisible to its SELECT: look those up separately.
+        missing = [t['incident_id'] for t in tickets if t['incident_id'] not in results]
+        if missing:
+            for row in await statements.fetch(pool, GET_TICKETS_BY_INCIDENTS, missing):
+                results[row['incident_id']] = self._serialize_row(row)
+
+        if any(r['created'] for r in results.values()):
+            db.mark_write()
+        return results
+
     async def transition_ticket_state_with_audit(
         self, ticket_id: str, old_state: str, new_state: str, user_id: str
     ) -> bool:
@@ -85,7 +156,8 @@ class TicketRepository:
         result = await pool.execute(
             """
             UPDATE tickets
-            SET status = $1
+            SET status = $1,
+                closed_at = CASE WHEN $1 = 'Closed' THEN NOW() ELSE closed_at END
             WHERE id = $2 AND status = $3
             """,
             new_state, db_id, old_state
@@ -98,7 +170,9 @@ class TicketRepository:
             count = int(result.split(" ")[1])
         except (IndexError, ValueError):
             return False
-            
+
+        if count == 1:
+            db.mark_write()
         return count == 1
 
     async def assign_ticket(self, ticket_id: str, assignee_id: str) -> None:
@@ -118,3 +192,4 @@ class TicketRepository:
             """,
             assignment_id, db_ticket_id, db_assignee_id
         )
+        db.mark_write()
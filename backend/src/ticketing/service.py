@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Any
 from src.ticketing.repository import TicketRepository
+from src.shared.pagination import Page
 from src.shared.event_bus import event_bus
 import uuid
 import datetime
@@ -89,42 +90,32 @@ class TicketService:
             else:
                 correlation_id = str(uuid.uuid4())
 
-        # 3. Idempotency Check (using DB ID)
-        existing_ticket = await self.repository.get_by_incident_id(incident_db_id)
-        if existing_ticket:
-            t_id = str(existing_ticket['id'])
-            return {
-                "status": "exists", 
-                "ticket_id": t_id, 
-                "incident_id": incident_public_id,
-                "incident_db_id": incident_db_id,
-                "idempotent": True
-            }
-        
-        # 4. SLA Calculation (Timezone Aware)
-        # Default severity to 'info' if missing
-        severity = str(incident.get('severity', 'info')).lower()
-        if severity not in self.SLA_POLICY:
-             severity = 'info' 
-             
-        hours = self.SLA_POLICY[severity]
-        now_utc = datetime.datetime.now(datetime.timezone.utc)
-        deadline = now_utc + datetime.timedelta(hours=hours)
+        # 3. SLA Calculation (Timezone Aware)
+        severity, deadline = self._sla_for(incident)
         
-        # 5. Create Ticket
-        ticket_id = str(uuid.uuid4())
+        # 4. Create Ticket, idempotent in one statement (ON CONFLICT on the incident):
+        # a concurrent escalation gets the winner's ticket instead of a unique violation
         ticket_data = {
-            "id": ticket_id,
+            "id": str(uuid.uuid4()),
             "incident_id": incident_db_id, # Store DB UUID
             "status": "Open",
             "sla_deadline": deadline,
-            # 'created_at' omitted to rely on DB default
-            # 'severity_snapshot' omitted as column likely missing in DB schema
         }
+        rows = await self.repository.create_tickets_for_incidents([ticket_data])
+        row = rows.get(incident_db_id)
+        if row is None:
+            raise TicketServiceError(f"Ticket for incident {incident_public_id} was neither created nor found")
+        ticket_id = str(row['id'])
+        if not row['created']:
+            return {
+                "status": "exists", 
+                "ticket_id": ticket_id, 
+                "incident_id": incident_public_id,
+                "incident_db_id": incident_db_id,
+                "idempotent": True
+            }
         
-        await self.repository.create_ticket(ticket_data)
-        
-        # 6. Emit Event
+        # 5. Emit Event
         # entity_refs.incidentId is correct here because we HAVE the public ID.
         await self.bus.publish(
             event_type="ticket.created",
@@ -152,6 +143,91 @@ class TicketService:
             "incident_db_id": incident_db_id
         }
         
+    def _sla_for(self, incident: Dict, now_utc: Optional[datetime.datetime] = None):
+        """(severity, sla_deadline) for an incident. Default severity to 'info' if missing."""
+        severity = str(incident.get('severity', 'info')).lower()
+        if severity not in self.SLA_POLICY:
+             severity = 'info'
+        now_utc = now_utc or datetime.datetime.now(datetime.timezone.utc)
+        return severity, now_utc + datetime.timedelta(hours=self.SLA_POLICY[severity])
+
+    async def create_tickets_from_incidents(self, incidents: List[Dict], correlation_id: Optional[str] = None) -> List[Dict]:
+        """
+        Bulk, idempotent counterpart of create_ticket_from_incident: one set-based
+        insert (ON CONFLICT on incident_id) and one pipelined event batch.
+        Returns one result per incident, in order.
+        """
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
+        pending: Dict[str, Dict] = {}
+        for incident in incidents:
+            incident_public_id = str(incident.get('id', '')).strip()
+            if not incident_public_id:
+                raise TicketServiceError("Incident ID missing")
+            incident_db_id = self._generate_uuid_from_string(incident_public_id)
+            if incident_db_id in pending:
+                continue
+            severity, deadline = self._sla_for(incident, now_utc)
+            pending[incident_db_id] = {
+                "incident": incident,
+                "public_id": incident_public_id,
+                "severity": severity,
+                "ticket": {
+                    "id": str(uuid.uuid4()),
+                    "incident_id": incident_db_id,
+                    "status": "Open",
+                    "sla_deadline": deadline,
+                },
+            }
+
+        rows = await self.repository.create_tickets_for_incidents([p["ticket"] for p in pending.values()])
+
+        events = []
+        for incident_db_id, p in pending.items():
+            row = rows.get(incident_db_id)
+            if not row or not row['created']:
+                continue
+            inc_corr = p["incident"].get('correlation_id')
+            event_correlation_id = (correlation_id or "").strip() or (
+                inc_corr.strip() if isinstance(inc_corr, str) and inc_corr.strip() else str(uuid.uuid4())
+            )
+            ticket_id = str(row['id'])
+            events.append({
+                "event_type": "ticket.created",
+                "source_context": "ticketing",
+                "correlation_id": event_correlation_id,
+                "entity_refs": {
+                    "ticketId": ticket_id,
+                    "incidentId": p["public_id"],
+                    "incidentDbId": incident_db_id
+                },
+                "payload": {
+                    "ticket_id": ticket_id,
+                    "incident_id": p["public_id"],
+                    "incident_db_id": incident_db_id,
+                    "severity_snapshot": p["severity"],
+                    "sla_deadline": p["ticket"]["sla_deadline"].isoformat(),
+                    "status": "Open"
+                },
+            })
+        await self.bus.publish_batch(events)
+
+        results = []
+        for incident in incidents:
+            incident_public_id = str(incident.get('id', '')).strip()
+            incident_db_id = self._generate_uuid_from_string(incident_public_id)
+            row = rows.get(incident_db_id)
+            results.append({
+                "status": "created" if row and row['created'] else "exists",
+                "ticket_id": str(row['id']) if row else None,
+                "ticket_status": row['status'] if row else None,
+                "incident_id": incident_public_id,
+                "incident_db_id": incident_db_id,
+            })
+        return results
+
+    async def list_tickets(self, limit: int = 50, cursor: Optional[str] = None, **filters) -> Page:
+        return await self.repository.get_all_tickets(limit=limit, cursor=cursor, **filters)
+
     async def get_ticket(self, ticket_id: str) -> Dict:
         ticket = await self.repository.get_ticket(ticket_id)
         if not ticket:
@@ -0,0 +1,121 @@
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from src.analytics import rollups
+from src.analytics.rollups import ASSET_STATUS_DAILY_SQL, RollupRefresher, SEED_ASSET_CARRY_SQL, TICKET_SLA_DAILY_SQL
+from src.analytics.repository import AnalyticsRepository, INCIDENT_SERIES, bucket_starts
+from src.infrastructure.migrator import discover_migrations
+
+
+NOW = datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc)
+
+
+class FakeConn:
+    def __init__(self, watermarks=None, locked=False):
+        self.watermarks = dict(watermarks or {})
+        self.locked = locked
+        self.executed = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchval(self, sql, *args):
+        if "pg_try_advisory_xact_lock" in sql:
+            return not self.locked
+        return self.watermarks.get(args[0])
+
+    async def execute(self, sql, *args):
+        self.executed.append((sql, args))
+        if "rollup_watermarks" in sql:
+            self.watermarks[args[0]] = args[1]
+
+
+def _pool_for(conn):
+    pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool.acquire.return_value = acquire
+    return pool
+
+
+def test_bucket_starts_are_utc_aligned_and_dense():
+    starts = bucket_starts(datetime(2026, 10, 19, 13, 45, tzinfo=timezone.utc), NOW, "hour")
+    assert starts == [datetime(2026, 10, 19, h, tzinfo=timezone.utc) for h in (13, 14, 15)]
+    assert bucket_starts(NOW - timedelta(days=2), NOW, "day")[0] == datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+
+def test_daily_rollups_are_rederived_from_hourly_rows():
+    assert "GROUP BY 2\n" in TICKET_SLA_DAILY_SQL
+    assert "GROUP BY 2, 3\n" in ASSET_STATUS_DAILY_SQL
+    assert "seconds = EXCLUDED.seconds" in ASSET_STATUS_DAILY_SQL
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_backfills_and_seeds_asset_carry():
+    conn = FakeConn()
+    advanced = await RollupRefresher(_pool_for(conn), lag_s=30, backfill_days=30).refresh(NOW)
+
+    start = datetime(2026, 9, 19, 15, tzinfo=timezone.utc)
+    assert advanced == {name: start for name in rollups.ROLLUP_SOURCES}
+    assert conn.watermarks == {name: NOW - timedelta(seconds=30) for name in rollups.ROLLUP_SOURCES}
+    assert (SEED_ASSET_CARRY_SQL, (start,)) in conn.executed
+
+
+@pytest.mark.asyncio
+async def test_refresh_resumes_from_watermark():
+    mark = NOW - timedelta(minutes=5)
+    conn = FakeConn({name: mark for name in rollups.ROLLUP_SOURCES})
+
+    advanced = await RollupRefresher(_pool_for(conn), lag_s=0).refresh(NOW)
+
+    assert advanced == {name: mark for name in rollups.ROLLUP_SOURCES}
+    assert all(sql != SEED_ASSET_CARRY_SQL for sql, _ in conn.executed)
+    windows = {args for sql, args in conn.executed if args and "rollup_watermarks" not in sql}
+    assert windows == {(mark, NOW)}
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_source_locked_by_another_instance():
+    conn = FakeConn(locked=True)
+    assert await RollupRefresher(_pool_for(conn), lag_s=0).refresh(NOW) == {}
+    assert conn.executed == []
+
+
+@pytest.mark.asyncio
+async def test_timeseries_fills_missing_buckets_with_zeros():
+    since = datetime(2026, 10, 19, 13, tzinfo=timezone.utc)
+    row = {"bucket_start": since + timedelta(hours=1), "created": 3, "escalated": 1, "resolved": 0, "closed": 0}
+
+    with patch("src.infrastructure.database.db.get_read_pool", AsyncMock(return_value=MagicMock())), \
+         patch("src.analytics.repository.statements.fetch", AsyncMock(return_value=[row])) as fetch, \
+         patch("src.analytics.repository.statements.fetchval", AsyncMock(return_value=NOW)):
+        series = await AnalyticsRepository().get_timeseries("incidents", "hour", since, since + timedelta(hours=3), severity="high")
+
+    assert fetch.await_args.args[1:] == (INCIDENT_SERIES, "hour", since, since + timedelta(hours=3), None, "high")
+    assert [p["created"] for p in series["points"]] == [0, 3, 0]
+    assert series["as_of"] == NOW
+
+
+def test_demo_timeseries_is_synthetic_and_stable():
+    with patch("src.analytics.adapters.api.is_demo_mode", return_value=True), \
+         patch("src.infrastructure.database.db.get_read_pool", side_effect=Exception("DB Access Forbidden in Demo Mode")):
+        from src.main import app
+        client = TestClient(app)
+        first = client.get("/analytics/timeseries", params={"metric": "ticket_sla", "granularity": "hour", "days": 1})
+        second = client.get("/analytics/timeseries", params={"metric": "ticket_sla", "granularity": "hour", "days": 1})
+        too_long = client.get("/analytics/timeseries", params={"granularity": "hour", "days": 90})
+
+    assert first.status_code == 200
+    assert len(first.json()["points"]) == 24
+    assert first.json()["points"] == second.json()["points"]
+    assert too_long.status_code == 400
+
+
+def test_rollup_migration_builds_closed_at_index_concurrently():
+    migration = next(m for m in discover_migrations() if m.name == "analytics_rollups")
+    assert not migration.transactional
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickets_closed_at" in migration.sql
@@ -0,0 +1,164 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.shared.consumers import consumer_manager
+from src.shared.timer_wheel import TimerWheel
+from src.soc.correlation import CorrelationEngine
+
+
+def _engine(**overrides):
+    options = {"window_s": 10.0, "max_window_s": 60.0, "update_interval_s": 2.0, "windows": {}, "tick_s": 0.5, "now": 0.0}
+    options.update(overrides)
+    return CorrelationEngine(**options)
+
+
+def _signal(vehicle="VEH-303", zone="LANDSIDE_ACCESS_ROAD", **extra):
+    return {"vehicleId": vehicle, "zoneId": zone, "location": {"x": 410, "y": 480}, **extra}
+
+
+def test_wheel_fires_on_deadline_tick_only():
+    wheel = TimerWheel(tick_s=1.0, slots=8)
+    wheel.schedule("a", 2.5)
+    wheel.schedule("b", 20.0)  # past one revolution: same bucket as tick 4
+    wheel.schedule("c", 4.0)
+
+    assert wheel.advance(2.0) == []
+    assert wheel.advance(3.0) == ["a"]
+    assert wheel.advance(4.0) == ["c"]
+    assert "b" in wheel and wheel.advance(19.0) == []
+    assert wheel.advance(20.0) == ["b"] and len(wheel) == 0
+
+
+def test_wheel_reschedule_and_cancel_drop_old_entries():
+    wheel = TimerWheel(tick_s=1.0, slots=8)
+    wheel.schedule("a", 2.0)
+    wheel.schedule("a", 5.0)
+    wheel.schedule("b", 3.0)
+    assert wheel.cancel("b") and not wheel.cancel("b")
+
+    assert wheel.advance(4.0) == []
+    assert wheel.deadline("a") == 5.0
+    assert wheel.advance(100.0) == ["a"]
+
+
+def test_burst_becomes_one_incident_with_periodic_updates():
+    engine = _engine()
+    incident_id = engine.observe("s0", "fleet.collision_detected", _signal(), "corr-1", now=0.0)
+    for i in range(1, 10):
+        assert engine.observe(f"s{i}", "fleet.collision_detected", _signal(), now=i * 0.1) == incident_id
+    engine.tick(3.0)
+
+    created, updated = engine.drain()
+    assert created["event_type"] == "incident.created"
+    assert (created["payload"]["id"], created["payload"]["type"], created["payload"]["severity"]) == (
+        incident_id, "FLEET_COLLISION", "critical")
+    assert created["payload"]["signals"] == [{"signalId": "s0", "eventType": "fleet.collision_detected", "timestamp": None}]
+    assert created["correlation_id"] == updated["correlation_id"] == "corr-1"
+    assert updated["event_type"] == "incident.updated"
+    assert updated["payload"]["signalCount"] == 10
+    assert [ref["signalId"] for ref in updated["payload"]["signals"]] == [f"s{i}" for i in range(1, 10)]
+    assert not updated["payload"]["windowClosed"]
+
+
+def test_keys_separate_asset_zone_and_type():
+    engine = _engine()
+    ids = {
+        engine.observe("s1", "fleet.collision_detected", _signal(), now=0.0),
+        engine.observe("s2", "fleet.collision_detected", _signal(vehicle="VEH-101"), now=0.0),
+        engine.observe("s3", "fleet.collision_detected", _signal(zone="APRON_TRANSFER_ZONE"), now=0.0),
+        engine.observe("s4", "fleet.geofence_breached", _signal(), now=0.0),
+    }
+    assert len(ids) == len(engine) == 4
+    assert engine.observe("s5", "fleet.asset_status_changed", _signal(), now=0.0) is None
+
+
+def test_quiet_window_closes_and_next_signal_opens_new_incident():
+    engine = _engine()
+    first = engine.observe("s1", "fleet.overspeed_detected", _signal(), now=0.0)
+    engine.observe("s2", "fleet.overspeed_detected", _signal(), now=8.0)  # extends the window to 18 s
+    engine.tick(9.0)
+    assert len(engine) == 1
+
+    assert engine.tick(18.5) == 1 and len(engine) == 0
+    events = engine.drain()
+    assert [e["event_type"] for e in events] == ["incident.created", "incident.updated"]
+    assert events[-1]["payload"]["windowClosed"]
+
+    second = engine.observe("s3", "fleet.overspeed_detected", _signal(), now=20.0)
+    assert second != first
+
+
+def test_max_window_caps_a_continuous_storm():
+    engine = _engine(max_window_s=30.0)
+    first = engine.observe("s0", "fleet.collision_detected", _signal(), now=0.0)
+    for i in range(1, 31):
+        engine.observe(f"s{i}", "fleet.collision_detected", _signal(), now=float(i))
+        engine.tick(float(i))
+
+    assert engine.get(("VEH-303", "LANDSIDE_ACCESS_ROAD", "FLEET_COLLISION")).incident_id != first
+
+
+def test_per_type_window_and_redelivered_signals():
+    engine = _engine(windows={"fleet.geofence_breached": 2.0})
+    engine.observe("s1", "fleet.geofence_breached", _signal(), now=0.0)
+    assert engine.observe("s1", "fleet.geofence_breached", _signal(), now=0.5) is None
+    assert engine.tick(2.5) == 1
+    assert [e["event_type"] for e in engine.drain()] == ["incident.created"]
+
+
+@pytest.mark.asyncio
+async def test_flush_keeps_outbox_when_publish_fails():
+    engine = _engine()
+    engine.observe("s1", "fleet.collision_detected", _signal(), now=0.0)
+    with patch("src.soc.correlation.event_bus.publish_batch", AsyncMock(side_effect=ConnectionError)):
+        with pytest.raises(ConnectionError):
+            await engine.flush()
+    assert engine.pending == 1
+
+    with patch("src.soc.correlation.event_bus.publish_batch", AsyncMock()) as publish:
+        assert await engine.flush() == 1
+    assert publish.await_args.args[0][0]["event_type"] == "incident.created"
+
+
+@pytest.mark.asyncio
+async def test_stop_lets_an_in_flight_publish_finish_and_cancel_keeps_outbox():
+    engine = _engine(tick_s=0.01)
+    published = []
+    started = asyncio.Event()
+
+    async def slow(events):
+        started.set()
+        await asyncio.sleep(0.05)
+        published.extend(events)
+
+    engine.observe("s1", "fleet.collision_detected", _signal(), now=0.0)
+    with patch("src.soc.correlation.event_bus.publish_batch", slow):
+        await engine.start()
+        await started.wait()
+        await engine.stop()
+    assert [e["event_type"] for e in published] == ["incident.created"] and engine.pending == 0
+
+    engine.observe("s2", "fleet.collision_detected", _signal(vehicle="VEH-101"), now=0.0)
+    started.clear()
+    with patch("src.soc.correlation.event_bus.publish_batch", slow):
+        task = asyncio.create_task(engine.flush())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert engine.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_feeds_signals_to_engine():
+    engine = _engine()
+    with patch("src.infrastructure.database.db.get_pool", AsyncMock()), \
+         patch("src.shared.consumers.correlation_engine", engine):
+        for _ in range(2):  # redelivery
+            await consumer_manager.process_event({
+                "event_id": "evt-1", "event_type": "fleet.collision_detected",
+                "correlation_id": "corr-1", "payload": '{"vehicleId": "VEH-303", "zoneId": "LANDSIDE_ACCESS_ROAD"}',
+            })
+
+    [created] = engine.drain()
+    assert (created["payload"]["vehicleId"], created["correlation_id"]) == ("VEH-303", "corr-1")
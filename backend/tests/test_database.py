@@ -0,0 +1,122 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.infrastructure.database import Database, init_connection
+
+
+def _stub_pool(closed=False):
+    pool = MagicMock()
+    pool.is_closed.return_value = closed
+    pool.close = AsyncMock()
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def reset_binding():
+    Database.reset()
+    yield
+    Database.reset()
+
+
+@pytest.mark.asyncio
+async def test_get_pool_fast_path_skips_probes():
+    pool = _stub_pool()
+    Database.bind_pool(pool)
+
+    with patch.object(Database, "_create_pool", AsyncMock()) as create:
+        for _ in range(3):
+            assert await Database.get_pool() is pool
+
+    create.assert_not_called()
+    pool.is_closed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_pool_lazily_creates_and_binds():
+    pool = _stub_pool()
+    with patch.object(Database, "_create_pool", AsyncMock(return_value=pool)) as create:
+        assert await Database.get_pool() is pool
+        assert await Database.get_pool() is pool
+
+    create.assert_called_once()
+    assert Database._loop is asyncio.get_running_loop()
+
+
+@pytest.mark.asyncio
+async def test_get_pool_rebinds_when_owned_by_other_loop():
+    stale = _stub_pool()
+    old_loop = asyncio.new_event_loop()
+    old_loop.close()
+    Database.bind_pool(stale, loop=old_loop)
+    fresh = _stub_pool()
+
+    with patch.object(Database, "_create_pool", AsyncMock(return_value=fresh)):
+        assert await Database.get_pool() is fresh
+
+    stale.terminate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_close_resets_binding():
+    pool = _stub_pool()
+    Database.bind_pool(pool)
+
+    await Database.close()
+
+    pool.close.assert_awaited_once()
+    assert Database._pool is None and Database._loop is None
+
+
+@pytest.mark.asyncio
+async def test_read_pool_without_replica_uses_primary():
+    primary = _stub_pool()
+    Database.bind_pool(primary)
+
+    with patch("src.infrastructure.database.settings.DATABASE_REPLICA_URL", None):
+        assert await Database.get_read_pool() is primary
+
+
+@pytest.mark.asyncio
+async def test_read_pool_routes_to_replica_until_a_write():
+    primary, replica = _stub_pool(), _stub_pool()
+    Database.bind_pool(primary)
+    Database.bind_replica_pool(replica)
+
+    async def reads():
+        before = await Database.get_read_pool()
+        Database.mark_write()
+        return before, await Database.get_read_pool()
+
+    with patch("src.infrastructure.database.settings.DATABASE_REPLICA_URL", "postgresql://replica"):
+        # Run in its own task so the write mark stays scoped to that context
+        before, after = await asyncio.create_task(reads())
+        assert (before, after) == (replica, primary)
+        assert await Database.get_read_pool() is replica
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_falls_back_to_primary():
+    primary = _stub_pool()
+    Database.bind_pool(primary)
+
+    failing = AsyncMock(side_effect=OSError("connection refused"))
+    with patch("src.infrastructure.database.settings.DATABASE_REPLICA_URL", "postgresql://replica"), \
+         patch.object(Database, "_create_pool", failing):
+        assert await Database.get_read_pool() is primary
+        assert await Database.get_read_pool() is primary
+
+    # Retry is deferred, not attempted on every read
+    failing.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_init_connection_registers_uuid_codec_before_preparing():
+    calls = []
+    conn = MagicMock()
+    conn.set_type_codec = AsyncMock(side_effect=lambda *a, **kw: calls.append(("codec", a[0], kw["format"])))
+
+    with patch("src.infrastructure.database.statements.prepare_all",
+               AsyncMock(side_effect=lambda c: calls.append(("prepare",)))):
+        await init_connection(conn)
+
+    assert calls == [("codec", "uuid", "text"), ("prepare",)]
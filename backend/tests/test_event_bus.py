@@ -0,0 +1,57 @@
+import pytest
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.shared.event_bus import EventBus
+
+
+@pytest.fixture
+def demo_bus():
+    with patch("src.shared.event_bus.settings.DEMO_NO_REDIS", True):
+        yield EventBus
+    EventBus._demo_events = []
+    EventBus._demo_cond = None
+    EventBus._is_demo_mode = False
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_demo_appends_in_order(demo_bus):
+    await demo_bus.init_streams()
+
+    ids = await demo_bus.publish_batch([
+        {"event_type": "ticket.created", "source_context": "ticketing", "payload": {"n": 1}},
+        {"event_type": "ticket.created", "source_context": "ticketing", "payload": {"n": 2}, "correlation_id": "corr"},
+    ])
+
+    assert len(ids) == len(set(ids)) == 2
+    envelopes = [env for _, env in demo_bus._demo_events]
+    assert [json.loads(env["payload"])["n"] for env in envelopes] == [1, 2]
+    assert envelopes[1]["correlation_id"] == "corr"
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_redis_uses_one_pipeline():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=["1-0", "1-1"])
+    pipeline_cm = MagicMock()
+    pipeline_cm.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline_cm.__aexit__ = AsyncMock(return_value=False)
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipeline_cm
+
+    with patch.object(EventBus, "get_redis", AsyncMock(return_value=redis_client)):
+        ids = await EventBus.publish_batch([
+            {"event_type": "a", "source_context": "soc", "payload": {}},
+            {"event_type": "b", "source_context": "soc", "payload": {}},
+        ])
+
+    assert ids == ["1-0", "1-1"]
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.xadd.call_count == 2
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_empty_is_a_no_op():
+    with patch.object(EventBus, "get_redis", AsyncMock()) as get_redis:
+        assert await EventBus.publish_batch([]) == []
+    get_redis.assert_not_called()
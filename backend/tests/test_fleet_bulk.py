@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from src.fleet.live_state import LiveFleetState
+from src.fleet.repository import AssetRepository, SET_STATUSES_BULK, UPSERT_ASSETS_BULK
+from src.fleet.service import FleetService
+from src.fleet.adapters.api import get_fleet_service
+from src.infrastructure.settings import settings
+from src.infrastructure.statements import statements
+
+uid = AssetRepository()._generate_uuid_from_string
+
+
+@pytest.fixture
+def pool():
+    pool = MagicMock()
+    with patch("src.infrastructure.database.db.get_pool", AsyncMock(return_value=pool)):
+        yield pool
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_is_one_statement(pool):
+    rows = [{"id": uid("GSE-1"), "old_status": None}, {"id": uid("GSE-2"), "old_status": "idle"}]
+    with patch("src.fleet.repository.statements.fetch", AsyncMock(return_value=rows)) as fetch:
+        inserted = await AssetRepository().upsert_assets_bulk([
+            {"id": "GSE-1", "type": "tug", "name": "Tug 1", "status": "idle"},
+            {"id": "GSE-2", "type": "tug", "name": "Tug 2", "status": "active"},
+        ])
+
+    assert inserted == {uid("GSE-1"): None, uid("GSE-2"): "idle"}
+    _, name, ids, types, names, statuses = fetch.await_args.args
+    assert name == UPSERT_ASSETS_BULK
+    assert (ids, types, names, statuses) == ([uid("GSE-1"), uid("GSE-2")], ["tug", "tug"], ["Tug 1", "Tug 2"], ["idle", "active"])
+    assert "IS DISTINCT FROM" in statements.sql(UPSERT_ASSETS_BULK)
+    assert "IS DISTINCT FROM" in statements.sql(SET_STATUSES_BULK)
+    assert "asset_type = EXCLUDED.asset_type" in statements.sql(UPSERT_ASSETS_BULK)
+
+
+def _service(repository):
+    return FleetService(repository=repository, live_state=LiveFleetState())
+
+
+@pytest.mark.asyncio
+async def test_register_bulk_reports_per_asset_and_publishes_once():
+    repository = AssetRepository()
+    repository.upsert_assets_bulk = AsyncMock(return_value={uid("GSE-1"): None, uid("GSE-2"): "active"})
+    service = _service(repository)
+
+    with patch("src.fleet.service.event_bus.publish_batch", AsyncMock()) as publish_batch, \
+         patch("src.fleet.service.event_bus.publish", AsyncMock()) as publish:
+        result = await service.register_assets_bulk([
+            {"id": "GSE-1", "asset_type": "tug", "name": "Tug 1"},
+            {"id": "GSE-2", "asset_type": "tug", "name": "Tug 2", "status": "active"},
+            {"id": "GSE-1", "asset_type": "tug", "name": "Tug 1 again"},
+        ])
+
+    assert [r["result"] for r in result["results"]] == ["created", "updated", "duplicate"]
+    assert result["created"] == 1
+    assert len(repository.upsert_assets_bulk.await_args.args[0]) == 2
+    publish.assert_not_called()
+    (events,), _ = publish_batch.await_args
+    assert [e["entity_refs"]["assetId"] for e in events] == ["GSE-1"]
+    assert service.live_state.get(uid("GSE-2")).status == "active"
+
+
+@pytest.mark.asyncio
+async def test_re_register_with_new_status_publishes_status_change():
+    repository = AssetRepository()
+    repository.upsert_assets_bulk = AsyncMock(return_value={uid("GSE-1"): "idle"})
+    service = _service(repository)
+
+    with patch("src.fleet.service.event_bus.publish_batch", AsyncMock()) as publish_batch:
+        result = await service.register_assets_bulk([{"id": "GSE-1", "asset_type": "loader", "name": "Tug 1", "status": "maintenance"}])
+
+    assert result["created"] == 0 and result["results"][0]["result"] == "updated"
+    (events,), _ = publish_batch.await_args
+    assert [(e["event_type"], e["payload"]["status"]) for e in events] == [("fleet.asset.status_changed", "maintenance")]
+    assert service.live_state.get(uid("GSE-1")).asset_type == "loader"
+
+
+@pytest.mark.asyncio
+async def test_status_bulk_classifies_changes():
+    repository = AssetRepository()
+    repository.set_statuses_bulk = AsyncMock(return_value={uid("a"): "idle", uid("b"): "active"})
+    service = _service(repository)
+
+    with patch("src.fleet.service.event_bus.publish_batch", AsyncMock()) as publish_batch:
+        result = await service.update_statuses_bulk([
+            {"asset_id": "a", "status": "active"},
+            {"asset_id": "b", "status": "active"},
+            {"asset_id": "ghost", "status": "active"},
+            {"asset_id": "a", "status": "offline"},
+        ])
+
+    assert [r["result"] for r in result["results"]] == ["changed", "unchanged", "not_found", "duplicate"]
+    assert repository.set_statuses_bulk.await_args.args[0] == {"a": "active", "b": "active", "ghost": "active"}
+    (events,), _ = publish_batch.await_args
+    assert [e["payload"] for e in events] == [{"asset_id": "a", "status": "active"}]
+    assert service.live_state.get(uid("a")).status == "active"
+
+
+def test_bulk_routes_are_not_captured_by_asset_id_routes():
+    service = MagicMock()
+    service.update_statuses_bulk = AsyncMock(return_value={"changed": 0, "updated_at_utc": "2026-10-19T08:00:00Z", "results": []})
+    service.update_asset_status = AsyncMock()
+
+    with patch("src.fleet.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_fleet_service] = lambda: service
+        try:
+            client = TestClient(app)
+            ok = client.patch("/fleet/assets/bulk/status", json={"updates": [{"asset_id": "a", "status": "idle"}]})
+            too_many = client.post("/fleet/assets/bulk", json={
+                "assets": [{"asset_type": "tug", "name": f"t{i}"} for i in range(settings.BULK_ASSETS_MAX + 1)]
+            })
+        finally:
+            app.dependency_overrides.pop(get_fleet_service, None)
+
+    assert ok.status_code == 200
+    service.update_asset_status.assert_not_called()
+    assert too_many.status_code == 422
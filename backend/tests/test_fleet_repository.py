@@ -0,0 +1,55 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.fleet.repository import AssetRepository, APPLY_STATUS_CHANGES, SET_STATUS_WITH_HISTORY
+from src.infrastructure.statements import statements
+
+
+@pytest.fixture
+def pool():
+    pool = MagicMock()
+    with patch("src.infrastructure.database.db.get_pool", AsyncMock(return_value=pool)):
+        yield pool
+
+
+@pytest.mark.asyncio
+async def test_status_update_is_one_statement(pool):
+    repo = AssetRepository()
+    with patch("src.fleet.repository.statements.execute", AsyncMock(return_value="INSERT 0 1")) as execute:
+        await repo.update_status_with_history("vh-001", "active")
+
+    execute.assert_awaited_once_with(pool, SET_STATUS_WITH_HISTORY, repo._generate_uuid_from_string("vh-001"), "active")
+    pool.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_with_status_records_history_in_same_statement(pool):
+    repo = AssetRepository()
+    with patch("src.fleet.repository.statements.execute", AsyncMock()) as execute:
+        await repo.update_heartbeat("vh-001", status="idle")
+
+    assert execute.await_args.args[1] == SET_STATUS_WITH_HISTORY
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_changes_dedupe_and_count(pool):
+    repo = AssetRepository()
+    with patch("src.fleet.repository.statements.execute", AsyncMock(return_value="INSERT 0 2")) as execute:
+        changed = await repo.apply_status_changes({"vh-001": "active", "vh-002": "idle"})
+
+    assert changed == 2
+    _, name, ids, statuses = execute.await_args.args
+    assert name == APPLY_STATUS_CHANGES
+    assert ids == [repo._generate_uuid_from_string("vh-001"), repo._generate_uuid_from_string("vh-002")]
+    assert statuses == ["active", "idle"]
+
+
+@pytest.mark.asyncio
+async def test_empty_bulk_is_a_no_op(pool):
+    with patch("src.fleet.repository.statements.execute", AsyncMock()) as execute:
+        assert await AssetRepository().apply_status_changes({}) == 0
+    execute.assert_not_called()
+
+
+def test_history_only_written_on_real_change():
+    for name in (SET_STATUS_WITH_HISTORY, APPLY_STATUS_CHANGES):
+        assert "IS DISTINCT FROM" in statements.sql(name)
@@ -0,0 +1,63 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.fleet.geofence import GeofenceEngine, GeofenceIndex, Zone, load_zones
+from src.fleet.live_state import LiveFleetState
+from src.fleet.repository import AssetRepository
+from src.fleet.service import FleetService
+
+
+TRIANGLE = Zone("TRI", [(0, 0), (100, 0), (0, 100)], restricted=True)
+SQUARE = Zone("SQ", [(50, 50), (150, 50), (150, 150), (50, 150)])
+
+
+def test_point_in_polygon():
+    assert TRIANGLE.contains(10, 10)
+    assert not TRIANGLE.contains(60, 60)  # inside the bounding box, outside the triangle
+    assert SQUARE.contains(100, 100)
+    assert not SQUARE.contains(200, 100)
+
+
+def test_grid_lookup_matches_brute_force():
+    index = GeofenceIndex([TRIANGLE, SQUARE], cell_size=20)
+    for x in range(-10, 170, 7):
+        for y in range(-10, 170, 7):
+            expected = {z.zone_id for z in (TRIANGLE, SQUARE) if z.contains(x, y)}
+            assert index.zones_at(x, y) == expected
+
+
+def test_transitions_only_on_enter_and_exit():
+    engine = GeofenceEngine([TRIANGLE, SQUARE])
+
+    assert [(z.zone_id, c) for z, c in engine.evaluate("a", 10, 10)] == [("TRI", "entered")]
+    assert engine.evaluate("a", 12, 11) == []
+    moved = sorted((z.zone_id, c) for z, c in engine.evaluate("a", 120, 120))
+    assert moved == [("SQ", "entered"), ("TRI", "exited")]
+    assert engine.evaluate("a", 500, 500)[0][1] == "exited"
+    assert engine.zones_of("a") == frozenset()
+
+
+def test_zones_load_from_file(tmp_path):
+    path = tmp_path / "zones.json"
+    path.write_text(json.dumps([{"zone_id": "GATE", "polygon": [[0, 0], [10, 0], [10, 10]], "restricted": True}]))
+    zones = load_zones(str(path))
+    assert [(z.zone_id, z.restricted) for z in zones] == [("GATE", True)]
+    assert [z.zone_id for z in load_zones()][:2] == ["AIRSIDE_PERIMETER", "APRON_TRANSFER_ZONE"]
+
+
+@pytest.mark.asyncio
+async def test_telemetry_publishes_breach_once_per_entry():
+    live = LiveFleetState()
+    live.apply(AssetRepository()._generate_uuid_from_string("VEH-101"), asset_type="tug", name="Tug 101")
+    service = FleetService(telemetry=MagicMock(), live_state=live, geofences=GeofenceEngine(load_zones()))
+
+    with patch("src.fleet.service.event_bus.publish_batch", AsyncMock()) as publish:
+        for x, y in ((400, 480), (220, 210), (230, 215), (400, 480)):
+            await service.process_telemetry("fleet.asset_status_changed", {
+                "assetId": "VEH-101", "driverName": "Ahmed", "location": {"x": x, "y": y},
+            })
+
+    events = [call.args[0][0] for call in publish.await_args_list]
+    assert [e["event_type"] for e in events] == ["fleet.geofence_breached", "fleet.geofence_exited"]
+    assert events[0]["payload"]["zoneId"] == "AIRSIDE_PERIMETER"
+    assert events[0]["payload"]["location"] == {"x": 220.0, "y": 210.0}
@@ -79,3 +79,64 @@ class TestIdentityAPI:
                                json={"username": "newuser", "password": "pw", "roles": ["operator"]})
             
             assert resp.status_code == 403
+
+    def test_admin_bulk_create_users(self):
+        with patch("src.identity.adapters.api.service") as mock_service:
+            mock_service.validate_token.return_value = {
+                "user_id": "u-1",
+                "username": "admin",
+                "roles": ["admin"]
+            }
+            mock_service.create_users_bulk = AsyncMock(return_value={
+                "created": 1,
+                "results": [
+                    {"username": "crew-1", "status": "created", "user_id": "id-1", "roles": ["operator"]},
+                    {"username": "admin", "status": "exists", "user_id": None, "roles": ["operator"]},
+                ]
+            })
+
+            resp = client.post("/admin/users/bulk",
+                               headers={"Authorization": "Bearer admin-token"},
+                               json={"users": [
+                                   {"username": "crew-1", "password": "pw", "roles": ["operator"]},
+                                   {"username": "admin", "password": "pw", "roles": ["operator"]},
+                               ]})
+
+            assert resp.status_code == 200
+            assert [r["status"] for r in resp.json()["results"]] == ["created", "exists"]
+
+    def test_admin_bulk_create_users_rejects_empty_batch(self):
+        with patch("src.identity.adapters.api.service") as mock_service:
+            mock_service.validate_token.return_value = {"user_id": "u-1", "username": "admin", "roles": ["admin"]}
+
+            resp = client.post("/admin/users/bulk", headers={"Authorization": "Bearer admin-token"}, json={"users": []})
+            assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_provisioning_reports_per_user_results():
+    from src.identity.service import AuthService
+
+    repo = AsyncMock()
+    repo.create_users_bulk = AsyncMock(return_value={"crew-1": "id-1"})
+    service = AuthService(repository=repo)
+
+    with patch("src.identity.service.event_bus") as mock_bus:
+        mock_bus.publish = AsyncMock()
+        result = await service.create_users_bulk([
+            {"username": "crew-1", "password": "pw1", "roles": ["operator", "operator"]},
+            {"username": "crew-1", "password": "pw2", "roles": []},
+            {"username": "admin", "password": "pw3", "roles": ["operator"]},
+            {"username": " ", "password": "pw4", "roles": []},
+        ])
+
+    assert result["created"] == 1
+    assert [r["status"] for r in result["results"]] == ["created", "duplicate", "exists", "invalid"]
+    assert result["results"][0]["user_id"] == "id-1"
+
+    # One repository call; passwords hashed, never passed through in clear
+    (sent,), _ = repo.create_users_bulk.call_args
+    assert [u["username"] for u in sent] == ["crew-1", "admin"]
+    assert sent[0]["roles"] == ["operator"]
+    assert "password" not in sent[0] and service._verify_password("pw1", sent[0]["password_hash"])
+    mock_bus.publish.assert_awaited_once()
@@ -0,0 +1,130 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from src.shared.consumers import consumer_manager
+from src.shared.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from src.soc.read_model import IncidentReadModel, IncidentView
+from src.soc.service import SocService
+from src.soc.adapters.api import get_soc_service
+
+
+BASE = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+
+
+def _row(n, state="New", severity="high", type="FIRE", created_at=None):
+    return {
+        "id": f"00000000-0000-0000-0000-{n:012d}", "type": type, "severity": severity, "state": state,
+        "correlation_id": f"corr-{n}", "created_at": created_at or BASE + timedelta(seconds=n), "closed_at": None,
+    }
+
+
+def _walk(model, **filters):
+    ids, cursor = [], None
+    while True:
+        page = model.page(limit=2, cursor=cursor, **filters)
+        ids.extend(item["id"] for item in page.items)
+        if not page.next_cursor:
+            return ids
+        cursor = page.next_cursor
+
+
+def test_incident_view_is_slotted():
+    assert not hasattr(IncidentView("a", "FIRE", "high", "New", None, BASE), "__dict__")
+
+
+def test_pages_are_newest_first_with_stable_ties():
+    model = IncidentReadModel()
+    rows = [_row(n) for n in range(5)] + [_row(9, created_at=BASE + timedelta(seconds=4))]
+    assert model.load(rows) == 6
+
+    # Same ordering as ORDER BY created_at DESC, id DESC
+    assert _walk(model) == [r["id"] for r in sorted(rows, key=lambda r: (r["created_at"], r["id"]), reverse=True)]
+
+
+def test_filters_intersect_indexes():
+    model = IncidentReadModel()
+    model.load([
+        _row(1, severity="high"), _row(2, severity="low"),
+        _row(3, severity="high", type="MEDICAL"), _row(4, severity="high", state="Triage"),
+    ])
+
+    assert _walk(model, severity="high", incident_type="FIRE") == [_row(4)["id"], _row(1)["id"]]
+    assert _walk(model, state="Triage") == [_row(4)["id"]]
+    assert _walk(model, severity="critical") == []
+
+
+def test_state_changes_reindex_and_closed_leaves_projection():
+    model = IncidentReadModel()
+    model.load([_row(1), _row(2)])
+    version = model.version
+
+    assert model.set_state(_row(1)["id"], "Triage")
+    assert _walk(model, state="New") == [_row(2)["id"]]
+    assert model.set_state(_row(2)["id"], "Closed")
+    assert len(model) == 1 and _walk(model, state="New") == []
+    assert not model.set_state("unknown", "Triage")
+    assert model.version == version + 2
+
+
+def test_etag_changes_only_with_the_projection():
+    model = IncidentReadModel()
+    model.load([_row(1)])
+    etag = model.etag()
+
+    model.set_state(_row(1)["id"], "New")
+    assert model.etag() == etag
+    model.upsert(**_row(2))
+    assert model.etag() != etag
+    assert not model.serves("Closed") and model.serves(None)
+
+
+def test_garbage_cursor_is_rejected():
+    model = IncidentReadModel()
+    model.load([_row(1)])
+    with pytest.raises(InvalidCursorError):
+        model.page(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_created_event_projects_new_incident_only():
+    model = IncidentReadModel()
+    pool = AsyncMock()
+    pool.fetchval.side_effect = [BASE, None]
+    event = {
+        "event_type": "incident.created",
+        "payload": {"id": "INC-1", "type": "FIRE", "severity": "high", "location": {"x": 1.0, "y": 2.0}},
+    }
+    with patch("src.infrastructure.database.db.get_pool", return_value=pool), \
+         patch("src.shared.consumers.incident_read_model", model):
+        await consumer_manager.process_event(event)
+        model.set_state(next(iter(model._by_id)), "Triage")
+        await consumer_manager.process_event(event)  # redelivery
+
+    [item] = model.page().items
+    assert (item["state"], item["created_at"], item["location"]) == ("Triage", BASE, {"x": 1.0, "y": 2.0})
+
+
+def test_list_incidents_serves_projection_with_etag():
+    model = IncidentReadModel()
+    model.load([_row(1), _row(2), _row(3)])
+    service = SocService(read_model=model)
+    service.repository.list_incidents = AsyncMock()
+
+    with patch("src.soc.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_soc_service] = lambda: service
+        try:
+            client = TestClient(app)
+            first = client.get("/incidents", params={"limit": 2})
+            unchanged = client.get("/incidents", params={"limit": 2}, headers={"If-None-Match": first.headers["ETag"]})
+            model.set_state(_row(3)["id"], "Triage")
+            changed = client.get("/incidents", params={"limit": 2}, headers={"If-None-Match": first.headers["ETag"]})
+        finally:
+            app.dependency_overrides.pop(get_soc_service, None)
+
+    assert [i["id"] for i in first.json()] == [_row(3)["id"], _row(2)["id"]]
+    assert first.headers[NEXT_CURSOR_HEADER]
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200 and changed.json()[0]["state"] == "Triage"
+    service.repository.list_incidents.assert_not_called()
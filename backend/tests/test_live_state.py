@@ -0,0 +1,77 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from src.fleet.live_state import FLEET_VERSION_HEADER, AssetState, LiveFleetState
+from src.fleet.service import FleetService
+from src.fleet.adapters.api import get_fleet_service
+
+
+HEARTBEAT = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+
+
+def _row(asset_id, status="idle"):
+    return {
+        "id": asset_id, "asset_type": "bus", "name": asset_id.upper(), "status": status,
+        "zone_id": None, "location_x": 10.0, "location_y": 20.0, "driver_name": None,
+        "last_heartbeat": HEARTBEAT,
+    }
+
+
+def test_asset_state_is_slotted():
+    assert not hasattr(AssetState("a"), "__dict__")
+
+
+def test_deltas_contain_only_assets_changed_since_version():
+    state = LiveFleetState()
+    state.load([_row("a"), _row("b"), _row("c")])
+    version, _ = state.snapshot()
+
+    state.apply("b", x=11.0)
+    state.apply("a", status="active")
+    state.apply("b", y=21.0)
+
+    new_version, changed = state.changes_since(version)
+    assert [s.asset_id for s in changed] == ["a", "b"]
+    assert new_version == version + 3
+    assert (changed[1].x, changed[1].y, changed[1].status) == (11.0, 21.0, "idle")
+    assert state.changes_since(new_version) == (new_version, [])
+
+
+def test_unknown_version_gets_full_snapshot():
+    state = LiveFleetState()
+    state.load([_row("a"), _row("b")])
+
+    for stale in (0, state.base_version - 1, state.version + 1):
+        assert len(state.changes_since(stale)[1]) == 2
+
+
+def test_load_keeps_stored_heartbeat_and_marks_ready():
+    state = LiveFleetState()
+    assert not state.ready
+    assert state.load([_row("a")]) == 1
+    assert state.ready
+    assert state.get("a").to_dict()["last_heartbeat_utc"] == HEARTBEAT
+    assert state.get("a").to_dict()["location"] == {"x": 10.0, "y": 20.0}
+
+
+def test_fleet_assets_serves_live_snapshot_and_deltas():
+    live = LiveFleetState()
+    live.load([_row("a"), _row("b")])
+    service = FleetService(live_state=live)
+
+    with patch("src.fleet.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_fleet_service] = lambda: service
+        try:
+            client = TestClient(app)
+            snapshot = client.get("/fleet/assets")
+            version = int(snapshot.headers[FLEET_VERSION_HEADER])
+            live.apply("b", status="active")
+            delta = client.get("/fleet/assets", params={"since_version": version})
+        finally:
+            app.dependency_overrides.pop(get_fleet_service, None)
+
+    assert [a["id"] for a in snapshot.json()] == ["a", "b"]
+    assert [(a["id"], a["status"]) for a in delta.json()] == [("b", "active")]
+    assert int(delta.headers[FLEET_VERSION_HEADER]) == version + 1
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.migrator import MigrationRunner, Migration, discover_migrations, MigrationError
+
+
+class FakeConn:
+    def __init__(self, applied=None, legacy_schema=False, fail_on=None):
+        self.applied = dict(applied or {})
+        self.legacy_schema = legacy_schema
+        self.fail_on = fail_on
+        self.executed = []
+        self.in_transaction = []
+
+    async def execute(self, sql, *args):
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("boom")
+        if sql.startswith("INSERT INTO schema_migrations"):
+            self.applied[args[0]] = args[2]
+        self.executed.append(sql)
+
+    async def fetch(self, sql, *args):
+        return [{"version": v, "checksum": c} for v, c in self.applied.items()]
+
+    async def fetchval(self, sql, *args):
+        if "information_schema.tables" in sql:
+            return self.legacy_schema
+        return False  # No invalid index
+
+    def transaction(self):
+        tx = MagicMock()
+        tx.__aenter__ = AsyncMock(side_effect=lambda: self.in_transaction.append(True))
+        tx.__aexit__ = AsyncMock(return_value=False)
+        return tx
+
+
+def _pool_for(conn):
+    pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool.acquire.return_value = acquire
+    return pool
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    (tmp_path / "0001_baseline.sql").write_text("CREATE TABLE IF NOT EXISTS users (id UUID);")
+    (tmp_path / "0002_indexes.sql").write_text(
+        "-- migrate:no-transaction\n"
+        "-- comment; with semicolon\n"
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON users (id);\n"
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_b ON users (id);\n"
+    )
+    (tmp_path / "README.md").write_text("ignored")
+    return str(tmp_path)
+
+
+def test_discover_orders_and_parses_directive(migrations_dir):
+    migrations = discover_migrations(migrations_dir)
+    assert [m.version for m in migrations] == [1, 2]
+    assert migrations[0].transactional
+    assert not migrations[1].transactional
+    assert len(migrations[1].statements()) == 2
+
+
+def test_shipped_migrations_are_well_formed():
+    migrations = discover_migrations()
+    assert migrations[0].version == MigrationRunner.BASELINE_VERSION
+    indexes = next(m for m in migrations if m.name == "performance_indexes")
+    assert not indexes.transactional
+    assert any("WHERE status <> 'Closed'" in s for s in indexes.statements())
+
+
+@pytest.mark.asyncio
+async def test_run_applies_pending_incrementally(migrations_dir):
+    conn = FakeConn()
+    runner = MigrationRunner(_pool_for(conn), directory=migrations_dir)
+
+    assert await runner.run() == [1, 2]
+    # Baseline in a transaction, concurrent indexes statement by statement
+    assert len(conn.in_transaction) == 1
+    assert sum("CONCURRENTLY" in sql for sql in conn.executed) == 2
+
+    assert await runner.run() == []
+
+
+@pytest.mark.asyncio
+async def test_legacy_schema_is_adopted_as_baseline(migrations_dir):
+    conn = FakeConn(legacy_schema=True)
+    runner = MigrationRunner(_pool_for(conn), directory=migrations_dir)
+
+    assert await runner.run() == [2]
+    assert not any("CREATE TABLE IF NOT EXISTS users" in sql for sql in conn.executed)
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_is_not_recorded(migrations_dir):
+    conn = FakeConn(fail_on="idx_b")
+    runner = MigrationRunner(_pool_for(conn), directory=migrations_dir)
+
+    with pytest.raises(MigrationError):
+        await runner.run()
+
+    assert set(conn.applied) == {1}
+    assert "pg_advisory_unlock" in conn.executed[-1]
@@ -29,12 +29,17 @@ async def test_escalation_lifecycle():
             "severity": "critical",
             "correlation_id": correlation_id
         })
-        soc_repo.transition_incident_state_with_audit = AsyncMock(return_value=True)
+        soc_repo.transition_incident_state = AsyncMock(return_value={
+            "previous_state": "New",
+            "applied": True,
+            "incident": {"id": incident_id, "state": "Escalated", "severity": "critical", "correlation_id": correlation_id},
+        })
         
         # Setup Ticketing Mocks
         ticket_repo = MockTicketRepo.return_value
-        ticket_repo.get_by_incident_id = AsyncMock(return_value=None) # Not created yet
-        ticket_repo.create_ticket = AsyncMock()
+        ticket_repo.create_tickets_for_incidents = AsyncMock(return_value={
+            incident_id: {"id": "ticket-1", "incident_id": incident_id, "created": True}
+        })
         
         MockSocBus.publish = AsyncMock()
         MockTicketBus.publish = AsyncMock()
@@ -44,10 +49,10 @@ async def test_escalation_lifecycle():
         ticket_service = TicketService()
         
         # 2. Transition Incident (Simulating Escalation endpoint logic)
-        await soc_service.transition_incident(incident_id, "Escalated", "user-1")
+        transition = await soc_service.transition_incident(incident_id, "Escalated", "user-1")
         
-        # 3. Create Ticket
-        incident_data = await soc_service.get_incident(incident_id)
+        # 3. Create Ticket (incident row returned by the transition)
+        incident_data = transition["incident"]
         result = await ticket_service.create_ticket_from_incident(incident_data, correlation_id)
         
         # 4. Assertions
@@ -60,8 +65,8 @@ async def test_escalation_lifecycle():
         assert MockTicketBus.publish.call_count == 1
         
         # Verify Ticket Created with correct SLA
-        args, kwargs = ticket_repo.create_ticket.call_args
-        ticket_data = args[0]
+        (tickets,), _ = ticket_repo.create_tickets_for_incidents.call_args
+        ticket_data = tickets[0]
         assert ticket_data['incident_id'] == incident_id
         # Critical severity -> 4 hours SLA
         # assert ticket_data['sla_deadline'] > datetime.now ... (approximated)
@@ -71,11 +76,14 @@ async def test_escalation_idempotency():
     """Verify duplicate escalation does not create duplicate tickets"""
     with patch('src.ticketing.service.TicketRepository') as MockRepo:
         repo = MockRepo.return_value
-        repo.get_by_incident_id = AsyncMock(return_value={'id': 'existing-ticket'})
-        
-        service = TicketService()
-        result = await service.create_ticket_from_incident({'id': 'inc-1'}, 'corr')
+        with patch('src.ticketing.service.event_bus') as MockBus:
+            MockBus.publish = AsyncMock()
+            service = TicketService()
+            db_id = service._generate_uuid_from_string('inc-1')
+            # Lost the race (or redelivered): ON CONFLICT skipped the insert, the existing ticket is returned
+            repo.create_tickets_for_incidents = AsyncMock(return_value={db_id: {'id': 'existing-ticket', 'incident_id': db_id, 'created': False}})
+            result = await service.create_ticket_from_incident({'id': 'inc-1'}, 'corr')
         
         assert result['status'] == 'exists'
         assert result['ticket_id'] == 'existing-ticket'
-        repo.create_ticket.assert_not_called()
+        MockBus.publish.assert_not_called()
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.shared.pagination import (
+    InvalidCursorError, build_page, decode_cursor, encode_cursor, keyset_query,
+)
+from src.soc.repository import SocRepository
+
+
+CREATED = datetime(2026, 10, 19, 8, 30, 15, 123456, tzinfo=timezone.utc)
+ROW_ID = "6f1c8f5e-4a7c-4c39-9d0b-2f2c8a1d9e01"
+
+
+def test_cursor_round_trip_keeps_microseconds():
+    assert decode_cursor(encode_cursor(CREATED, ROW_ID)) == (CREATED, ROW_ID)
+
+
+def test_garbage_cursor_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_with_non_uuid_id_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(CREATED, "not-a-uuid"))
+
+
+def test_keyset_query_skips_empty_filters_and_seeks_past_cursor():
+    sql, args = keyset_query(
+        "tickets", ("id", "status", "created_at"), {"status": "Open", "incident_id": None},
+        encode_cursor(CREATED, ROW_ID), 25,
+    )
+
+    assert sql == (
+        "SELECT id, status, created_at FROM tickets "
+        "WHERE status = $1 AND (created_at, id) < ($2, $3) "
+        "ORDER BY created_at DESC, id DESC LIMIT $4"
+    )
+    assert args == ["Open", CREATED, ROW_ID, 26]
+
+
+def test_build_page_emits_cursor_only_when_more_rows_exist():
+    ids = [f"00000000-0000-0000-0000-{i:012d}" for i in range(3)]
+    rows = [{"id": row_id, "created_at": CREATED} for row_id in ids]
+
+    page = build_page(rows, 2, dict)
+    assert [r["id"] for r in page.items] == ids[:2]
+    assert decode_cursor(page.next_cursor) == (CREATED, ids[1])
+
+    assert build_page(rows, 3, dict).next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_incidents_uses_read_pool_with_projection():
+    pool = MagicMock()
+    pool.fetch = AsyncMock(return_value=[])
+
+    with patch("src.infrastructure.database.db.get_read_pool", AsyncMock(return_value=pool)):
+        page = await SocRepository().list_incidents(limit=10, state="New")
+
+    sql, *args = pool.fetch.call_args.args
+    assert "SELECT *" not in sql
+    assert "WHERE state = $1" in sql
+    assert args == ["New", 11]
+    assert page.items == [] and page.next_cursor is None
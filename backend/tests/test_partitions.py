@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.partitions import PartitionManager, next_bucket, partition_upper_bound
+from src.infrastructure.migrator import discover_migrations
+
+
+NOW = datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc)
+
+
+class FakeConn:
+    def __init__(self, partitions=None):
+        self.partitions = partitions or {}
+        self.executed = []
+        self.ensured = []
+
+    async def fetchval(self, sql, *args):
+        table, granularity, ts = args
+        self.ensured.append((table, ts))
+        return f"{table}_p{ts:%Y%m%d}" if granularity == "day" else f"{table}_p{ts:%Y%m}"
+
+    async def fetch(self, sql, *args):
+        return [{"relname": name} for name in self.partitions.get(args[0], [])]
+
+    async def execute(self, sql, *args):
+        self.executed.append(sql)
+
+
+def _pool_for(conn):
+    pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool.acquire.return_value = acquire
+    return pool
+
+
+def test_bucket_arithmetic():
+    assert next_bucket(NOW, "day") == datetime(2026, 10, 20, tzinfo=timezone.utc)
+    assert next_bucket(NOW, "month", 3) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert partition_upper_bound("audit_log_p202612", "month") == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert partition_upper_bound("asset_status_history_p20261019", "day") == datetime(2026, 10, 20, tzinfo=timezone.utc)
+    assert partition_upper_bound("audit_log_default", "month") is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_future_partitions_premakes_buckets():
+    conn = FakeConn()
+    manager = PartitionManager(_pool_for(conn), {"asset_status_history": {"granularity": "day", "premake": 2, "retention_days": 0}})
+
+    created = await manager.ensure_future_partitions(NOW)
+
+    assert created == [
+        "asset_status_history_p20261019",
+        "asset_status_history_p20261020",
+        "asset_status_history_p20261021",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_keeps_default_and_recent_partitions():
+    conn = FakeConn({
+        "audit_log": ["audit_log_default", "audit_log_p202608", "audit_log_p202609", "audit_log_p202610"],
+    })
+    manager = PartitionManager(_pool_for(conn), {"audit_log": {"granularity": "month", "premake": 0, "retention_days": 30}})
+
+    dropped = await manager.drop_expired(NOW)
+
+    # Cutoff is 2026-09-19: only partitions entirely before it are dropped
+    assert dropped == ["audit_log_p202608"]
+    assert conn.executed == ['DROP TABLE IF EXISTS "audit_log_p202608"']
+
+
+@pytest.mark.asyncio
+async def test_zero_retention_never_drops():
+    conn = FakeConn({"audit_log": ["audit_log_p200001"]})
+    manager = PartitionManager(_pool_for(conn), {"audit_log": {"granularity": "month", "premake": 0, "retention_days": 0}})
+
+    assert await manager.drop_expired(NOW) == []
+
+
+def test_partition_migration_is_transactional():
+    migration = next(m for m in discover_migrations() if m.name == "partition_history_tables")
+    assert migration.transactional
+    for table in ("asset_status_history", "incident_transitions", "audit_log"):
+        assert f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT" in migration.sql
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from src.fleet.live_state import LiveFleetState
+from src.fleet.repository import AssetRepository
+from src.fleet.positions import CHUNK_S, PositionStore, downsample, replay, replay_frames
+from src.fleet.service import FleetService, PositionHistoryUnavailableError
+
+
+T0 = 1_790_000_000.0 - (1_790_000_000 % CHUNK_S)  # hour-aligned
+
+
+def _fill(store, asset_id, start, seconds, hz=1):
+    for i in range(int(seconds * hz)):
+        ts = start + i / hz
+        store.append(asset_id, ts, x=float(i), y=float(i) * 2, speed=10.0)
+
+
+@pytest.mark.asyncio
+async def test_range_spans_disk_chunks_and_the_live_hour(tmp_path):
+    store = PositionStore(str(tmp_path))
+    _fill(store, "VEH-202", T0, 2.5 * CHUNK_S)  # two sealed hours + half of the third
+
+    # Rollovers never write on the event loop: sealed hours wait for the next flush
+    assert store._chunk_hours("VEH-202") == set()
+    for _ in range(2):
+        cols = store.range("VEH-202", T0 + 3590, T0 + 7210)
+        assert len(cols["ts"]) == 3620
+        assert cols["ts"][0] == T0 + 3590 and cols["ts"][-1] == T0 + 7209
+        assert np.all(np.diff(cols["ts"]) > 0)
+        await store.flush()
+    assert sorted(store._chunk_hours("VEH-202")) == [T0, T0 + CHUNK_S, T0 + 2 * CHUNK_S]
+
+
+@pytest.mark.asyncio
+async def test_rollover_during_a_slow_flush_keeps_the_complete_hour(tmp_path):
+    store = PositionStore(str(tmp_path))
+    _fill(store, "VEH-1", T0, 10)
+    release = threading.Event()
+    write_snapshot = store.write_snapshot
+
+    def slow_write(snapshot):
+        release.wait(5)
+        write_snapshot(snapshot)
+
+    store.write_snapshot = slow_write
+    flushing = asyncio.create_task(store.flush())
+    await asyncio.sleep(0.05)  # flush has taken its 10-sample snapshot and is writing
+    _fill(store, "VEH-1", T0 + 10, 10)
+    store.append("VEH-1", T0 + CHUNK_S, 0.0, 0.0)  # rollover seals the 20-sample hour
+    release.set()
+    await flushing
+    store.write_snapshot = write_snapshot
+    await store.flush()
+
+    reopened = PositionStore(str(tmp_path))
+    assert len(reopened.range("VEH-1", T0, T0 + CHUNK_S)["ts"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_flush_and_reopen_resume_the_same_hour(tmp_path, monkeypatch):
+    store = PositionStore(str(tmp_path))
+    _fill(store, "VEH-1", T0, 100)
+    await store.flush()
+
+    reopened = PositionStore(str(tmp_path))
+
+    def no_io(*args, **kwargs):
+        raise AssertionError("append touched the disk")
+
+    with monkeypatch.context() as m:
+        m.setattr("src.fleet.positions.os.listdir", no_io)
+        m.setattr("src.fleet.positions.np.load", no_io)
+        _fill(reopened, "VEH-1", T0 + 100, 50)
+    assert len(reopened.range("VEH-1", T0, T0 + CHUNK_S)["ts"]) == 150
+    await reopened.flush()  # the first write merges the chunk already on disk
+
+    assert len(PositionStore(str(tmp_path)).range("VEH-1", T0, T0 + CHUNK_S)["ts"]) == 150
+    assert list(tmp_path.joinpath("VEH-1").iterdir()) == [tmp_path / "VEH-1" / f"{int(T0)}.npz"]
+
+
+@pytest.mark.asyncio
+async def test_flush_skips_clean_hours_and_drops_ended_ones(tmp_path):
+    store = PositionStore(str(tmp_path))
+    now = datetime.now(timezone.utc).timestamp() // CHUNK_S * CHUNK_S  # current hour
+    _fill(store, "offline", T0, 10)
+    _fill(store, "live", now, 10)
+
+    assert await store.flush() == 2
+    assert store.assets() == ["live"]  # T0's hour has ended and is on disk
+    assert await store.flush() == 0
+    store.append("live", now + 10, 0.0, 0.0)
+    assert await store.flush() == 1
+    assert len(store.range("offline", T0, T0 + CHUNK_S)["ts"]) == 10
+
+
+def test_out_of_order_samples_are_sorted_and_late_hours_dropped(tmp_path):
+    store = PositionStore(str(tmp_path))
+    for ts in (T0 + 5, T0 + 1, T0 + 3):
+        store.append("a", ts, 0, 0)
+    store.append("a", T0 + CHUNK_S, 0, 0)
+    store.append("a", T0 + 10, 0, 0)  # previous hour, already sealed
+
+    assert store.range("a", T0, T0 + CHUNK_S)["ts"].tolist() == [T0 + 1, T0 + 3, T0 + 5]
+    assert store.dropped_late == 1
+
+
+def test_downsample_averages_per_bucket():
+    cols = {
+        "ts": np.array([0, 1, 2, 10, 11], dtype=np.float64),
+        "x": np.array([0, 2, 4, 10, 20], dtype=np.float32),
+        "y": np.zeros(5, dtype=np.float32),
+        "speed": np.ones(5, dtype=np.float32),
+    }
+    out = downsample(cols, 5)
+    assert out["ts"].tolist() == [0.0, 10.0]
+    assert out["x"].tolist() == [2.0, 15.0]
+
+
+def test_replay_frames_merge_assets_in_time_order():
+    def track(ts, x):
+        n = len(ts)
+        return {"ts": np.array(ts, dtype=np.float64), "x": np.array(x, dtype=np.float32),
+                "y": np.zeros(n, dtype=np.float32), "speed": np.zeros(n, dtype=np.float32)}
+
+    frames = list(replay_frames({"a": track([0.2, 1.5], [1, 2]), "b": track([0.7, 3.1], [5, 6])}, 0, 4))
+    assert [(start, sorted(p)) for start, p in frames] == [(0, ["a", "b"]), (1, ["a"]), (3, ["b"])]
+    assert frames[0][1]["b"][0] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_frames_at_speed(tmp_path, monkeypatch):
+    store = PositionStore(str(tmp_path))
+    _fill(store, "a", T0, 4)
+    sleeps = []
+
+    async def fake_sleep(s):
+        sleeps.append(s)
+
+    monkeypatch.setattr("src.fleet.positions.asyncio.sleep", fake_sleep)
+    frames = [f async for f in replay(store, ["a"], T0, T0 + 4, speed=4)]
+    assert len(frames) == 4
+    assert sleeps == [0.25, 0.25, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_telemetry_positions_are_recorded(tmp_path):
+    store = PositionStore(str(tmp_path))
+    live = LiveFleetState()
+    live.apply(AssetRepository()._generate_uuid_from_string("VEH-202"), asset_type="tug", name="Tug 202")
+    service = FleetService(telemetry=MagicMock(), live_state=live, positions=store)
+
+    await service.process_telemetry("fleet.asset_status_changed", {
+        "assetId": "VEH-202", "location": {"x": 550, "y": 350}, "speedKmh": 18,
+    })
+    await service.process_telemetry("fleet.asset_status_changed", {"assetId": "VEH-202", "status": "IDLE"})
+
+    now = datetime.now(timezone.utc)
+    track = await service.get_track("VEH-202", now - timedelta(minutes=1), now + timedelta(minutes=1))
+    assert [(p["x"], p["y"], p["speed_kmh"]) for p in track] == [(550.0, 350.0, 18.0)]
+
+
+@pytest.mark.asyncio
+async def test_track_without_store_is_unavailable():
+    service = FleetService(telemetry=MagicMock(), live_state=LiveFleetState(), positions=None)
+    now = datetime.now(timezone.utc)
+    with pytest.raises(PositionHistoryUnavailableError):
+        await service.get_track("VEH-202", now - timedelta(hours=1), now)
@@ -0,0 +1,92 @@
+import pytest
+import json
+from unittest.mock import AsyncMock, MagicMock
+from src.shared.rebuild import IncidentProjection, ReadModelRebuilder
+from src.shared.consumers import generate_uuid_from_string
+
+
+def _event(event_type, payload, ts="2026-01-01T10:00:00"):
+    return {"event_type": event_type, "timestamp": ts, "payload": json.dumps(payload)}
+
+
+class FakeConn:
+    def __init__(self):
+        self.executed = []
+        self.copied = []
+        self.execute = AsyncMock(side_effect=self._execute)
+        self.copy_records_to_table = AsyncMock(side_effect=self._copy)
+
+    async def _execute(self, sql, *args):
+        self.executed.append(" ".join(sql.split()))
+        return "INSERT 0 2" if "INSERT" in sql else "DELETE 0"
+
+    async def _copy(self, table, records, columns):
+        self.copied.extend(list(records))
+
+    def transaction(self):
+        tx = MagicMock()
+        tx.__aenter__ = AsyncMock(return_value=None)
+        tx.__aexit__ = AsyncMock(return_value=False)
+        return tx
+
+
+def _pool_for(conn):
+    pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool.acquire.return_value = acquire
+    return pool
+
+
+def test_projection_folds_created_and_state_changes():
+    projection = IncidentProjection()
+    projection.apply({"event_type": "incident.created", "payload": {"id": "inc-1", "type": "FIRE_ALARM", "severity": "critical"}})
+    projection.apply({"event_type": "incident.created", "payload": {"id": "inc-1", "type": "DUPLICATE"}})
+    projection.apply({"event_type": "incident.state_changed", "payload": {"incident_id": "inc-1", "to_state": "Triage"}})
+    projection.apply({"event_type": "incident.state_changed", "payload": {"incident_id": "unknown", "to_state": "Triage"}})
+    projection.apply({"event_type": "incident.created", "payload": {"type": "NO_ID"}})
+
+    row = projection.rows[generate_uuid_from_string("inc-1")]
+    assert row[1] == "FIRE_ALARM"
+    assert row[3] == "Triage"
+    assert row[5].tzinfo is not None
+    assert projection.skipped == 2
+
+
+@pytest.mark.asyncio
+async def test_rebuild_pages_with_exclusive_cursor_and_swaps():
+    pages = [
+        [("1-0", _event("incident.created", {"id": "a"})), ("2-0", _event("incident.created", {"id": "b"}))],
+        [("3-0", _event("incident.state_changed", {"incident_id": "a", "to_state": "Triage"}))],
+    ]
+    redis = AsyncMock()
+    redis.xrange = AsyncMock(side_effect=pages)
+    conn = FakeConn()
+
+    rebuilder = ReadModelRebuilder(redis_client=redis, pool=_pool_for(conn), page_size=2)
+    progress = []
+    stats = await rebuilder.run(on_progress=progress.append)
+
+    # Second page continues exclusively after the last id of the first
+    assert redis.xrange.call_args_list[1].kwargs["min"] == "(2-0"
+    assert stats["events"] == 3
+    assert stats["incidents"] == 2
+    assert stats["last_id"] == "3-0"
+    assert len(progress) == 2
+
+    assert len(conn.copied) == 2
+    assert any(sql.startswith("LOCK TABLE incidents") for sql in conn.executed)
+    assert conn.executed[-1].startswith("DROP TABLE IF EXISTS incidents_rebuild")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_dry_run_does_not_touch_db():
+    redis = AsyncMock()
+    redis.xrange = AsyncMock(return_value=[])
+    pool = MagicMock()
+
+    stats = await ReadModelRebuilder(redis_client=redis, pool=pool).run(dry_run=True)
+
+    assert stats["events"] == 0
+    pool.acquire.assert_not_called()
@@ -0,0 +1,103 @@
+import random
+import pytest
+from src.fleet.geofence import GeofenceIndex, Zone
+from src.fleet.live_state import LiveFleetState
+from src.fleet.routing import NoRouteError, RoadGraph, load_network
+from src.fleet.service import FleetService
+
+
+def _line_graph():
+    # a - b - c, plus a slow detour a - d - c; no zones -> default limit everywhere
+    nodes = {"a": (0, 0), "b": (100, 0), "c": (200, 0), "d": (100, 200)}
+    return RoadGraph(nodes, [("a", "b"), ("b", "c"), ("a", "d"), ("d", "c")],
+                     zones=GeofenceIndex([]), meters_per_unit=1.0, landmarks=2)
+
+
+def test_astar_matches_dijkstra_on_default_network():
+    network = load_network()
+    graph = RoadGraph(network["nodes"], network["edges"])
+    nodes = sorted(graph.positions)
+    rng = random.Random(5)
+    for _ in range(60):
+        source, target = rng.choice(nodes), rng.choice(nodes)
+        assert graph.route(source, target).seconds == pytest.approx(graph._dijkstra(source)[0][target])
+
+
+def test_zone_limits_set_edge_speed():
+    apron = Zone("APRON_TRANSFER_ZONE", [(0, -10), (300, -10), (300, 10), (0, 10)])
+    graph = RoadGraph({"a": (0, 0), "b": (100, 0)}, [("a", "b")], zones=GeofenceIndex([apron]), meters_per_unit=1.0)
+    assert graph.route("a", "b").seconds == pytest.approx(100 / (25 / 3.6))
+
+
+def test_closure_reroutes_and_only_drops_affected_cache_entries():
+    graph = _line_graph()
+    direct = graph.route("a", "c")
+    unaffected = graph.route("a", "b")
+    assert direct.nodes == ["a", "b", "c"]
+
+    assert graph.close_segment("c", "b")
+    assert graph.route("a", "b") is unaffected
+    detour = graph.route("a", "c")
+    assert detour.nodes == ["a", "d", "c"] and detour.seconds > direct.seconds
+
+    assert graph.reopen_segment("b", "c")
+    assert graph.route("a", "c").nodes == ["a", "b", "c"]
+
+
+def test_closure_of_unknown_segment_and_disconnection():
+    graph = _line_graph()
+    with pytest.raises(KeyError):
+        graph.close_segment("a", "c")
+    graph.close_segment("a", "b")
+    graph.close_segment("a", "d")
+    with pytest.raises(NoRouteError):
+        graph.route("a", "c")
+    assert graph.etas({"x": (0, 0), "y": (100, 0)}, 200, 0) == {"x": None, "y": pytest.approx(100 / (40 / 3.6))}
+
+
+def test_dispatch_ranked_by_eta_prefers_reachable_over_closer():
+    graph = _line_graph()
+    graph.close_segment("b", "c")
+    graph.close_segment("d", "c")
+    graph.close_segment("a", "d")
+    live = LiveFleetState()
+    live.apply("near", status="idle", x=100, y=0)  # b: cut off from c
+    live.apply("far", status="idle", x=200, y=300)  # snaps to d... also cut off
+    live.apply("on-site", status="idle", x=200, y=40)  # snaps to c
+    service = FleetService(live_state=live, roads=graph)
+
+    by_eta = service.nearest_available(200, 0, k=3, rank="eta")
+    assert [c["id"] for c in by_eta][0] == "on-site"
+    assert by_eta[0]["eta_s"] == pytest.approx(40 / (10 / 3.6), abs=0.1)
+    assert [c["eta_s"] for c in by_eta[1:]] == [None, None]
+    assert [c["id"] for c in service.nearest_available(200, 0, k=3)] == ["on-site", "near", "far"]
+
+
+def test_snap_far_from_the_network_is_bounded():
+    graph = _line_graph()
+    # Far outside the map: one pass over the nodes, not a ring walk out to the point
+    node, units = graph.snap(3e5, 3e5)
+    assert node == "d"
+    assert units == pytest.approx(((3e5 - 100) ** 2 + (3e5 - 200) ** 2) ** 0.5)
+
+
+def test_closure_endpoints():
+    from unittest.mock import patch
+    from fastapi.testclient import TestClient
+    from src.fleet.adapters.api import get_fleet_service
+
+    service = FleetService(live_state=LiveFleetState(), roads=_line_graph())
+    with patch("src.fleet.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_fleet_service] = lambda: service
+        try:
+            client = TestClient(app)
+            assert client.get("/fleet/routes", params={"from_x": 0, "from_y": 0, "to_x": 200, "to_y": 0}).json()["nodes"] == ["a", "b", "c"]
+            assert client.post("/fleet/routes/closures", json={"a": "b", "b": "c"}).json() == [{"a": "b", "b": "c"}]
+            assert client.post("/fleet/routes/closures", json={"a": "a", "b": "c"}).status_code == 404
+            rerouted = client.get("/fleet/routes", params={"from_x": 0, "from_y": 0, "to_x": 200, "to_y": 0}).json()
+            assert client.get("/fleet/routes", params={"from_x": 3e5, "from_y": 3e5, "to_x": 0, "to_y": 0}).status_code == 422
+            assert client.delete("/fleet/routes/closures/c/b").json() == []
+        finally:
+            app.dependency_overrides.pop(get_fleet_service, None)
+    assert rerouted["nodes"] == ["a", "d", "c"]
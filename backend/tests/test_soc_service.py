@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, patch
-from src.soc.service import SocService, InvalidTransitionError, ConcurrentModificationError, UnknownStateError
+from src.soc.service import SocService, InvalidTransitionError, ConcurrentModificationError, UnknownStateError, IncidentNotFoundError
 import uuid
 
 @pytest.mark.asyncio
@@ -10,8 +10,11 @@ async def test_transition_valid():
          patch('src.soc.service.event_bus') as MockBus:
         
         repo = MockRepo.return_value
-        repo.get_incident = AsyncMock(return_value={"id": "1", "state": "New", "correlation_id": "corr-123"})
-        repo.transition_incident_state_with_audit = AsyncMock(return_value=True)
+        repo.transition_incident_state = AsyncMock(return_value={
+            "previous_state": "New",
+            "applied": True,
+            "incident": {"id": "1", "state": "Triage", "correlation_id": "corr-123"},
+        })
         
         MockBus.publish = AsyncMock()
         
@@ -19,7 +22,9 @@ async def test_transition_valid():
         result = await service.transition_incident("1", "Triage", "user")
         
         assert result["status"] == "success"
-        repo.transition_incident_state_with_audit.assert_called_with("1", "New", "Triage", "user")
+        assert result["incident"]["state"] == "Triage"
+        repo.transition_incident_state.assert_called_once_with("1", "Triage", ["New"], "user")
+        repo.get_incident.assert_not_called()
         MockBus.publish.assert_called_once()
         
         # Verify envelope contents
@@ -32,7 +37,7 @@ async def test_transition_invalid():
     """Test invalid transition from New -> Resolved"""
     with patch('src.soc.service.SocRepository') as MockRepo:
         repo = MockRepo.return_value
-        repo.get_incident = AsyncMock(return_value={"id": "1", "state": "New"})
+        repo.transition_incident_state = AsyncMock(return_value={"previous_state": "New", "applied": False, "incident": None})
         
         service = SocService()
         
@@ -55,7 +60,7 @@ async def test_transition_current_state_unknown():
     with patch('src.soc.service.SocRepository') as MockRepo:
         repo = MockRepo.return_value
         # Simulate corrupt DB state
-        repo.get_incident = AsyncMock(return_value={"id": "1", "state": "CorruptState"})
+        repo.transition_incident_state = AsyncMock(return_value={"previous_state": "CorruptState", "applied": False, "incident": None})
         
         service = SocService()
         
@@ -78,25 +83,135 @@ async def test_transition_none_input():
 @pytest.mark.asyncio
 async def test_transition_idempotent():
     """Test idempotent transition Triage -> Triage"""
-    with patch('src.soc.service.SocRepository') as MockRepo:
+    with patch('src.soc.service.SocRepository') as MockRepo, \
+         patch('src.soc.service.event_bus') as MockBus:
         repo = MockRepo.return_value
-        repo.get_incident = AsyncMock(return_value={"id": "1", "state": "Triage"})
+        repo.transition_incident_state = AsyncMock(return_value={"previous_state": "Triage", "applied": False, "incident": None})
+        MockBus.publish = AsyncMock()
         
         service = SocService()
         result = await service.transition_incident("1", "Triage", "user")
         
         assert result["status"] == "success"
-        repo.transition_incident_state_with_audit.assert_not_called()
+        assert result["idempotent"]
+        MockBus.publish.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_transition_concurrency_failure():
     """Test that concurrent modification raises ConcurrentModificationError"""
     with patch('src.soc.service.SocRepository') as MockRepo:
         repo = MockRepo.return_value
-        repo.get_incident = AsyncMock(return_value={"id": "1", "state": "New"})
-        repo.transition_incident_state_with_audit = AsyncMock(return_value=False) # Update Failed
+        # Triage is reachable from New, yet the CAS did not apply
+        repo.transition_incident_state = AsyncMock(return_value={"previous_state": "New", "applied": False, "incident": None})
         
         service = SocService()
         
         with pytest.raises(ConcurrentModificationError):
             await service.transition_incident("1", "Triage", "user")
+
+@pytest.mark.asyncio
+async def test_transition_not_found():
+    """Missing incident: the single statement returns no row"""
+    with patch('src.soc.service.SocRepository') as MockRepo:
+        repo = MockRepo.return_value
+        repo.transition_incident_state = AsyncMock(return_value=None)
+
+        with pytest.raises(IncidentNotFoundError):
+            await SocService().transition_incident("1", "Triage", "user")
+
+def test_allowed_from_is_derived_from_state_machine():
+    service = SocService()
+    assert service.allowed_from("Escalated") == ["New", "Triage", "EvidenceAttached", "Dispatched", "Resolved"]
+    assert service.allowed_from("Resolved") == ["Dispatched", "Escalated"]
+
+@pytest.mark.asyncio
+async def test_bulk_transition_classifies_each_incident():
+    with patch('src.soc.service.SocRepository') as MockRepo, \
+         patch('src.soc.service.event_bus') as MockBus:
+        service = SocService()
+        repo = MockRepo.return_value
+        repo._generate_uuid_from_string = lambda val: f"db-{val}"
+        repo.transition_incidents_state = AsyncMock(return_value={
+            "db-a": {"previous_state": "New", "applied": True, "incident": {"id": "db-a", "state": "Escalated", "correlation_id": "corr-a"}},
+            "db-b": {"previous_state": "Escalated", "applied": False, "incident": {"id": "db-b", "state": "Escalated"}},
+            "db-c": {"previous_state": "Closed", "applied": False, "incident": {"id": "db-c", "state": "Closed"}},
+        })
+        MockBus.publish_batch = AsyncMock()
+
+        results = await service.transition_incidents(["a", "b", "c", "d", "a"], "Escalated", "supervisor")
+
+        assert [r["status"] for r in results] == ["transitioned", "unchanged", "invalid_transition", "not_found", "duplicate"]
+        repo.transition_incidents_state.assert_awaited_once_with(
+            ["a", "b", "c", "d", "a"], "Escalated", service.allowed_from("Escalated"), "supervisor"
+        )
+        (events,), _ = MockBus.publish_batch.call_args
+        assert [e["entity_refs"] for e in events] == [{"incidentId": "a"}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_per_item_transitions_validate_then_apply_once():
+    with patch('src.soc.service.SocRepository') as MockRepo, \
+         patch('src.soc.service.event_bus') as MockBus:
+        service = SocService()
+        repo = MockRepo.return_value
+        repo._generate_uuid_from_string = lambda val: f"db-{val}"
+
+        def row(previous, state, applied):
+            return {"previous_state": previous, "applied": applied, "incident": {"id": "x", "state": state, "correlation_id": "corr"}}
+
+        repo.transition_incidents_each = AsyncMock(return_value={
+            "db-a": row("Resolved", "Closed", True),
+            "db-b": row("Closed", "Closed", False),
+            "db-c": row("Dispatched", "Dispatched", False),
+            "db-d": row("Triage", "Triage", False),
+        })
+        MockBus.publish_batch = AsyncMock()
+
+        results = await service.transition_incidents_bulk([
+            {"incident_id": "a", "to_state": "Closed", "expected_state": "Resolved"},
+            {"incident_id": "b", "to_state": "Closed"},
+            {"incident_id": "c", "to_state": "Closed", "expected_state": "Resolved"},  # moved meanwhile
+            {"incident_id": "d", "to_state": "Closed"},  # Triage cannot close
+            {"incident_id": "e", "to_state": "Closed"},
+            {"incident_id": "f", "to_state": "Archived"},
+            {"incident_id": "g", "to_state": "Closed", "expected_state": "New"},
+            {"incident_id": "a", "to_state": "Closed"},
+        ], "shift-lead")
+
+        assert [r["status"] for r in results] == [
+            "success", "unchanged", "conflict", "invalid", "not_found", "invalid", "invalid", "duplicate",
+        ]
+        assert (results[0]["from_state"], results[0]["state"]) == ("Resolved", "Closed")
+        (transitions, edges, triggered_by), _ = repo.transition_incidents_each.call_args
+        # Items rejected by the state machine never reach the statement
+        assert [t[0] for t in transitions] == ["a", "b", "c", "d", "e"]
+        assert ("Resolved", "Closed") in edges and ("Triage", "Closed") not in edges
+        (events,), _ = MockBus.publish_batch.call_args
+        assert [e["payload"]["incident_id"] for e in events] == ["a"]
+
+
+def test_bulk_transition_endpoint_reports_each_item():
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.soc.adapters.api import get_soc_service
+
+    good = str(uuid.uuid4())
+    service = SocService()
+    service.transition_incidents_bulk = AsyncMock(return_value=[
+        {"incident_id": good, "status": "success", "from_state": "Resolved", "state": "Closed", "error": None},
+    ])
+    app.dependency_overrides[get_soc_service] = lambda: service
+    try:
+        response = TestClient(app).post("/incidents/transition", json={
+            "triggered_by": "shift-lead",
+            "transitions": [{"incident_id": "nope", "to_state": "Closed"}, {"incident_id": good, "to_state": "Closed"}],
+        })
+    finally:
+        app.dependency_overrides.pop(get_soc_service, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["transitioned"] == 1
+    assert [r["status"] for r in body["results"]] == ["invalid", "success"]
+    (transitions, _), _ = service.transition_incidents_bulk.call_args
+    assert [t["incident_id"] for t in transitions] == [good]
@@ -0,0 +1,90 @@
+import math
+import random
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from src.fleet.live_state import LiveFleetState
+from src.fleet.spatial import SpatialIndex
+from src.fleet.service import FleetService
+from src.fleet.adapters.api import get_fleet_service
+
+
+def _brute_force(points, x, y, k, keep=lambda key: True):
+    ranked = sorted((math.hypot(px - x, py - y), key) for key, (px, py) in points.items() if keep(key))
+    return ranked[:k]
+
+
+def test_nearest_matches_brute_force_after_moves():
+    rng = random.Random(3)
+    index = SpatialIndex(cell_size=40)
+    points = {}
+    for i in range(2000):
+        points[f"a{i}"] = (rng.uniform(0, 800), rng.uniform(0, 600))
+        index.update(f"a{i}", *points[f"a{i}"])
+    for i in range(0, 2000, 3):  # move a third of them, many across cells
+        points[f"a{i}"] = (rng.uniform(0, 800), rng.uniform(0, 600))
+        index.update(f"a{i}", *points[f"a{i}"])
+    index.remove("a1")
+    del points["a1"]
+
+    for _ in range(50):
+        x, y = rng.uniform(-100, 900), rng.uniform(-100, 700)
+        assert index.nearest(x, y, 7) == _brute_force(points, x, y, 7)
+        even = lambda key: int(key[1:]) % 2 == 0
+        assert index.nearest(x, y, 3, even) == _brute_force(points, x, y, 3, even)
+
+
+def test_nearest_respects_max_distance_and_small_sets():
+    index = SpatialIndex()
+    index.update("a", 0, 0)
+    index.update("b", 300, 0)
+    assert [key for _, key in index.nearest(10, 0, 5)] == ["a", "b"]
+    assert [key for _, key in index.nearest(10, 0, 5, max_distance=100)] == ["a"]
+    assert SpatialIndex().nearest(0, 0, 3) == []
+
+
+def test_far_or_sparse_points_fall_back_to_one_scan():
+    index = SpatialIndex()
+    points = {"a": (10.0, 10.0), "b": (700.0, 500.0), "far": (50_000.0, 50_000.0)}
+    for key, (x, y) in points.items():
+        index.update(key, x, y)
+
+    # Ring-by-ring this would walk ~1000 rings of empty cells
+    for x, y in ((100.0, 100.0), (49_000.0, 50_000.0), (-30_000.0, 5.0)):
+        assert index.nearest(x, y, 5) == _brute_force(points, x, y, 5)
+    assert index.nearest(100, 100, 5, max_distance=1000) == _brute_force(points, 100, 100, 2)
+
+
+def test_live_state_keeps_index_current_and_filters():
+    state = LiveFleetState()
+    state.apply("bus-1", status="idle", x=100, y=100, asset_type="bus")
+    state.apply("van-1", status="IN_SERVICE", x=110, y=100, asset_type="VEHICLE")
+    state.apply("bus-2", status="maintenance", x=101, y=100, asset_type="bus")
+    state.apply("bus-1", x=500, y=500)  # moved away
+    state.apply("nowhere", status="idle")  # no position yet, not indexed
+
+    hits = state.nearest(100, 100, 5, statuses=["idle", "in_service"])
+    assert [(round(d), s.asset_id) for d, s in hits] == [(10, "van-1"), (566, "bus-1")]
+    assert [s.asset_id for _, s in state.nearest(100, 100, 5, asset_types=["BUS"])] == ["bus-2", "bus-1"]
+
+
+def test_dispatch_endpoint_ranks_available_assets():
+    live = LiveFleetState()
+    live.apply("a", status="idle", x=10, y=10, asset_type="bus")
+    live.apply("b", status="idle", x=50, y=10, asset_type="bus")
+    live.apply("c", status="offline", x=11, y=10, asset_type="bus")
+    service = FleetService(live_state=live)
+
+    with patch("src.fleet.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_fleet_service] = lambda: service
+        try:
+            client = TestClient(app)
+            resp = client.get("/fleet/dispatch/nearest", params={"x": 0, "y": 10, "k": 2})
+            out_of_map = client.get("/fleet/dispatch/nearest", params={"x": 1e9, "y": 10})
+        finally:
+            app.dependency_overrides.pop(get_fleet_service, None)
+
+    assert resp.status_code == 200
+    assert [(c["id"], c["distance"]) for c in resp.json()] == [("a", 10.0), ("b", 50.0)]
+    assert out_of_map.status_code == 422
@@ -0,0 +1,92 @@
+import pytest
+import asyncpg
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.statements import StatementRegistry
+
+
+class FakeStatement:
+    def __init__(self, sql):
+        self.sql = sql
+        self.fetchrow = AsyncMock(return_value={"id": "1"})
+        self.fetch = AsyncMock(return_value=[])
+        self.get_statusmsg = MagicMock(return_value="UPDATE 1")
+
+
+class FakeConnection:
+    def __init__(self, fail_on=None):
+        self._prepared_statements = {}
+        self.prepared = []
+        self.fail_on = fail_on or set()
+
+    async def prepare(self, sql):
+        if sql in self.fail_on:
+            raise asyncpg.exceptions.UndefinedTableError("missing")
+        self.prepared.append(sql)
+        return FakeStatement(sql)
+
+
+def test_register_rejects_conflicting_sql():
+    registry = StatementRegistry()
+    registry.register("a", "SELECT 1")
+    registry.register("a", "SELECT 1")  # Idempotent
+    with pytest.raises(ValueError):
+        registry.register("a", "SELECT 2")
+
+
+@pytest.mark.asyncio
+async def test_prepare_all_on_connect_defers_failures():
+    registry = StatementRegistry()
+    registry.register("ok", "SELECT 1")
+    registry.register("later", "SELECT * FROM missing")
+    conn = FakeConnection(fail_on={"SELECT * FROM missing"})
+
+    await registry.prepare_all(conn)
+
+    assert set(conn._prepared_statements) == {"ok"}
+
+    # Deferred statement is prepared lazily on first use
+    conn.fail_on = set()
+    await registry.fetchrow(conn, "later")
+    assert "later" in conn._prepared_statements
+
+
+@pytest.mark.asyncio
+async def test_execution_reuses_prepared_statement_and_records_stats():
+    registry = StatementRegistry()
+    registry.register("touch", "UPDATE assets SET last_heartbeat = NOW() WHERE id = $1")
+    conn = FakeConnection()
+    await registry.prepare_all(conn)
+
+    assert await registry.execute(conn, "touch", "id-1") == "UPDATE 1"
+    assert await registry.execute(conn, "touch", "id-2") == "UPDATE 1"
+
+    assert len(conn.prepared) == 1
+    stats = registry.stats()["touch"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_statement_is_reprepared_once():
+    registry = StatementRegistry()
+    registry.register("get", "SELECT * FROM incidents WHERE id = $1")
+    conn = FakeConnection()
+    await registry.prepare_all(conn)
+    stale = conn._prepared_statements["get"]
+    stale.fetchrow.side_effect = asyncpg.exceptions.InvalidCachedStatementError("stale")
+
+    row = await registry.fetchrow(conn, "get", "id-1")
+
+    assert row == {"id": "1"}
+    assert conn._prepared_statements["get"] is not stale
+
+
+@pytest.mark.asyncio
+async def test_plain_connection_falls_back_to_sql():
+    registry = StatementRegistry()
+    registry.register("get", "SELECT 1")
+    conn = AsyncMock()
+    conn.fetchval.return_value = 1
+
+    assert await registry.fetchval(conn, "get") == 1
+    conn.fetchval.assert_called_once_with("SELECT 1")
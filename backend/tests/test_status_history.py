@@ -0,0 +1,130 @@
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from src.fleet.status_history import (
+    COMPACT_SQL, DELETE_COMPACTED_SQL, WATERMARK_NAME, StatusHistoryCompactor, compaction_cutoff, status_summary,
+)
+from src.fleet.service import FleetService
+from src.fleet.adapters.api import get_fleet_service
+from src.infrastructure.migrator import discover_migrations
+
+
+NOW = datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc)
+CUTOFF = datetime(2026, 10, 12, tzinfo=timezone.utc)
+
+
+class FakeConn:
+    def __init__(self, watermark=None, locked=False, partitions=()):
+        self.watermark = watermark
+        self.locked = locked
+        self.partitions = list(partitions)
+        self.executed = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchval(self, sql, *args):
+        if "pg_try_advisory_xact_lock" in sql:
+            return not self.locked
+        return self.watermark
+
+    async def fetch(self, sql, *args):
+        return [{"relname": name} for name in self.partitions]
+
+    async def execute(self, sql, *args):
+        self.executed.append((sql, args))
+        if "rollup_watermarks" in sql:
+            self.watermark = args[1]
+
+
+def _pool_for(conn):
+    pool = MagicMock()
+    acquire = MagicMock()
+    acquire.__aenter__ = AsyncMock(return_value=conn)
+    acquire.__aexit__ = AsyncMock(return_value=False)
+    pool.acquire.return_value = acquire
+    return pool
+
+
+def test_cutoff_is_a_whole_utc_day():
+    assert compaction_cutoff(NOW, 7) == CUTOFF
+
+
+@pytest.mark.asyncio
+async def test_first_run_compacts_everything_before_cutoff_and_drops_partitions():
+    conn = FakeConn(partitions=[
+        "asset_status_history_default",
+        "asset_status_history_p20261010",
+        "asset_status_history_p20261011",  # upper bound == cutoff: fully compacted
+        "asset_status_history_p20261012",
+    ])
+    result = await StatusHistoryCompactor(_pool_for(conn), raw_days=7).run(NOW)
+
+    assert (COMPACT_SQL, (datetime(1970, 1, 1, tzinfo=timezone.utc), CUTOFF)) in conn.executed
+    assert conn.watermark == CUTOFF
+    assert result["dropped"] == ["asset_status_history_p20261010", "asset_status_history_p20261011"]
+    assert conn.executed[-1] == (DELETE_COMPACTED_SQL, (CUTOFF,))
+
+
+@pytest.mark.asyncio
+async def test_compaction_skips_when_caught_up_or_locked():
+    caught_up = FakeConn(watermark=CUTOFF)
+    result = await StatusHistoryCompactor(_pool_for(caught_up), raw_days=7).run(NOW)
+    assert result["compacted_from"] is None
+    assert all(sql != COMPACT_SQL for sql, _ in caught_up.executed)
+
+    locked = FakeConn(locked=True)
+    await StatusHistoryCompactor(_pool_for(locked), raw_days=7).run(NOW)
+    assert all(sql != COMPACT_SQL for sql, _ in locked.executed)
+
+
+def test_compaction_closes_open_runs_and_collapses_repeats():
+    assert "status IS DISTINCT FROM LAG(status)" in COMPACT_SQL
+    assert "WHERE r.carried AND r.ended_at IS NOT NULL" in COMPACT_SQL
+    assert f"'{WATERMARK_NAME}'" not in COMPACT_SQL  # window comes from parameters
+
+
+def test_status_summary_uptime_and_utilisation():
+    rows = [
+        {"asset_id": "a", "status": "IN_SERVICE", "seconds": 600.0},
+        {"asset_id": "a", "status": "idle", "seconds": 200.0},
+        {"asset_id": "a", "status": "maintenance", "seconds": 200.0},
+        {"asset_id": "b", "status": "idle", "seconds": 1000.0},
+    ]
+    summary = status_summary(rows)
+    a, b = summary["assets"]
+    assert (a["uptime_pct"], a["utilisation_pct"]) == (80.0, 75.0)
+    assert (b["uptime_pct"], b["utilisation_pct"]) == (100.0, 0.0)
+    assert summary["fleet"] == {"observed_s": 2000.0, "uptime_pct": 90.0, "utilisation_pct": 33.33, "assets": 2}
+    assert status_summary([])["fleet"]["uptime_pct"] == 100.0
+
+
+def test_intervals_migration_is_discovered():
+    assert any((m.version, m.name) == (8, "asset_status_intervals") for m in discover_migrations())
+
+
+def test_uptime_endpoint_uses_status_seconds():
+    repository = MagicMock()
+    repository.get_status_seconds = AsyncMock(return_value=[
+        {"asset_id": "a", "status": "active", "seconds": 3000.0},
+        {"asset_id": "a", "status": "offline", "seconds": 600.0},
+    ])
+    service = FleetService(repository=repository)
+
+    with patch("src.fleet.adapters.api.is_demo_mode", return_value=False):
+        from src.main import app
+        app.dependency_overrides[get_fleet_service] = lambda: service
+        try:
+            resp = TestClient(app).get("/fleet/uptime", params={"hours": 1})
+        finally:
+            app.dependency_overrides.pop(get_fleet_service, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["fleet"]["uptime_pct"] == 83.33
+    assert body["assets"][0]["seconds"] == {"active": 3000.0, "offline": 600.0}
+    since, until = repository.get_status_seconds.call_args.args
+    assert (until - since).total_seconds() == 3600
@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.fleet.repository import AssetRepository, APPLY_TELEMETRY
+from src.fleet.service import FleetService
+from src.fleet.telemetry import TelemetryCoalescer
+from src.fleet.live_state import LiveFleetState
+
+
+T1 = datetime(2026, 10, 19, 8, 0, 0, tzinfo=timezone.utc)
+T2 = datetime(2026, 10, 19, 8, 0, 1, tzinfo=timezone.utc)
+
+
+def test_last_write_wins_per_field():
+    coalescer = TelemetryCoalescer(repository=MagicMock())
+    coalescer.submit("VEH-1", status="moving", x=1.0, y=2.0, zone_id="Z1", reported_at=T1)
+    coalescer.submit("VEH-1", x=5.0, y=6.0, reported_at=T2)
+    coalescer.submit("VEH-2", status="idle", reported_at=T2)
+
+    assert coalescer.pending == 2
+    assert coalescer._pending["VEH-1"] == {"status": "moving", "x": 5.0, "y": 6.0, "zone_id": "Z1", "reported_at": T2}
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_one_bulk_statement():
+    repo = MagicMock()
+    repo.apply_telemetry = AsyncMock(return_value=1)
+    coalescer = TelemetryCoalescer(repository=repo)
+    for i in range(100):
+        coalescer.submit("VEH-1", x=float(i), reported_at=T1)
+
+    assert await coalescer.flush() == 1
+    repo.apply_telemetry.assert_awaited_once()
+    assert repo.apply_telemetry.await_args.args[0]["VEH-1"]["x"] == 99.0
+    assert coalescer.pending == 0
+    assert await coalescer.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_under_newer_updates():
+    repo = MagicMock()
+    coalescer = TelemetryCoalescer(repository=repo)
+    coalescer.submit("VEH-1", status="moving", x=1.0, reported_at=T1)
+
+    async def fail(batch):
+        coalescer.submit("VEH-1", x=2.0, reported_at=T2)
+        raise ConnectionError("db down")
+
+    repo.apply_telemetry = fail
+    with pytest.raises(ConnectionError):
+        await coalescer.flush()
+
+    assert coalescer._pending["VEH-1"] == {"status": "moving", "x": 2.0, "reported_at": T2}
+
+
+@pytest.mark.asyncio
+async def test_stop_lets_an_in_flight_flush_finish():
+    repo = MagicMock()
+    written = []
+    started = asyncio.Event()
+
+    async def slow(batch):
+        started.set()
+        await asyncio.sleep(0.05)
+        written.append(batch)
+        return len(batch)
+
+    repo.apply_telemetry = slow
+    coalescer = TelemetryCoalescer(repository=repo, flush_interval_s=0.01)
+    coalescer.submit("VEH-1", x=1.0, reported_at=T1)
+    await coalescer.start()
+    await started.wait()
+    await coalescer.stop()
+
+    assert written == [{"VEH-1": {"x": 1.0, "reported_at": T1}}]
+    assert coalescer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_requeues_the_batch():
+    repo = MagicMock()
+    started = asyncio.Event()
+
+    async def hang(batch):
+        started.set()
+        await asyncio.sleep(10)
+
+    repo.apply_telemetry = hang
+    coalescer = TelemetryCoalescer(repository=repo)
+    coalescer.submit("VEH-1", x=1.0, reported_at=T1)
+    task = asyncio.create_task(coalescer.flush())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert coalescer._pending["VEH-1"] == {"x": 1.0, "reported_at": T1}
+
+
+@pytest.mark.asyncio
+async def test_apply_telemetry_passes_columns_in_statement_order():
+    repo = AssetRepository()
+    with patch("src.infrastructure.database.db.get_pool", AsyncMock(return_value=MagicMock())), \
+         patch("src.fleet.repository.statements.execute", AsyncMock(return_value="INSERT 0 1")) as execute:
+        changed = await repo.apply_telemetry({"VEH-1": {"x": 3.0, "y": 4.0, "reported_at": T1}})
+
+    assert changed == 1
+    _, name, ids, statuses, xs, ys, zones, drivers, reported = execute.await_args.args
+    assert name == APPLY_TELEMETRY
+    assert ids == [repo._generate_uuid_from_string("VEH-1")]
+    assert (statuses, xs, ys, zones, drivers, reported) == ([None], [3.0], [4.0], [None], [None], [T1])
+
+
+@pytest.mark.asyncio
+async def test_process_telemetry_buffers_without_db():
+    coalescer = TelemetryCoalescer(repository=MagicMock())
+    service = FleetService(repository=AssetRepository(), telemetry=coalescer, live_state=LiveFleetState())
+    service.live_state.apply(AssetRepository()._generate_uuid_from_string("VEH-303"), name="Tug 303")
+
+    await service.process_telemetry("fleet.asset_status_changed", {
+        "assetId": "VEH-303", "status": "EN_ROUTE", "zoneId": "Z-LANDSIDE",
+        "location": {"x": 410, "y": 480}, "driverName": "Khalid",
+    })
+    await service.process_telemetry("fleet.asset_status_changed", {"status": "OK"})
+
+    entry = coalescer._pending["VEH-303"]
+    assert (entry["status"], entry["x"], entry["y"], entry["driver_name"]) == ("EN_ROUTE", 410.0, 480.0, "Khalid")
+    assert coalescer.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_robot_patrol_started_is_keyed_by_robot_id():
+    coalescer = TelemetryCoalescer(repository=MagicMock())
+    service = FleetService(repository=AssetRepository(), telemetry=coalescer, live_state=LiveFleetState())
+
+    service.live_state.apply(AssetRepository()._generate_uuid_from_string("ROB-01"), asset_type="robot", name="Patrol 1")
+
+    await service.process_telemetry("fleet.robot_patrol_started", {"robotId": "ROB-01", "zoneId": "AIRSIDE_PERIMETER"})
+
+    assert coalescer._pending["ROB-01"]["zone_id"] == "AIRSIDE_PERIMETER"
+
+
+@pytest.mark.asyncio
+async def test_telemetry_for_unregistered_asset_is_ignored():
+    coalescer = TelemetryCoalescer(repository=MagicMock())
+    service = FleetService(repository=AssetRepository(), telemetry=coalescer, live_state=LiveFleetState())
+
+    await service.process_telemetry("fleet.asset_status_changed", {"assetId": "VEH-999", "location": {"x": 1, "y": 2}})
+
+    assert len(service.live_state) == 0 and coalescer.pending == 0
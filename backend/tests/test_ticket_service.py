@@ -10,11 +10,9 @@ async def test_create_ticket_sla_critical():
          patch('src.ticketing.service.event_bus') as MockBus:
         
         repo = MockRepo.return_value
-        # Mock create_ticket side effect to populate ID if needed, 
-        # but pure check of call args is enough.
         mock_repo = repo
-        repo.get_by_incident_id = AsyncMock(return_value=None)
-        repo.create_ticket = AsyncMock()
+        db_id = TicketService()._generate_uuid_from_string("inc-1")
+        repo.create_tickets_for_incidents = AsyncMock(return_value={db_id: {"id": "t-1", "incident_id": db_id, "created": True}})
         MockBus.publish = AsyncMock()
         
         service = TicketService()
@@ -27,7 +25,7 @@ async def test_create_ticket_sla_critical():
         event_args = MockBus.publish.call_args[1]
         
         # Entity Refs
-        assert event_args['entity_refs']['ticketId'] is not None
+        assert event_args['entity_refs']['ticketId'] == "t-1"
         assert event_args['entity_refs']['incidentId'] == "inc-1"
         assert event_args['entity_refs']['incidentDbId'] == service._generate_uuid_from_string("inc-1")
         
@@ -37,8 +35,8 @@ async def test_create_ticket_sla_critical():
         assert event_args['payload']['status'] == "Open"
         
         # Validate Repo Call
-        repo_args, _ = mock_repo.create_ticket.call_args
-        ticket_data = repo_args[0]
+        (tickets,), _ = mock_repo.create_tickets_for_incidents.call_args
+        [ticket_data] = tickets
         
         # Check DB ID
         expected_db_id = service._generate_uuid_from_string("inc-1")
@@ -88,3 +86,35 @@ async def test_concurrent_modification():
         service = TicketService()
         with pytest.raises(ConcurrentModificationError):
             await service.transition_ticket("t-1", "InProgress", "u-1", "c-1")
+
+@pytest.mark.asyncio
+async def test_create_tickets_from_incidents_is_set_based():
+    """Bulk escalation: one repository call, one event batch, created vs existing per incident"""
+    with patch('src.ticketing.service.TicketRepository') as MockRepo, \
+         patch('src.ticketing.service.event_bus') as MockBus:
+        service = TicketService()
+        db_1 = service._generate_uuid_from_string("inc-1")
+        db_2 = service._generate_uuid_from_string("inc-2")
+
+        repo = MockRepo.return_value
+        repo.create_tickets_for_incidents = AsyncMock(return_value={
+            db_1: {"id": "t-1", "incident_id": db_1, "status": "Open", "created": True},
+            db_2: {"id": "t-old", "incident_id": db_2, "status": "InProgress", "created": False},
+        })
+        MockBus.publish_batch = AsyncMock()
+
+        results = await service.create_tickets_from_incidents([
+            {"id": "inc-1", "severity": "critical", "correlation_id": "corr-1"},
+            {"id": "inc-2", "severity": "info"},
+        ])
+
+        assert [(r["status"], r["ticket_id"]) for r in results] == [("created", "t-1"), ("exists", "t-old")]
+
+        (tickets,), _ = repo.create_tickets_for_incidents.call_args
+        assert [t["incident_id"] for t in tickets] == [db_1, db_2]
+        assert tickets[1]["sla_deadline"] - tickets[0]["sla_deadline"] == datetime.timedelta(hours=68)
+
+        (events,), _ = MockBus.publish_batch.call_args
+        assert len(events) == 1
+        assert events[0]["event_type"] == "ticket.created"
+        assert events[0]["correlation_id"] == "corr-1"